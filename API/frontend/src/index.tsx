@@ -283,6 +283,7 @@ async function onRender(event: Event): Promise<void> {
       case "storeImage":
         const storeImageResult = await storeImage(image, filename);
         Streamlit.setComponentValue(storeImageResult);
+        break;
       case "addCardWithImage":
         const response = await addFlashcardWithImage(deck, image, front, back, tags);
         Streamlit.setComponentValue(response)
@@ -1,24 +1,40 @@
 # actions.py
 # -*- coding: utf-8 -*-
-import base64
 import json
 import os
 import fitz  # PyMuPDF
 from PIL import Image
 from io import BytesIO
-import re
 import uuid
 import hashlib
+import time
 import streamlit as st
 import streamlit.components.v1 as components
 import markdown
-from mistral_config import create_mistral_client, create_chat_message, make_api_request
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from language_detect import detect_language
+from metrics import metrics
+from prompts import BEHAVIOUR, flashcard_prompt, pack_pages, packed_text, split_text
+from response_cache import ResponseCache
+from response_parser import FlashcardParser, parse_flashcards, parse_title_pages
+from session_store import get_document
+import anki_export
+from anki_connect import AnkiConnectError, get_client as get_anki_client
+from anki_export import ANKI_CONNECT_URL
+import mistral_config
+from mistral_config import get_mistral_client, create_chat_message, chat
 
 # Custom component to call AnkiConnect on client side
 parent_dir = os.path.dirname(os.path.abspath(__file__))
 build_dir = os.path.join(parent_dir, "API/frontend/build")
 _API = components.declare_component("API", path=build_dir)
 
+MODEL = "mistral-large-latest"
+TEMPERATURE = 0.8
+
+# Shared by every session so re-uploads of the same slides are free
+response_cache = ResponseCache()
+
 def API(action, key=None, deck=None, image=None, front=None, back=None, tags=None, flashcards=None,
         filename=None):
     component_value = _API(action=action, key=key, deck=deck, image=image, front=front, back=back, tags=tags,
@@ -26,193 +42,368 @@ def API(action, key=None, deck=None, image=None, front=None, back=None, tags=Non
     return component_value
 
 class Actions:
-    def __init__(self, root):
+    def __init__(self, root, cache=None):
         self.root = root
+        self.cache = response_cache if cache is None else cache
+
+    def server_anki(self):
+        """The pooled AnkiConnect client when Anki is reached from the server, None for the browser component."""
+        if st.session_state.get("anki_backend") == "Server":
+            return get_anki_client(st.session_state.get("anki_url", ANKI_CONNECT_URL))
+        return None
 
     def check_API(self, key=None):
-        response = API(action="reqPerm", key=key)
+        client = self.server_anki()
+        if client is not None:
+            try:
+                response = client.request_permission()
+                client.ensure_model()
+            except AnkiConnectError:
+                response = False
+        else:
+            response = API(action="reqPerm", key=key)
         if response is not False and response is not None:
             st.session_state['api_perms'] = response
 
     def get_decks(self, key=None):
-        decks = API(action="getDecks", key=key)
+        client = self.server_anki()
+        if client is not None:
+            try:
+                decks = client.get_decks()
+            except AnkiConnectError:
+                decks = False
+        else:
+            decks = API(action="getDecks", key=key)
         if decks is not False and decks is not None:
             st.session_state['decks'] = decks
 
-    @make_api_request
-    def get_lang(self, text):
+    def get_client(self):
+        # Enough keep-alive connections for the parallel requests chosen in the sidebar
+        pool_size = st.session_state.get("max_workers")
         if st.session_state['API_KEY'] == "":
-            client = create_mistral_client(st.secrets['MISTRAL_API_KEY'])
-        else:
-            client = create_mistral_client(st.session_state['API_KEY'])
+            return get_mistral_client(st.secrets['MISTRAL_API_KEY'], pool_size=pool_size)
+        return get_mistral_client(st.session_state['API_KEY'], pool_size=pool_size)
+
+    def get_lang(self, text, languages=None, threshold=0.8, ask_model=True):
+        """
+        Language of the text, detected locally; the model is only asked when the local
+        guess is less confident than threshold, and never without ask_model, which
+        returns None instead. languages limits the answer to the languages offered in
+        the sidebar.
+        """
+        lang, confidence = detect_language(text, languages)
+        if lang is not None and confidence >= threshold:
+            return lang
+        if not ask_model:
+            return None
 
         try:
+            client = self.get_client()
             messages = [
                 create_chat_message("system", "You are a helpful assistant."),
                 create_chat_message("user", f"Return in one word the language of this text: {text}")
             ]
             
-            completion = client.chat(
+            completion = chat(
+                client,
                 model="mistral-large-latest",
                 messages=messages
             )
             
-            return completion.choices[0].message.content
+            answer = completion.choices[0].message.content.strip().strip(".")
+            for language in languages or ():
+                if answer.lower() in language.lower().split():
+                    return language
+            return answer
             
         except Exception as e:
             st.warning(f"Mistral API returned an error:\n\n{str(e)}\n\n**Refresh the page and try again**")
             st.session_state["mistral_error"] = e
             st.stop()
 
-    @make_api_request
-    def send_to_gpt(self, page):
-        st.session_state["prompt"] = """
-You are receiving the text from one slide of a lecture. Use the following principles when making the flashcards:
-
-Material: "Source material"
-
-Task: Your task is to analyze the Source Material and condense the information into concise and direct statements. Ensure that each statement is clearly written at a level appropriate for medical students while being easily understandable, and adheres to the specified formatting and reference criteria. 
-
-Formatting Criteria: 
-- Construct a table with two columns: "Statements" and "explanations".
-- Each row of the "Statements" column should contain a single statement written in Anki cloze deletion mark-up.
-- Each row of the "explanation" column should provide additional details for the corresponding "Statement". There should be no cloze deletions in this column.
-- If no text is present, leave everything bland.
-
-Reference Criteria for each "Statement":
-- Restrict each statement to 1 or 2 cloze deletions. If needed, you may add 1-2 more cloze deletions but restrict them to either cloze1 or cloze2.
-- Limit the word count of each statement to less than 40 words.
-- Keep the text within the cloze deletions limited to one or two Source key words.
-- Each statement must be able to stand alone.
-- Keep ONLY simple, direct, statements in the "Statements" column. Keep any additional information in the "Explanation" column. Search and research USMLE textbook for detailed explanations supporting the statement.
-- Use the following examples below as a guideline on how to construct a "Statement" and "Explanation" based on provided source material. Be mindful of the cloze positions, and how statements adhere to the source material with minimal deviation.
-
-Example: 
-    Source Material: 
-        Hyperaldosteronism: Increased secretion of aldosterone from adrenal gland. Clinical features include hypertension, ↓ K⁺ (from increased renal Na+-K+ ATPase activity, resulting increased K⁺ secretion and causing hypokalemia) or normal K⁺, metabolic alkalosis. 1° hyperaldosteronism does not directly cause edema due to aldosterone escape mechanism. However, certain 2° causes of hyperaldosteronism (eg, heart failure) impair the aldosterone escape mechanism, leading to worsening of edema.
-        Primary hyperaldosteronism: Seen with adrenal adenoma (Conn syndrome), ectopic aldosterone-secreting tumors (kidney, ovaries), or bilateral adrenal hyperplasia. ↑ aldosterone, ↓ renin. Presents with increased renal blood flow and increased glomerular filtration rate, resulting in sodium and water retention (severe volume overload). Causes resistant hypertension.
-        Secondary hyperaldosteronism: Seen in patients with renovascular hypertension, juxtaglomerular cell tumors (independent activation of RAAS, from excess renin-producing "reninoma"), and edema (eg, cirrhosis, heart failure, nephrotic syndrome). ↑ aldosterone, ↑ renin. Characterized by increased aldosterone production due to an external stimulus, primarily as a response to activation of the renin-angiotensin-aldosterone system (RAAS).
-
-    Table:
-| Statements | Explanation 
-| {{c1::word}} Give an example of what you want here | - Explanation here |
-| This is a {{c1::second}} example to reinforce the formatting. | - Explanation here |
-| {{c1::Primary}} hyperaldosteronism is characterized by high aldosterone and {{c2::low}} renin | - This results in resistant hypertension; renin is downregulated via high blood pressure |
-| Hyperaldosteronism {{c2::increases}} K⁺ secretion and causes {{c2::hypo}}kalemia | - Increased Na+ reabsorption → increased Na+-K+ ATPase activity → increased driving force across luminal membrane from increased intracellular K+ |
-| Primary hyperaldosteronism may present with {{c1::increased}} renal blood flow and {{c1::increased}} glomerular filtration rate | - Due to arterial hypertension and hypersecretion of aldosterone |
-| Primary hyperaldosteronism initially causes severe volume {{c1::overload}} and {{c1::hyper}}tension | - Due to sodium and water retention |
-| Adrenal adenoma and ectopic aldosterone-secreting tumors (kidney, ovaries) may cause {{c1::primary}} hyperaldosteronism | - Can lead to resistant hypertension |
-| {{c1::Secondary}} hyperaldosteronism is seen in patients with juxtaglomerular cell tumor due to independent activation of the RAAS | - Results in severe hypertension that is difficult to control - These secrete renin (hence AKA reninoma), thus you also have Angiotensin II upregulation as well as aldosterone (failure of aldosterone escape) |
-| Secondary hyperaldosteronism is due to activation of {{c1::renin-angiotensin}} system | - Seen in patients with renovascular hypertension (renal artery stenosis), juxtaglomerular cell tumors, and edema (cirrhosis, heart failure, nephrotic syndrome) |
-| Congestive heart failure, cirrhosis, nephrotic syndrome, and excessive peripheral edema may cause {{c1::secondary}} hyperaldosteronism | - 2° hyperaldosteronism is driven by an increase in renin production (i.e. stimulation from edema) |
-| {{c1::Secondary}} hyperaldosteronism is characterized by high aldosterone and {{c2::high}} renin | - Seen in patients with renovascular hypertension and juxtaglomerular cell tumor (due to independent activation of renin-angiotensin-aldosterone system), as well as causes of edema (cirrhosis, heart failure, nephrotic syndrome) |
-End of Example
-
-- Only add each piece of information once.
-- Questions and answers must be in """ + st.session_state["lang"] + """.
-- Ignore information about the school or professor.
-- If whole slide fits on one flashcard, do that.
-- Use 'null_function' if page is just a title slide.
-- Return json.
-"""
-
-        new_chunk = st.session_state['text_' + str(page)]
-        new_chunk = st.session_state["prompt"] + 'Text:\n' + new_chunk
-
-        behaviour = "You are a flashcard making assistant. Follow the user's requirements carefully and to the letter. Always call one of the provided functions."
-
-        if st.session_state['API_KEY'] == "":
-            client = create_mistral_client(st.secrets['MISTRAL_API_KEY'])
-        else:
-            client = create_mistral_client(st.session_state['API_KEY'])
-
-        max_retries = 3
-        retries = 0
-        while retries < max_retries:
+    def build_request(self, text, lang, packed=False, part=False):
+        """Returns the cache key and the chat messages for one page (or one packed group, or one part) of text."""
+        prompt = flashcard_prompt(lang, packed=packed, part=part)
+        key = self.cache.key(text, BEHAVIOUR + prompt, lang, MODEL, TEMPERATURE)
+        messages = [
+            create_chat_message("system", BEHAVIOUR),
+            create_chat_message("user", prompt + 'Text:\n' + text)
+        ]
+        return key, messages
+
+    def request_flashcards(self, client, text, lang, max_retries=3, use_cache=True, packed=False, part=False):
+        """
+        Sends one page of text to the model and returns the raw response.
+        Does not touch st.session_state so it can run on worker threads.
+        With use_cache=False the cache is skipped but still refreshed with the new response.
+        """
+        key, messages = self.build_request(text, lang, packed=packed, part=part)
+        if use_cache:
+            cached = self.cache.get(key)
+            if cached is not None:
+                metrics.count("response_cache", result="hit")
+                return cached
+            metrics.count("response_cache", result="miss")
+
+        with metrics.timer("generation"):
             try:
-                messages = [
-                    create_chat_message("system", behaviour),
-                    create_chat_message("user", new_chunk)
-                ]
-                
-                completion = client.chat(
-                    model="mistral-large-latest",
+                # Deadlines, backoff, hedging and model fallback are up to the policy
+                completion, model = mistral_config.request_policy.chat(
+                    client,
+                    attempts=max_retries,
+                    model=MODEL,
                     messages=messages,
-                    temperature=0.8
+                    temperature=TEMPERATURE
                 )
-                
-                response = completion.choices[0].message.content
-                
-                if "null_function" in response:
-                    st.session_state[f"{str(page)}_is_title"] = True
-                    return None
-                    
-                return response
-                
-            except Exception as e:
-                print(f"Error: {str(e)}")
-                retries += 1
-                if retries == max_retries:
-                    st.warning(f"Mistral API error:\n\n{str(e)}\n\n**Fix the problem, refresh the page and try again**")
-                    st.session_state["mistral_error"] = e
-                    st.stop()
-
-    def add_image_to_anki(self, image_path, pdf_name, page):
-        try:
-            with open(image_path, "rb") as img_file:
-                image_data = base64.b64encode(img_file.read()).decode('utf-8')
-
-            base_name = os.path.basename(pdf_name)
-            base_name_without_ext = os.path.splitext(base_name)[0]
-            filename = f"{base_name_without_ext}_page_{page + 1}.jpg"
-
-            image_stored = API("storeImage", image=image_data, filename=filename)
-            return image_stored
-
-        except Exception as e:
-            st.error(f"add_image_to_anki error: {str(e)}")
+            except Exception:
+                metrics.count("generation_failures")
+                raise
+
+        response = completion.choices[0].message.content
+        # Answers of the fallback model are not cached, a regeneration asks MODEL again; nor are
+        # answers without cards or cut off, so that they are not served again on a retry
+        if model == MODEL:
+            result = parse_flashcards(response)
+            if result.cards and not result.truncated:
+                self.cache.put(key, response)
+        return response
+
+    def stream_flashcards(self, client, text, lang, on_card=None, max_retries=3, use_cache=True, part=False):
+        """
+        Streams one page through the model and calls on_card for every card as soon as
+        its object is complete. Returns (response, cards, error): if the stream breaks
+        after some cards have arrived, those cards are kept and the error is returned
+        instead of starting the page over.
+        """
+        key, messages = self.build_request(text, lang, part=part)
+        if use_cache:
+            cached = self.cache.get(key)
+            if cached is not None:
+                metrics.count("response_cache", result="hit")
+                cards = self.parse_response(cached).cards
+                if on_card:
+                    for card in cards:
+                        on_card(card)
+                return cached, cards, None
+            metrics.count("response_cache", result="miss")
+
+        # Deadlines, hedging and model fallback as for request_flashcards; the deadline holds
+        # even when no chunk arrives
+        policy = mistral_config.request_policy
+        model = MODEL
+        retries = 0
+        start = time.monotonic()
+        with metrics.timer("generation"):
+            while True:
+                parser = FlashcardParser()
+                chunks = []
+                deadline = min(policy.deadline, policy.total_deadline - (time.monotonic() - start))
+                try:
+                    for content in policy.stream(client, deadline, model=model, messages=messages,
+                                                 temperature=TEMPERATURE):
+                        chunks.append(content)
+                        for card in parser.feed(content):
+                            if on_card:
+                                on_card(card)
+                    parser.close()
+                    response = ''.join(chunks)
+                    # Cached on the same terms as in request_flashcards
+                    if model == MODEL and parser.cards and not parser.truncated:
+                        self.cache.put(key, response)
+                    return response, parser.cards, None
+
+                except Exception as e:
+                    metrics.count("model_attempt_errors", kind=type(e).__name__, model=model)
+                    if parser.cards:
+                        parser.close()
+                        metrics.count("generation_failures", partial="yes")
+                        return ''.join(chunks), parser.cards, e
+                    retries += 1
+                    delay = policy.backoff_delay(retries)
+                    if retries == max_retries or not mistral_config.is_retryable_error(e) \
+                            or time.monotonic() - start + delay >= policy.total_deadline:
+                        metrics.count("generation_failures")
+                        raise
+                    model = policy.next_model(model, e)
+                    metrics.count("model_retries")
+                    time.sleep(delay)
+
+    @staticmethod
+    def is_title_response(response):
+        return response is None or "null_function" in response
+
+    def merge_parts(self, responses):
+        """
+        One single-page response from the responses to the parts of a page. A page is only
+        a title page when every part was; when no part gave usable cards the first answer
+        is kept so its parse errors still show up.
+        """
+        cards = []
+        for response in responses:
+            if not self.is_title_response(response):
+                cards.extend(self.cleanup_response(response) or [])
+        if cards:
+            return json.dumps({"flashcards": cards})
+        return next((response for response in responses if not self.is_title_response(response)), "null_function")
+
+    def request_page(self, client, text, lang, split_tokens=None, use_cache=True, max_workers=4):
+        """
+        Sends one page to the model. Pages with more than split_tokens tokens of text are
+        split at paragraph and sentence boundaries and the parts are sent in parallel, so
+        no single answer grows long enough to be cut off; their cards are merged back.
+        """
+        parts = split_text(text, split_tokens) if split_tokens else [text]
+        if len(parts) == 1:
+            return self.request_flashcards(client, text, lang, use_cache=use_cache)
+
+        metrics.count("split_pages")
+        metrics.count("split_parts", len(parts))
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(parts)))) as pool:
+            responses = list(pool.map(lambda part: self.request_flashcards(client, part, lang, use_cache=use_cache,
+                                                                           part=True), parts))
+        return self.merge_parts(responses)
+
+    def stream_page(self, client, text, lang, on_card=None, split_tokens=None, use_cache=True):
+        """
+        stream_flashcards for a whole page: with split_tokens, the parts of a large page are
+        streamed one after the other and returned as one response. Stops at the first part
+        that broke off, keeping the cards so far.
+        """
+        parts = split_text(text, split_tokens) if split_tokens else [text]
+        if len(parts) == 1:
+            return self.stream_flashcards(client, text, lang, on_card=on_card, use_cache=use_cache)
+
+        metrics.count("split_pages")
+        metrics.count("split_parts", len(parts))
+        responses = []
+        cards = []
+        for part in parts:
+            response, part_cards, error = self.stream_flashcards(client, part, lang, on_card=on_card,
+                                                                 use_cache=use_cache, part=True)
+            responses.append(response)
+            cards.extend(part_cards)
+            if error is not None:
+                return json.dumps({"flashcards": cards}), cards, error
+        return self.merge_parts(responses), cards, None
+
+    def handle_response(self, page, response):
+        if self.is_title_response(response):
+            get_document().mark_title(page)
             return None
 
-    def cleanup_response(self, text):
-        try:
-            prefix = 'flashcard_function('
-            if text.startswith(prefix):
-                text = text[len(prefix):-1]
-
-                json_strs = text.strip().split('\n})\n')
-                json_strs = [text + '}' if not text.endswith('}') else text for text in json_strs]
-                json_strs = ['{' + text if not text.startswith('{') else text for text in json_strs]
+        return response
 
-                text = json_strs[0]
+    def split_tokens(self):
+        """Budget above which a page is sent in parts, None when splitting is off in the sidebar."""
+        if st.session_state.get("split_pages", True):
+            return st.session_state.get("split_tokens", 1500)
+        return None
 
-            response_text_escaped = re.sub(r'(?<=\[)[^\[\]]*(?=\])', self.escape_inner_brackets, text)
-            response_text_standard_quotes = self.replace_curly_quotes(response_text_escaped)
-            response_text_single_quotes = re.sub(r'("(?:[^"\\]|\\.)*")', self.replace_inner_double_quotes,
-                                                 response_text_standard_quotes)
+    def page_failed(self, page, e):
+        """Marks just this page as failed; it can be retried, the other pages go on."""
+        metrics.count("page_failures")
+        get_document().fail_page(page, f"{type(e).__name__}: {e}")
 
-            response_cards = json.loads(response_text_single_quotes, strict=False)
-            response_data = response_cards["flashcards"]
-
-            return response_data
+    def send_to_gpt(self, page, use_cache=True):
+        client = self.get_client()
 
+        try:
+            response = self.request_pages(client, {page: get_document().page(page).text}, st.session_state["lang"],
+                                          split_tokens=self.split_tokens(), use_cache=use_cache,
+                                          max_workers=st.session_state.get("max_workers", 4))[page]
         except Exception as e:
-            print(f"Error with Mistral API: {str(e)}\nReturned:\n{text}")
-
-    def escape_inner_brackets(self, match_obj):
-        inner_text = match_obj.group(0)
-        escaped_text = inner_text.replace('[', '\\[').replace(']', '\\]')
-        return escaped_text
+            self.page_failed(page, e)
+            return None
 
-    def replace_curly_quotes(self, text):
-        return text.replace('"', "'").replace('"', "'").replace('„', "'")
+        return self.handle_response(page, response)
 
-    def replace_inner_double_quotes(self, match_obj):
-        inner_text = match_obj.group(0)
-        pattern = r'(:\s*)("[^"]*")'
-        matches = re.findall(pattern, inner_text)
+    def request_packed_flashcards(self, client, texts, pages, lang):
+        """
+        Sends several consecutive pages in one request and splits the cards back per page.
+        Returns {page: response} where each response looks like a single-page one, so the
+        usual title-slide and cleanup handling still applies page by page.
+        """
+        response = self.request_flashcards(client, packed_text(texts, pages), lang, packed=True)
+        cards = self.cleanup_response(response) or []
 
-        for match in matches:
-            inner_quotes_replaced = match[1].replace('"', "'")
-            inner_text = inner_text.replace(match[1], inner_quotes_replaced)
+        labels = {page + 1: page for page in pages}
+        page_cards = {page: [] for page in pages}
+        for card in cards:
+            try:
+                page = labels.get(int(card.pop("page", None)))
+            except (TypeError, ValueError):
+                page = None
+            if page is None:
+                # Cannot tell which slide the card is about, so it is not put on any
+                metrics.count("packed_unlabeled_cards")
+                continue
+            page_cards[page].append(card)
+
+        title_pages = {labels[n] for n in parse_title_pages(response) if n in labels}
+        responses = {}
+        for page in pages:
+            if page_cards[page]:
+                responses[page] = json.dumps({"flashcards": page_cards[page]})
+            elif page in title_pages:
+                responses[page] = "null_function"
+            else:
+                # Neither cards nor a title slide: the page is asked about on its own
+                metrics.count("packed_missing_pages")
+                responses[page] = self.request_flashcards(client, texts[page], lang)
+        return responses
+
+    def request_pages(self, client, texts, lang, split_tokens=None, use_cache=True, max_workers=4):
+        """
+        {page: response} for one unit of work, the same for the job workers, the UI and the
+        CLI: consecutive pages are packed into one request, a single page goes through
+        request_page and is split when it is large.
+        """
+        pages = sorted(texts)
+        if len(pages) == 1:
+            return {pages[0]: self.request_page(client, texts[pages[0]], lang, split_tokens=split_tokens,
+                                                use_cache=use_cache, max_workers=max_workers)}
+        return self.request_packed_flashcards(client, texts, pages, lang)
+
+    def generate_pages(self, texts, lang, client, max_workers=4, pack_tokens=None, split_tokens=None):
+        """
+        Sends several pages through a pool of at most max_workers in-flight requests.
+        With pack_tokens, consecutive pages are packed into requests of about that many
+        tokens of page text. With split_tokens, pages larger than that are split into
+        parts as in request_page. Yields (page, response, error) in completion order so
+        callers can store each page as soon as it is done.
+        """
+        groups = pack_pages(texts, pack_tokens) if pack_tokens else [[page] for page in texts]
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = {pool.submit(self.request_pages, client, {page: texts[page] for page in group}, lang,
+                                   split_tokens=split_tokens, max_workers=max_workers): group
+                       for group in groups}
+            try:
+                for future in as_completed(futures):
+                    group = futures[future]
+                    try:
+                        responses = future.result()
+                    except Exception as e:
+                        for page in group:
+                            yield page, None, e
+                        continue
+                    for page in group:
+                        yield page, responses[page], None
+            finally:
+                for future in futures:
+                    future.cancel()
+
+    def push_batches(self, batches, on_batch=None):
+        """Sends anki_export batches through the server-side client; returns the per-batch summaries."""
+        return anki_export.push(batches, send=self.server_anki().send, on_batch=on_batch)
+
+    def parse_response(self, text):
+        with metrics.timer("parse"):
+            result = parse_flashcards(text)
+        if result.errors:
+            metrics.count("parse_failures", len(result.errors))
+        if result.truncated:
+            metrics.count("truncated_responses")
+        return result
 
-        return inner_text
+    def cleanup_response(self, text):
+        return self.parse_response(text).cards or None
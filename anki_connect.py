@@ -0,0 +1,152 @@
+# anki_connect.py
+# -*- coding: utf-8 -*-
+import http.client
+import json
+import queue
+import threading
+from urllib.parse import urlparse
+
+from anki_export import ANKI_CONNECT_URL, CARD_BACK, CARD_FRONT, MODEL_NAME, deck_query, note_front, request
+
+
+class AnkiConnectError(Exception):
+    pass
+
+
+class AnkiConnectClient:
+    """
+    Talks to AnkiConnect from Python when Anki runs on the same host as the app.
+
+    Connections are kept alive and pooled (at most pool_size open at once), so batches
+    of requests do not pay a new TCP handshake each, and several requests can be
+    bundled into one round trip with multi(). Offers the same operations as the
+    browser component: reqPerm, getDecks, addNotes and storeImage.
+    """
+
+    def __init__(self, url=ANKI_CONNECT_URL, pool_size=4, timeout=30):
+        parsed = urlparse(url)
+        self.url = url
+        self.host = parsed.hostname
+        self.port = parsed.port or 80
+        self.timeout = timeout
+        self.pool_size = pool_size
+
+        self._idle = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(pool_size)
+        self._lock = threading.Lock()
+        self._closed = False
+        self.connections_opened = 0
+
+    def _connect(self):
+        with self._lock:
+            self.connections_opened += 1
+        return http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+
+    def _acquire(self):
+        self._slots.acquire()
+        try:
+            return self._idle.get_nowait(), True
+        except queue.Empty:
+            return self._connect(), False
+
+    def _release(self, connection, keep):
+        if keep and not self._closed:
+            self._idle.put(connection)
+        else:
+            connection.close()
+        self._slots.release()
+
+    def send(self, payload):
+        """Posts one raw request and returns the decoded response body."""
+        body = json.dumps(payload).encode('utf-8')
+        headers = {"Content-Type": "application/json", "Connection": "keep-alive"}
+
+        connection, reused = self._acquire()
+        keep = False
+        try:
+            try:
+                connection.request("POST", "/", body=body, headers=headers)
+                response = connection.getresponse()
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                if not reused:
+                    raise
+                # The server closed an idle keep-alive connection: reconnect once
+                connection.close()
+                connection = self._connect()
+                connection.request("POST", "/", body=body, headers=headers)
+                response = connection.getresponse()
+
+            data = response.read()
+            keep = not response.will_close
+        except OSError as e:
+            raise AnkiConnectError(f"Unable to reach AnkiConnect at {self.url}: {e}") from e
+        finally:
+            self._release(connection, keep)
+
+        return json.loads(data)
+
+    def invoke(self, action, **params):
+        response = self.send(request(action, **params))
+        if isinstance(response, dict) and set(response) == {"result", "error"}:
+            if response["error"]:
+                raise AnkiConnectError(response["error"])
+            return response["result"]
+        return response
+
+    def multi(self, actions):
+        """Runs several requests in one round trip; returns one (result, error) pair per request."""
+        results = self.invoke("multi", actions=actions)
+        pairs = []
+        for result in results:
+            if isinstance(result, dict) and set(result) == {"result", "error"}:
+                pairs.append((result["result"], result["error"]))
+            else:
+                pairs.append((result, None))
+        return pairs
+
+    def request_permission(self):
+        return self.invoke("requestPermission")["permission"]
+
+    def ensure_model(self):
+        """Creates the AnKingOverhaul cloze note type if it is missing, like the component does."""
+        if MODEL_NAME in self.invoke("modelNames"):
+            return None
+        return self.invoke("createModel", modelName=MODEL_NAME, inOrderFields=["Text", "Extra"], isCloze=True,
+                           cardTemplates=[{
+                               "Name": "Cloze",
+                               "Front": CARD_FRONT,
+                               "Back": CARD_BACK,
+                           }])
+
+    def get_decks(self):
+        return self.invoke("deckNames")
+
+    def note_fronts(self, deck, chunk_size=1000):
+        """(note id, first field) of every note in the deck, notesInfo in chunks of chunk_size."""
+        ids = self.invoke("findNotes", query=deck_query(deck))
+        fronts = []
+        for start in range(0, len(ids), chunk_size):
+            for info in self.invoke("notesInfo", notes=ids[start:start + chunk_size]):
+                if info:
+                    fronts.append((info.get("noteId"), note_front(info)))
+        return fronts
+
+    def close(self):
+        self._closed = True
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
+
+
+_clients = {}
+_clients_lock = threading.Lock()
+
+
+def get_client(url=ANKI_CONNECT_URL):
+    """One pooled client per AnkiConnect URL, shared across reruns and sessions."""
+    with _clients_lock:
+        if url not in _clients:
+            _clients[url] = AnkiConnectClient(url)
+        return _clients[url]
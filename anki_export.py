@@ -0,0 +1,206 @@
+# anki_export.py
+# -*- coding: utf-8 -*-
+import base64
+import json
+import os
+import re
+import urllib.request
+
+from metrics import metrics
+
+ANKI_CONNECT_URL = "http://localhost:8765"
+MODEL_NAME = "AnKingOverhaul"
+CARD_FRONT = "{{cloze:Text}}"
+CARD_BACK = "{{cloze:Text}}\n\n<hr id=answer>\n\n{{Extra}}<br><br>\n\nTags: {{Tags}}"
+
+_IMAGE_SRC = re.compile(r'<img src="([^"]+)"')
+
+
+def make_note(deck, front, back, tags, image_filename=None):
+    if image_filename:
+        back = back + f'<br><img src="{image_filename}" />'
+    return {
+        "deckName": deck,
+        "modelName": MODEL_NAME,
+        "fields": {"Text": front, "Extra": back},
+        "options": {"allowDuplicate": False},
+        "tags": tags,
+    }
+
+
+def page_image_filename(pdf_name, page, extension="jpg"):
+    base_name_without_ext = os.path.splitext(os.path.basename(pdf_name))[0]
+    return f"{base_name_without_ext}_page_{page + 1}.{extension}"
+
+
+def request(action, **params):
+    payload = {"action": action, "version": 6}
+    if params:
+        payload["params"] = params
+    return payload
+
+
+def deck_query(deck):
+    """Anki search for the notes of a deck and its subdecks."""
+    return 'deck:"{}"'.format(deck.replace("\\", "\\\\").replace('"', '\\"'))
+
+
+def note_front(info):
+    """The first field of a notesInfo entry, "Text" for AnKingOverhaul notes."""
+    fields = info.get("fields") or {}
+    if "Text" in fields:
+        return fields["Text"]["value"]
+    ordered = sorted(fields.values(), key=lambda field: field.get("order", 0))
+    return ordered[0]["value"] if ordered else ""
+
+
+def build_batches(notes, media, chunk_size=50):
+    """
+    Splits notes into AnkiConnect "multi" requests of at most chunk_size notes.
+
+    media maps filename -> image bytes; every file is stored once, in the first chunk
+    whose notes reference it. Each chunk checks which notes are duplicates and adds
+    them in the same round trip.
+    """
+    batches = []
+    stored = set()
+    for start in range(0, len(notes), chunk_size):
+        chunk = notes[start:start + chunk_size]
+
+        actions = []
+        for note in chunk:
+            for filename in _IMAGE_SRC.findall(note["fields"]["Extra"]):
+                if filename in media and filename not in stored:
+                    stored.add(filename)
+                    actions.append(request("storeMediaFile", filename=filename,
+                                           data=base64.b64encode(media[filename]).decode('utf-8')))
+        actions.append(request("canAddNotesWithErrorDetail", notes=chunk))
+        actions.append(request("addNotes", notes=chunk))
+
+        batches.append({"payload": request("multi", actions=actions), "notes": len(chunk),
+                        "media": len(actions) - 2})
+    return batches
+
+
+def build_component_batches(notes, media, chunk_size=50):
+    """
+    Splits notes into requests for the browser component: one "addNotes" request of at
+    most chunk_size notes, and one "storeImage" request per image the batch is the first
+    to reference. Notes keep referencing the page image by its file name and carry no
+    image data of their own, so every image is sent and stored once.
+    """
+    batches = []
+    stored = set()
+    for note in notes:
+        batch = batches[-1] if batches else None
+        if batch is None or batch["deck"] != note["deckName"] or batch["notes"] >= chunk_size:
+            batch = {"deck": note["deckName"], "cards": [], "notes": 0, "images": {}, "media": 0}
+            batches.append(batch)
+        for filename in _IMAGE_SRC.findall(note["fields"]["Extra"]):
+            if filename in media and filename not in stored:
+                stored.add(filename)
+                batch["images"][filename] = base64.b64encode(media[filename]).decode('utf-8')
+                batch["media"] += 1
+        # Without an image of its own the component adds the back as it is, image tag included
+        batch["cards"].append({"front": note["fields"]["Text"], "back": note["fields"]["Extra"],
+                               "tags": note["tags"], "image": ""})
+        batch["notes"] += 1
+    return batches
+
+
+def summarize_component_batch(batch, response, stored):
+    """
+    Counts added and failed notes in the answer of the component's "addNotes" action;
+    stored holds the answers of its "storeImage" requests by file name.
+    """
+    summary = {"notes": batch["notes"], "added": 0, "duplicates": 0, "failed": batch["notes"],
+               "media": batch["media"], "error": None}
+    # storeMediaFile answers with the file name, the component with an error message otherwise
+    failed_images = [filename for filename, result in stored.items() if result != filename]
+    if failed_images:
+        summary["media"] -= len(failed_images)
+        summary["error"] = f"Could not store {', '.join(failed_images)}: {stored[failed_images[0]]}"
+    if not isinstance(response, list):
+        summary["error"] = f"Unexpected AnkiConnect response: {response}"
+        return summary
+    # addNotes answers null for notes it could not add, without telling why
+    summary["added"] = sum(1 for note_id in response if note_id)
+    summary["failed"] = batch["notes"] - summary["added"]
+    return summary
+
+
+def _result(response):
+    # multi returns either bare results or {"result": ..., "error": ...} per action depending on version
+    if isinstance(response, dict) and "result" in response:
+        return response["result"], response.get("error")
+    return response, None
+
+
+def summarize_batch(batch, response):
+    """Counts added, duplicate and failed notes in the result of one batch."""
+    summary = {"notes": batch["notes"], "added": 0, "duplicates": 0, "failed": 0, "media": batch["media"],
+               "error": None}
+
+    result, error = _result(response)
+    if error or not isinstance(result, list) or len(result) < 2:
+        summary["failed"] = batch["notes"]
+        summary["error"] = error or f"Unexpected AnkiConnect response: {response}"
+        return summary
+
+    can_add, _ = _result(result[-2])
+    added, add_error = _result(result[-1])
+
+    if isinstance(can_add, list):
+        summary["duplicates"] = sum(1 for entry in can_add
+                                    if isinstance(entry, dict) and not entry.get("canAdd")
+                                    and "duplicate" in str(entry.get("error", "")))
+    if isinstance(added, list):
+        summary["added"] = sum(1 for note_id in added if note_id)
+    summary["failed"] = batch["notes"] - summary["added"] - summary["duplicates"]
+    if add_error and not summary["added"]:
+        summary["error"] = add_error
+    return summary
+
+
+def post(payload, url=ANKI_CONNECT_URL, timeout=30):
+    """Sends one request straight to AnkiConnect (used when Anki runs next to the app)."""
+    data = json.dumps(payload).encode('utf-8')
+    req = urllib.request.Request(url, data=data, headers={"Content-Type": "application/json"})
+    with urllib.request.urlopen(req, timeout=timeout) as response:
+        body = json.loads(response.read())
+    if isinstance(body, dict) and set(body) == {"result", "error"}:
+        if body["error"]:
+            raise RuntimeError(body["error"])
+        return body["result"]
+    return body
+
+
+def record_push(summary):
+    """Counts the notes of one pushed batch in the metrics, by outcome."""
+    for key, result in (("added", "added"), ("duplicates", "duplicate"), ("failed", "failed")):
+        if summary[key]:
+            metrics.count("anki_notes", summary[key], result=result)
+    if summary["error"]:
+        metrics.count("anki_errors", kind="batch")
+
+
+def push(batches, send=post, on_batch=None):
+    """Sends every batch with send(payload) and returns the per-batch summaries."""
+    summaries = []
+    for batch in batches:
+        try:
+            with metrics.timer("anki_push"):
+                summary = summarize_batch(batch, send(batch["payload"]))
+        except Exception as e:
+            summary = {"notes": batch["notes"], "added": 0, "duplicates": 0, "failed": batch["notes"],
+                       "media": batch["media"], "error": str(e)}
+        record_push(summary)
+        summaries.append(summary)
+        if on_batch:
+            on_batch(len(summaries), summary)
+    return summaries
+
+
+def total(summaries):
+    keys = ("notes", "added", "duplicates", "failed", "media")
+    return {key: sum(summary[key] for summary in summaries) for key in keys}
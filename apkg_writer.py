@@ -0,0 +1,182 @@
+# apkg_writer.py
+# -*- coding: utf-8 -*-
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import tempfile
+import time
+import zipfile
+
+from anki_export import CARD_BACK, CARD_FRONT, MODEL_NAME
+
+# Fixed so that repeated imports reuse one AnKingOverhaul note type instead of creating copies
+MODEL_ID = 1607392319001
+
+CSS = ".card {\n font-family: arial;\n font-size: 20px;\n text-align: center;\n color: black;\n background-color: white;\n}\n.cloze {\n font-weight: bold;\n color: blue;\n}\n"
+
+SCHEMA = """
+CREATE TABLE col (
+    id integer primary key, crt integer not null, mod integer not null, scm integer not null,
+    ver integer not null, dty integer not null, usn integer not null, ls integer not null,
+    conf text not null, models text not null, decks text not null, dconf text not null, tags text not null
+);
+CREATE TABLE notes (
+    id integer primary key, guid text not null, mid integer not null, mod integer not null,
+    usn integer not null, tags text not null, flds text not null, sfld integer not null,
+    csum integer not null, flags integer not null, data text not null
+);
+CREATE TABLE cards (
+    id integer primary key, nid integer not null, did integer not null, ord integer not null,
+    mod integer not null, usn integer not null, type integer not null, queue integer not null,
+    due integer not null, ivl integer not null, factor integer not null, reps integer not null,
+    lapses integer not null, left integer not null, odue integer not null, odid integer not null,
+    flags integer not null, data text not null
+);
+CREATE TABLE revlog (
+    id integer primary key, cid integer not null, usn integer not null, ivl integer not null,
+    lastIvl integer not null, factor integer not null, time integer not null, type integer not null
+);
+CREATE TABLE graves (usn integer not null, oid integer not null, type integer not null);
+CREATE INDEX ix_notes_usn on notes (usn);
+CREATE INDEX ix_cards_usn on cards (usn);
+CREATE INDEX ix_revlog_usn on revlog (usn);
+CREATE INDEX ix_cards_nid on cards (nid);
+CREATE INDEX ix_cards_sched on cards (did, queue, due);
+CREATE INDEX ix_revlog_cid on revlog (cid);
+CREATE INDEX ix_notes_csum on notes (csum);
+"""
+
+_CLOZE = re.compile(r"{{c(\d+)::")
+_TAG = re.compile(r"<[^>]+>")
+
+
+def deck_id(name):
+    return int(hashlib.sha1(name.encode("utf-8")).hexdigest()[:12], 16)
+
+
+def _model(did, now):
+    field = {"sticky": False, "rtl": False, "font": "Arial", "size": 20, "media": []}
+    return {
+        "id": MODEL_ID, "name": MODEL_NAME, "type": 1, "mod": now, "usn": -1, "sortf": 0, "did": did,
+        "tmpls": [{"name": "Cloze", "ord": 0, "qfmt": CARD_FRONT, "afmt": CARD_BACK, "did": None,
+                   "bqfmt": "", "bafmt": ""}],
+        "flds": [dict(field, name="Text", ord=0), dict(field, name="Extra", ord=1)],
+        "css": CSS, "latexPre": "\\documentclass[12pt]{article}\n\\begin{document}\n",
+        "latexPost": "\\end{document}", "tags": [], "vers": [], "req": [[0, "any", [0]]],
+    }
+
+
+def _deck(did, name, now):
+    return {
+        "id": did, "name": name, "mod": now, "usn": -1, "desc": "", "dyn": 0, "conf": 1, "collapsed": False,
+        "lrnToday": [0, 0], "revToday": [0, 0], "newToday": [0, 0], "timeToday": [0, 0],
+        "extendNew": 10, "extendRev": 50,
+    }
+
+
+def _deck_config():
+    return {"1": {
+        "id": 1, "name": "Default", "mod": 0, "usn": 0, "maxTaken": 60, "autoplay": True, "timer": 0,
+        "replayq": True, "dyn": False,
+        "new": {"delays": [1, 10], "ints": [1, 4, 7], "initialFactor": 2500, "order": 1, "perDay": 20,
+                "bury": True, "separate": True},
+        "rev": {"perDay": 100, "ease4": 1.3, "fuzz": 0.05, "ivlFct": 1, "maxIvl": 36500, "minSpace": 1,
+                "bury": True},
+        "lapse": {"delays": [10], "mult": 0, "minInt": 1, "leechFails": 8, "leechAction": 0},
+    }}
+
+
+class ApkgWriter:
+    """
+    Writes an .apkg deck without a running Anki.
+
+    Notes and cards go straight into an on-disk SQLite collection as they are added and
+    media files straight into the zip, so memory stays flat no matter how large the
+    export is. Media is stored once per filename.
+    """
+
+    def __init__(self, path, deck_name, commit_every=1000):
+        self.path = path
+        self.deck_name = deck_name
+        self.did = deck_id(deck_name)
+        self.commit_every = commit_every
+        self.notes = 0
+        self.cards = 0
+
+        self._now = int(time.time())
+        self._next_id = int(time.time() * 1000)
+        self._media = {}
+
+        fd, self._db_path = tempfile.mkstemp(suffix=".anki2")
+        os.close(fd)
+        self._db = sqlite3.connect(self._db_path)
+        self._db.executescript(SCHEMA)
+        self._zip = zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _id(self):
+        self._next_id += 1
+        return self._next_id
+
+    def add_media(self, filename, data):
+        if filename in self._media:
+            return
+        # Media files are numbered inside the package; the "media" map gives their real names
+        index = str(len(self._media))
+        self._media[filename] = index
+        self._zip.writestr(index, data, compress_type=zipfile.ZIP_STORED)
+
+    def add_note(self, front, back, tags=()):
+        nid = self._id()
+        sort_field = _TAG.sub("", front)
+        checksum = int(hashlib.sha1(sort_field.encode("utf-8")).hexdigest()[:8], 16)
+        # Stable guid: re-importing the same card updates it instead of duplicating it
+        guid = hashlib.sha1((self.deck_name + "\x1f" + front).encode("utf-8")).hexdigest()[:10]
+        tag_text = " " + " ".join(tag.replace(" ", "_") for tag in tags if tag) + " " if tags else ""
+
+        self._db.execute("INSERT INTO notes VALUES (?, ?, ?, ?, -1, ?, ?, ?, ?, 0, '')",
+                         (nid, guid, MODEL_ID, self._now, tag_text, front + "\x1f" + back, sort_field, checksum))
+
+        ords = sorted({int(n) - 1 for n in _CLOZE.findall(front)}) or [0]
+        for ord_ in ords:
+            self._db.execute("INSERT INTO cards VALUES (?, ?, ?, ?, ?, -1, 0, 0, ?, 0, 0, 0, 0, 0, 0, 0, 0, '')",
+                             (self._id(), nid, self.did, ord_, self._now, self.notes + 1))
+            self.cards += 1
+
+        self.notes += 1
+        if self.notes % self.commit_every == 0:
+            self._db.commit()
+
+    def add_anki_note(self, note):
+        """Adds a note in the AnkiConnect shape built by anki_export.make_note."""
+        self.add_note(note["fields"]["Text"], note["fields"]["Extra"], note.get("tags", ()))
+
+    def close(self):
+        if self._zip is None:
+            return
+        decks = {
+            "1": _deck(1, "Default", self._now),
+            str(self.did): _deck(self.did, self.deck_name, self._now),
+        }
+        conf = {"nextPos": self.notes + 1, "estTimes": True, "activeDecks": [1], "sortType": "noteFld",
+                "timeLim": 0, "sortBackwards": False, "addToCur": True, "curDeck": 1, "newBust": True,
+                "newSpread": 0, "dueCounts": True, "curModel": str(MODEL_ID), "collapseTime": 1200}
+        self._db.execute("INSERT INTO col VALUES (1, ?, ?, ?, 11, 0, 0, 0, ?, ?, ?, ?, '{}')",
+                         (self._now, self._now * 1000, self._now * 1000, json.dumps(conf),
+                          json.dumps({str(MODEL_ID): _model(self.did, self._now)}), json.dumps(decks),
+                          json.dumps(_deck_config())))
+        self._db.commit()
+        self._db.close()
+
+        self._zip.write(self._db_path, "collection.anki2")
+        self._zip.writestr("media", json.dumps({index: name for name, index in self._media.items()}))
+        self._zip.close()
+        self._zip = None
+        os.remove(self._db_path)
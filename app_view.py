@@ -2,7 +2,6 @@
 # -*- coding: utf-8 -*-
 import io
 import os
-import json
 import base64
 import streamlit as st
 from streamlit_extras.badges import badge
@@ -11,45 +10,120 @@ import uuid
 import time
 import hashlib
 import tempfile
+import shutil
 from streamlit_cropper import st_cropper
 from PIL import Image
-from mistral_config import create_mistral_client
+from pdf_store import PdfPageStore
+from extraction_cache import ExtractionCache
+from actions import API, Actions
+import anki_export
+from apkg_writer import ApkgWriter
+from session_store import get_document, new_document
+from page_triage import PageVerdict, page_kind, triage_pages
+from metrics import metrics
+from duplicate_index import DUPLICATE_TAG, DuplicateIndex, filter_notes
+from anki_connect import AnkiConnectError
+from job_queue import FAILED, QUEUED, RUNNING, JobQueue, JobWorkers
 import markdown
 
+# Shared by every session: uploads are stored under their content hash, so sessions never collide
+extraction_cache = ExtractionCache()
+# Generation jobs of every session; they keep running when a session reruns or goes away
+job_queue = JobQueue()
+job_workers = JobWorkers(job_queue, Actions(None).request_pages)
+JOB_POLL_SECONDS = 2
+
+# Fragments rerun only their own part of the page (Streamlit >= 1.33); older versions rerun everything
+_fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None)
+fragment = _fragment or (lambda func: func)
+# Reruns by itself, to pick up pages finished by the job workers; without fragments a rerun does
+polling_fragment = _fragment(run_every=JOB_POLL_SECONDS) if _fragment else fragment
+
+
 class AppView:
     def __init__(self, actions):
         self.actions = actions
 
-    @st.cache_data
+    @st.cache_resource(max_entries=8)
     def extract_pdf_data(_self, file_path):
-        doc = fitz.open(file_path)
-        page_count = len(doc)
-
-        extracted_data = {}
-        for i in range(page_count):
-            page = doc.load_page(i)
-            text = page.get_text()
-            pixmap = page.get_pixmap(dpi=150)
-            image_bytes = pixmap.tobytes(output='jpg', jpg_quality=100)
-            extracted_data[i] = {
-                "text": text,
-                "image": image_bytes
-            }
-
-        return extracted_data, page_count
+        with metrics.timer("pdf_open"):
+            return PdfPageStore(file_path, cache=extraction_cache, doc_hash=extraction_cache.hash_from_path(file_path))
+
+    def render_metrics(self):
+        """Timings per stage and counters of the whole app since the server started, with exports."""
+        stages = metrics.stages()
+        if stages:
+            st.dataframe([{"stage": stage, "calls": values["count"], "total s": round(values["sum"], 2),
+                           "mean ms": round(values["sum"] / values["count"] * 1000, 1),
+                           "p95 ms": round(values["p95"] * 1000, 1), "max ms": round(values["max"] * 1000, 1)}
+                          for stage, values in sorted(stages.items())], hide_index=True)
+        else:
+            st.caption("Nothing measured yet")
+
+        hits = metrics.counter("response_cache", result="hit")
+        misses = metrics.counter("response_cache", result="miss")
+        st.caption(f"Tokens: {metrics.counter('tokens', kind='prompt')} prompt, "
+                   f"{metrics.counter('tokens', kind='completion')} completion, "
+                   f"${metrics.counter('cost_usd'):.4f}")
+        st.caption(f"Requests: {hits} cached, {misses} sent, {metrics.counter('model_retries')} retries, "
+                   f"{metrics.counter('rate_limit_backoffs')} rate-limit backoffs, "
+                   f"{metrics.counter('parse_failures')} parse failures")
+        st.caption(f"Anki: {metrics.counter('anki_notes', result='added')} added, "
+                   f"{metrics.counter('anki_notes', result='duplicate')} duplicates, "
+                   f"{metrics.counter('anki_notes', result='failed')} failed")
+
+        col1, col2 = st.columns(2)
+        with col1:
+            st.download_button("JSONL", data=metrics.to_jsonl(), file_name="metrics.jsonl",
+                               mime="application/x-ndjson")
+        with col2:
+            st.download_button("Prometheus", data=metrics.to_prometheus(), file_name="metrics.prom",
+                               mime="text/plain")
 
     def reset_cache_on_new_file(self, file):
-        if "last_uploaded_file" not in st.session_state:
-            st.session_state["last_uploaded_file"] = None
-
-        if file is not None:
-            if file.name != st.session_state["last_uploaded_file"]:
-                st.cache_data.clear()
-                self.clear_flashcards()
-                st.session_state["last_uploaded_file"] = file.name
-                with open(os.path.join("/tmp", file.name), "wb") as f:
-                    f.write(file.getbuffer())
-                st.session_state["temp_file_path"] = os.path.join("/tmp", file.name)
+        if file is None:
+            return
+
+        # The uploader hands out a new id per upload, hashing the content is only needed then
+        upload_id = getattr(file, "file_id", None) or getattr(file, "id", None) or (file.name, file.size)
+        if upload_id != st.session_state.get("last_upload_id"):
+            data = file.getvalue()
+            doc_hash = extraction_cache.file_hash(data)
+            path = extraction_cache.store_pdf(data, doc_hash)
+            st.session_state["last_upload_id"] = upload_id
+            st.session_state["last_uploaded_file"] = file.name
+            if doc_hash != st.session_state.get("doc_hash"):
+                new_document(file.name)
+                st.session_state.pop("job_seen", None)
+                st.session_state["doc_hash"] = doc_hash
+                st.session_state["temp_file_path"] = path
+                st.session_state["page_count"] = self.extract_pdf_data(path).page_count
+                self.detect_language(path)
+        elif not os.path.exists(st.session_state["temp_file_path"]):
+            # Evicted from the cache to make room for other documents
+            extraction_cache.store_pdf(file.getvalue(), st.session_state["doc_hash"])
+
+    def detect_language(self, path, max_chars=2000):
+        """
+        Makes the language of a new document the returned language, unless the user picked
+        one. Only the local detector is asked: an upload never waits for or fails on the
+        model, and an unsure guess leaves the language as it is.
+        """
+        if st.session_state.get("lang_chosen"):
+            return
+        pdf = self.extract_pdf_data(path)
+        text = ""
+        for page in range(pdf.page_count):
+            text += pdf.text(page) + "\n"
+            if len(text) >= max_chars:
+                break
+        lang = None
+        if text.strip():
+            lang = self.actions.get_lang(text[:max_chars], st.session_state["languages"], ask_model=False)
+        if lang and lang != st.session_state.get("lang"):
+            # The language selectbox is already drawn in this run
+            st.session_state["gpt_lang"] = lang
+            st.rerun()
 
     def display(self):
         st.session_state['dev'] = False
@@ -91,6 +165,11 @@ class AppView:
 
         st.header('Powered by Mistral Large')
 
+        if "anki_push" in st.session_state:
+            self.render_anki_push()
+        elif "anki_push_summary" in st.session_state:
+            self.show_anki_push_summary()
+
         if "no_ankiconnect" in st.session_state and st.session_state.no_ankiconnect == False:
             if "api_perms" not in st.session_state:
                 self.actions.check_API()
@@ -152,6 +231,7 @@ class AppView:
                 if st.button("Refresh decks", key="deck_refresh_btn"):
                     if "decks" in st.session_state:
                         del st.session_state["decks"]
+                        st.session_state.pop("duplicate_indexes", None)
                         if "deck_count" not in st.session_state:
                             st.session_state["deck_count"] = 1
                         st.session_state["deck_count"] += 1
@@ -165,10 +245,17 @@ class AppView:
                 if st.session_state["gpt_lang"] in st.session_state["languages"]:
                     st.session_state["languages"].remove(st.session_state["gpt_lang"])
                 st.session_state["languages"].insert(0, st.session_state["gpt_lang"])
+                st.session_state["lang"] = st.session_state["gpt_lang"]
                 del st.session_state["gpt_lang"]
-            st.selectbox("Returned language", st.session_state["languages"], on_change=self.clear_flashcards,
+            st.selectbox("Returned language", st.session_state["languages"], on_change=self.choose_language,
                          key="lang")
 
+            uploaded_file = st.file_uploader("Choose a PDF file", type="pdf")
+            self.reset_cache_on_new_file(uploaded_file)
+            if "page_count" not in st.session_state:
+                st.info("Upload a PDF to get started")
+                st.stop()
+
             page_info = st.empty()
             col1, col2 = st.columns(2)
             with col1:
@@ -195,19 +282,79 @@ class AppView:
                                             max_value=st.session_state['page_count'], format='%i', key="start_page")
             if st.session_state['API_KEY'] == "":
                 st.warning("Enter API key to remove limitations")
+            else:
+                st.number_input('Parallel requests', value=4, min_value=1, max_value=16, format='%d',
+                                key="max_workers")
+                st.checkbox("Show cards while they are generated", value=True, key="stream_cards")
+                st.checkbox("Skip title, blank and repeated slides", value=True, key="triage_pages",
+                            help="Checked locally, without asking the model")
+                if st.checkbox("Pack pages into one request", key="pack_pages"):
+                    st.number_input('Tokens of page text per request', value=2000, min_value=200, step=100,
+                                    format='%d', key="pack_tokens")
+                if st.checkbox("Split long pages into several requests", value=True, key="split_pages",
+                               help="Dense pages are split at paragraphs and sentences, so answers are not cut off"):
+                    st.number_input('Tokens of page text per part', value=1500, min_value=200, step=100,
+                                    format='%d', key="split_tokens")
+                cache_stats = self.actions.cache.stats()
+                st.caption(f"Response cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses, "
+                           f"{cache_stats['entries']} entries ({cache_stats['bytes'] / 1024 / 1024:.1f} MB)")
+                cache_stats = extraction_cache.stats()
+                st.caption(f"Extraction cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses, "
+                           f"{cache_stats['documents']} documents ({cache_stats['bytes'] / 1024 / 1024:.1f} MB)")
+                text_stats = self.extract_pdf_data(st.session_state["temp_file_path"]).text_stats()
+                if text_stats["raw_tokens"]:
+                    st.caption(f"Headers and footers: {text_stats['boilerplate_lines']} recurring lines removed, "
+                               f"~{text_stats['saved_tokens']} input tokens saved on {text_stats['pages']} pages "
+                               f"({text_stats['saved_tokens'] / text_stats['raw_tokens']:.0%})")
+
+            st.number_input('Pages shown at once', value=5, min_value=1, max_value=50, format='%d',
+                            key="pages_per_view")
+
+            with st.expander("Anki export"):
+                st.radio("Reach AnkiConnect from", ["Browser", "Server"], key="anki_backend", horizontal=True,
+                         help="Use Server when Anki runs on the same machine as this app")
+                if st.checkbox("Attach page images to notes", value=True, key="anki_images"):
+                    col1, col2 = st.columns(2)
+                    with col1:
+                        st.number_input('Image DPI', value=120, min_value=50, max_value=300, step=10, format='%d',
+                                        key="export_dpi")
+                        st.selectbox("Image format", ["jpg", "webp"], key="export_format")
+                    with col2:
+                        st.number_input('Image quality', value=80, min_value=30, max_value=100, step=5,
+                                        format='%d', key="export_quality")
+                        st.number_input('Max KB per image', value=300, min_value=0, step=50, format='%d',
+                                        key="export_max_kb", help="0 for no limit")
+                    image_stats = self.extract_pdf_data(st.session_state["temp_file_path"]).image_stats()
+                    if image_stats["pages"]:
+                        st.caption(f"Page images: {image_stats['export_bytes'] / 1024:.0f} KB for "
+                                   f"{image_stats['pages']} pages, {image_stats['saved_bytes'] / 1024:.0f} KB saved "
+                                   f"against the full-size images of {image_stats['compared_pages']} pages")
+                st.number_input('Notes per Anki batch', value=50, min_value=1, max_value=500, format='%d',
+                                key="anki_chunk_size")
+                st.radio("Cards already in the deck", ["Skip", "Tag", "Off"], key="anki_duplicates",
+                         horizontal=True, help="Checked locally, also rephrased cards with the same cloze answers, "
+                                               "against the deck's notes from the server or the cards sent this "
+                                               f"session from the browser. Tag sends them tagged {DUPLICATE_TAG}")
+                if self.has_active_flashcards() and st.button("Build .apkg deck"):
+                    self.build_apkg()
+                if "apkg_path" in st.session_state and os.path.exists(st.session_state["apkg_path"]):
+                    with open(st.session_state["apkg_path"], "rb") as f:
+                        st.download_button("Download .apkg", data=f, mime="application/octet-stream",
+                                           file_name=os.path.basename(st.session_state["apkg_path"]))
+
+            with st.expander("Metrics"):
+                self.render_metrics()
 
             deck_info = st.empty()
         if "start_page" in st.session_state and st.session_state.start_page == None:
             page_info.info("Choose a starting page")
             if "temp_file_path" in st.session_state:
-                extracted_data, page_count = self.extract_pdf_data(st.session_state["temp_file_path"])
+                pages = self.extract_pdf_data(st.session_state["temp_file_path"])
 
                 st.markdown("**Preview:**")
 
-                for i in range(0, st.session_state['page_count']):
-                    if i == st.session_state['page_count']:
-                        break
-                    st.image(extracted_data[i]["image"], caption=f"Page {str(i + 1)}")
+                for i in self.visible_pages(range(pages.page_count), key="preview_view"):
+                    st.image(pages.thumbnail(i), caption=f"Page {str(i + 1)}")
         else:
             with st.sidebar:
                 if "deck_key" not in st.session_state:
@@ -225,6 +372,7 @@ class AppView:
                     if st.button("Refresh decks", key="deck_refresh_btn"):
                         if "decks" in st.session_state:
                             del st.session_state["decks"]
+                            st.session_state.pop("duplicate_indexes", None)
                             if "deck_count" not in st.session_state:
                                 st.session_state["deck_count"] = 1
                             st.session_state["deck_count"] += 1
@@ -235,189 +383,481 @@ class AppView:
                 st.stop()
 
             if "temp_file_path" in st.session_state:
-                extracted_data, page_count = self.extract_pdf_data(st.session_state["temp_file_path"])
-
-                st.markdown("**Preview:**")
-
-                for i in range(st.session_state['start_page'] - 1,
-                               min(st.session_state['start_page'] + st.session_state['num_pages'] - 1,
-                                   st.session_state['page_count'])):
-                    if i == st.session_state['page_count']:
-                        break
-                    st.image(extracted_data[i]["image"], caption=f"Page {str(i + 1)}")
-
-            if "temp_file_path" in st.session_state:
-                extracted_data, page_count = self.extract_pdf_data(st.session_state["temp_file_path"])
-
-                st.markdown("**Flashcards:**")
-
-                for i in range(st.session_state['start_page'] - 1,
-                               min(st.session_state['start_page'] + st.session_state['num_pages'] - 1,
-                                   st.session_state['page_count'])):
-                    if i == st.session_state['page_count']:
-                        break
-
-                    col1, col2 = st.columns([0.7, 0.3])
-
-                    with col1:
-                        st.image(extracted_data[i]["image"], caption=f"Page {str(i + 1)}")
-
-                    with col2:
-                        if 'flashcards_' + str(i) in st.session_state:
-                            p = i
-                            flashcards = json.loads(json.dumps(st.session_state['flashcards_' + str(i)]))
-
-                            if f"{i}_is_title" in st.session_state:
-                                flashcards = None
-                                st.info(
-                                    "No flashcards generated for this slide as it doesn't contain relevant information.")
-
-                            if flashcards:
-                                if st.session_state['API_KEY'] == "":
-                                    if len(flashcards) > 2:
-                                        flashcards = flashcards[:2]
-                                length = len(flashcards)
-                                st.session_state["flashcards_" + str(i) + "_count"] = length
-
-                                for j in range(length):
-                                    if f"fc_active_{i, j}" not in st.session_state:
-                                        st.session_state[f"fc_active_{i, j}"] = True
-
-                                    if f"flashcards_{i}_tags" not in st.session_state:
-                                        st.session_state[f"flashcards_{i}_tags"] = ""
+                pages = self.extract_pdf_data(st.session_state["temp_file_path"])
+                self.render_flashcards(pages.page_range(st.session_state['start_page'],
+                                                        st.session_state['num_pages']))
+
+    def render_flashcards(self, page_range):
+        st.markdown("**Flashcards:**")
+
+        self.apply_job_results()
+        if st.button("Generate all pages in range", key="gen_all"):
+            self.generate_all_flashcards(page_range)
+        self.render_jobs()
+
+        calls_avoided = get_document().calls_avoided
+        if calls_avoided:
+            st.caption(f"Page triage saved {sum(calls_avoided.values())} model calls (" +
+                       ", ".join(f"{count} {reason}" for reason, count in sorted(calls_avoided.items())) + ")")
+
+        for i in self.visible_pages(page_range, key="page_view"):
+            self.render_page(i)
+
+    def visible_pages(self, page_range, key):
+        """
+        Pages of the current view. Only these are rendered, so a rerun costs the same
+        whether the range holds 5 pages or 500.
+        """
+        per_view = st.session_state.get("pages_per_view", 5)
+        views = [page_range[k:k + per_view] for k in range(0, len(page_range), per_view)]
+        if len(views) <= 1:
+            return page_range
+
+        labels = [f"Pages {view[0] + 1}-{view[-1] + 1}" for view in views]
+        label = st.selectbox("Show", labels, key=key, label_visibility="collapsed")
+        return views[labels.index(label)]
+
+    @fragment
+    def render_page(self, i):
+        """One page with its cards; as a fragment, editing a card only reruns its own page."""
+        pages = self.extract_pdf_data(st.session_state["temp_file_path"])
+        page = get_document().page(i)
+        job_status = None if page.generated else self.job_status(i)
+        col1, col2 = st.columns([0.7, 0.3])
 
-                                    st.markdown(f"**Flashcard {j + 1}:**")
-                                    st.checkbox("Active", key=f"fc_active_{i, j}", value=True)
-                                    st.text_area("Front", key=f"fc_front_{i, j}", value=flashcards[j]['front'],
-                                                 height=100)
-                                    st.text_area("Back", key=f"fc_back_{i, j}", value=flashcards[j]['back'],
-                                                  height=100)
-                                    st.text_input("Tags", key=f"fc_tags_{i, j}",
-                                                  value=st.session_state[f"flashcards_{i}_tags"])
+        with col1:
+            st.image(pages.image(i), caption=f"Page {str(i + 1)}")
 
-                                    if st.button("Add to Anki", key=f"add_{i, j}"):
-                                        if st.session_state[f"fc_active_{i, j}"]:
-                                            self.add_flashcard_to_anki(i, j)
+        with col2:
+            if page.generated:
+                if page.is_title:
+                    st.info(
+                        "No flashcards generated for this slide as it doesn't contain relevant information.")
+
+                if page.skipped:
+                    st.info(page.skipped)
+                    if st.button("Generate anyway", key=f"gen_anyway_{i}"):
+                        self.generate_flashcards(i, regen=True, triage=False)
+
+                if page.errors:
+                    st.caption("Parts of the response could not be read: " + "; ".join(page.errors))
+
+                if page.cards:
+                    flashcards = page.cards
+                    if st.session_state['API_KEY'] == "":
+                        flashcards = flashcards[:2]
 
-                                    st.markdown("---")
+                    for j, card in enumerate(flashcards):
+                        st.markdown(f"**Flashcard {j + 1}:**")
+                        key = page.widget_key("active", j)
+                        st.checkbox("Active", key=key, value=card.active,
+                                    on_change=self.update_card, args=(i, j, "active", key))
+                        key = page.widget_key("front", j)
+                        st.text_area("Front", key=key, value=card.front, height=100,
+                                     on_change=self.update_card, args=(i, j, "front", key))
+                        key = page.widget_key("back", j)
+                        st.text_area("Back", key=key, value=card.back, height=100,
+                                     on_change=self.update_card, args=(i, j, "back", key))
+                        key = page.widget_key("tags", j)
+                        st.text_input("Tags", key=key, value=card.tags,
+                                      on_change=self.update_card, args=(i, j, "tags", key))
+
+                        if st.button("Add to Anki", key=page.widget_key("add", j)):
+                            if card.active:
+                                self.add_flashcard_to_anki(i, j)
+
+                        st.markdown("---")
+
+                    if st.button("Regenerate Flashcards", key=f"regen_{i}"):
+                        self.generate_flashcards(i, regen=True)
+
+                    if st.button("Add All to Anki", key=f"add_all_{i}"):
+                        self.add_all_flashcards_to_anki(i)
+
+            elif job_status in (QUEUED, RUNNING):
+                st.info("Queued for generation" if job_status == QUEUED else "Generating...")
+
+            elif page.failed:
+                st.warning(f"Generating this page failed: {page.failed}")
+                if st.button("Retry", key=f"retry_{i}"):
+                    self.generate_flashcards(i, regen=True)
 
-                                if st.button("Regenerate Flashcards", key=f"regen_{i}"):
-                                    self.generate_flashcards(i, regen=True)
+            else:
+                if st.button("Generate Flashcards", key=f"gen_{i}"):
+                    self.generate_flashcards(i)
 
-                                if st.button("Add All to Anki", key=f"add_all_{i}"):
-                                    self.add_all_flashcards_to_anki(i)
+        st.markdown("---")
 
-                        else:
-                            if st.button("Generate Flashcards", key=f"gen_{i}"):
-                                self.generate_flashcards(i)
+    def update_card(self, page, index, field, key):
+        """Widget callback: copies an edit into the document store."""
+        if field == "active":
+            get_document().set_active(page, index, st.session_state[key])
+        else:
+            setattr(get_document().pages[page].cards[index], field, st.session_state[key])
 
-                    st.markdown("---")
+    def page_text(self, page):
+        doc_page = get_document().page(page)
+        if doc_page.text is None:
+            doc_page.text = self.extract_pdf_data(st.session_state["temp_file_path"]).text(page)
+        return doc_page.text
 
-    def generate_flashcards(self, page, regen=None):
+    def generate_flashcards(self, page, regen=None, triage=True):
         if regen:
-            if f"{page}_is_title" in st.session_state:
-                del st.session_state[f"{page}_is_title"]
-            if f"flashcards_generated_{page}" in st.session_state:
-                del st.session_state[f"flashcards_generated_{page}"]
-        if f"flashcards_generated_{page}" not in st.session_state:
-            flashcards = self.actions.send_to_gpt(page)
-
-            if flashcards:
-                flashcards_clean = self.actions.cleanup_response(flashcards)
-
-                st.session_state['flashcards_' + str(page)] = flashcards_clean
-
-            if regen:
+            get_document().reset_page(page)
+        text = self.page_text(page)
+        if triage and not regen and st.session_state.get("triage_pages", True):
+            kind = page_kind(text)
+            if kind is not None:
+                get_document().skip_page(page, kind, PageVerdict(page, kind).describe())
                 st.rerun()
+        if st.session_state.get("stream_cards", True):
+            self.stream_flashcards(page, use_cache=not regen)
+            st.rerun()
+
+        flashcards = self.actions.send_to_gpt(page, use_cache=not regen)
+
+        if flashcards:
+            self.store_flashcards(page, flashcards)
+
+        if regen or get_document().page(page).failed:
+            st.rerun()
+
+    def stream_flashcards(self, page, use_cache=True):
+        preview = st.container()
+        shown = []
+
+        def show_card(card):
+            shown.append(card)
+            preview.markdown(f"**Flashcard {len(shown)}:**\n\n{card['front']}\n\n*{card['back']}*")
+
+        try:
+            response, cards, error = self.actions.stream_page(
+                self.actions.get_client(), self.page_text(page), st.session_state["lang"],
+                on_card=show_card, split_tokens=self.actions.split_tokens(), use_cache=use_cache)
+        except Exception as e:
+            self.actions.page_failed(page, e)
+            return
+
+        if self.actions.handle_response(page, response) is None:
+            return
+
+        errors = [str(error) for error in self.actions.parse_response(response).errors]
+        if error is not None:
+            errors.insert(0, f"generation stopped early, regenerate for the full page ({error})")
+        get_document().set_cards(page, cards, errors)
+
+    def store_flashcards(self, page, response):
+        result = self.actions.parse_response(response)
+        get_document().set_cards(page, result.cards, [str(error) for error in result.errors])
+
+    def generate_all_flashcards(self, page_range):
+        document = get_document()
+        texts = {}
+        for i in page_range:
+            if document.page(i).generated:
+                continue
+            texts[i] = self.page_text(i)
+
+        if st.session_state.get("triage_pages", True):
+            for i, verdict in triage_pages(texts).items():
+                document.skip_page(i, verdict.reason, verdict.describe())
+                del texts[i]
+
+        if not texts:
+            st.rerun()
+
+        # Queued instead of generated in this run, so reruns, reloads and other sessions do not interrupt it
+        batch = self.job_batch()
+        job_queue.remove(*batch, texts)
+        pack_tokens = st.session_state.get("pack_tokens") if st.session_state.get("pack_pages") else None
+        job_workers.submit(*batch, texts, self.actions.get_client(), split_tokens=self.actions.split_tokens(),
+                           pack_tokens=pack_tokens, max_workers=st.session_state.get("max_workers", 4))
+        st.rerun()
+
+    def job_batch(self):
+        """
+        (document hash, language, owner) the pages of this document are queued under. The
+        owner is a hash of the session's API key, so other keys neither see nor pay for
+        these jobs; sessions without a key of their own share the app's. None before a
+        document was uploaded.
+        """
+        if "doc_hash" not in st.session_state:
+            return None
+        api_key = st.session_state.get("API_KEY", "")
+        owner = hashlib.sha256(api_key.encode('utf-8')).hexdigest()[:16] if api_key else ""
+        return st.session_state["doc_hash"], st.session_state.get("lang", ""), owner
+
+    def job_status(self, page):
+        batch = self.job_batch()
+        return job_queue.status(*batch, page) if batch else None
+
+    def apply_job_results(self):
+        """Copies the pages the job workers finished since the last run into the document."""
+        batch = self.job_batch()
+        if batch is None:
+            return 0
+        seen = st.session_state.setdefault("job_seen", {})
+        document = get_document()
+        rows = job_queue.results(*batch, since=seen.get(batch, 0.0))
+        for page, status, response, error, updated in rows:
+            if status == FAILED:
+                document.fail_page(page, error)
+            elif self.actions.handle_response(page, response) is not None:
+                self.store_flashcards(page, response)
+            seen[batch] = updated
+        return len(rows)
+
+    def render_jobs(self):
+        """Progress of the queued pages, polled only while some are still waiting."""
+        batch = self.job_batch()
+        if batch is None:
+            return
+        progress = job_queue.progress(*batch)
+        if progress.get(QUEUED, 0) + progress.get(RUNNING, 0):
+            self.poll_jobs()
+
+    @polling_fragment
+    def poll_jobs(self):
+        """
+        Reruns the app whenever pages were finished. Once nothing is waiting it reruns a last
+        time, which no longer renders this fragment and so ends the polling.
+        """
+        batch = self.job_batch()
+        progress = job_queue.progress(*batch)
+        waiting = progress.get(QUEUED, 0) + progress.get(RUNNING, 0)
+        if not waiting:
+            self.apply_job_results()
+            st.rerun()
+        # After a restart queued jobs wait for a session with the document to hand over a client
+        job_workers.attach(*batch, self.actions.get_client(), st.session_state.get("max_workers", 4))
+        total = sum(progress.values())
+        st.progress((total - waiting) / total, text=f"Generated {total - waiting} of {total} pages, "
+                                                    f"{progress.get(FAILED, 0)} failed; this keeps going "
+                                                    f"if you leave or reload the page")
+        if self.apply_job_results():
+            st.rerun()
+
+    def card_note(self, card, image_filename=None):
+        deck = st.session_state.get(st.session_state.get("deck_key", ""), "")
+        front = markdown.markdown(card.front, extensions=['nl2br'])
+        back = markdown.markdown(card.back, extensions=['nl2br'])
+
+        return anki_export.make_note(deck, front, back, [card.tags], image_filename)
+
+    def page_notes(self, page, media=None):
+        """
+        Active cards of one page as AnkiConnect notes; the page image is added to media
+        once, unless media is None because the caller stores the images itself.
+        """
+        cards = get_document().active_cards(page, limit=2 if st.session_state['API_KEY'] == "" else None)
+        if not cards:
+            return []
+
+        image_filename = None
+        if st.session_state.get("anki_images", True):
+            image_filename = self.export_image_filename(page)
+            if media is not None and image_filename not in media:
+                media[image_filename] = self.export_image(page)
+
+        return [self.card_note(card, image_filename) for _, card in cards]
+
+    def export_image_filename(self, page):
+        return anki_export.page_image_filename(st.session_state["last_uploaded_file"], page,
+                                               st.session_state.get("export_format", "jpg"))
+
+    def export_settings(self):
+        max_kb = st.session_state.get("export_max_kb", 300)
+        return {"dpi": st.session_state.get("export_dpi", 120), "fmt": st.session_state.get("export_format", "jpg"),
+                "quality": st.session_state.get("export_quality", 80), "max_bytes": max_kb * 1024 if max_kb else None}
+
+    def export_image(self, page):
+        return self.extract_pdf_data(st.session_state["temp_file_path"]).export_image(page, **self.export_settings())
+
+    def export_images(self, pages):
+        """Export images of the pages with active cards, rendered in parallel, in page order."""
+        if not st.session_state.get("anki_images", True):
+            return iter(())
+        document = get_document()
+        pages = [i for i in pages if document.active_cards(i)]
+        return self.extract_pdf_data(st.session_state["temp_file_path"]).iter_export_images(
+            pages, **self.export_settings())
+
+    def queue_anki_push(self, notes, media):
+        if not notes:
+            st.info("No active flashcards to add")
+            return
+
+        deck = st.session_state.get(st.session_state.get("deck_key", ""), "") or ""
+        chunk_size = st.session_state.get("anki_chunk_size", 50)
+        client = self.actions.server_anki()
+        if client is not None:
+            if st.session_state.get("anki_duplicates") != "Off" and self.duplicate_index(deck) is None:
+                try:
+                    fronts = client.note_fronts(deck) if deck else []
+                except AnkiConnectError:
+                    fronts = []
+                self.seed_duplicate_index(deck, fronts)
+            notes, skipped = self.filter_duplicates(notes, deck)
+            st.session_state["anki_push_skipped"] = skipped
+
+            batches = anki_export.build_batches(notes, media, chunk_size)
+            progress = st.progress(0.0, text=f"Sending {len(batches)} batches to Anki")
+            summaries = self.actions.push_batches(
+                batches, on_batch=lambda n, summary: progress.progress(
+                    n / len(batches), text=f"Sent {n} of {len(batches)} batches to Anki"))
+            self.remember_pushed(deck, notes, summaries)
+            st.session_state["anki_push_summary"] = summaries
+        else:
+            st.session_state["anki_push"] = {"id": uuid.uuid4().hex, "deck": deck, "notes": notes, "media": media,
+                                             "chunk_size": chunk_size}
+        st.rerun()
+
+    def render_anki_push(self):
+        """
+        Sends the queued notes through the AnkiConnect component, one "addNotes" request per
+        batch. Component results only arrive on the following reruns, so this runs on every
+        rerun until all batches answered.
+        """
+        push = st.session_state["anki_push"]
+        if "batches" not in push:
+            # The component cannot search the deck: duplicates are checked against the cards
+            # this session pushed, and AnkiConnect still refuses exact copies
+            if st.session_state.get("anki_duplicates") != "Off" and self.duplicate_index(push["deck"]) is None:
+                self.seed_duplicate_index(push["deck"], [])
+            push["notes"], push["skipped"] = self.filter_duplicates(push["notes"], push["deck"])
+            push["batches"] = anki_export.build_component_batches(push["notes"], push.pop("media"),
+                                                                  push["chunk_size"])
+        batches = push["batches"]
+
+        summaries = []
+        for n, batch in enumerate(batches):
+            stored = {}
+            for k, (filename, image) in enumerate(batch["images"].items()):
+                result = API("storeImage", key=f"anki_media_{push['id']}_{n}_{k}", image=image,
+                             filename=filename)
+                if result is not None:
+                    stored[filename] = result
+            response = API("addNotes", key=f"anki_push_{push['id']}_{n}", deck=batch["deck"],
+                           flashcards=batch["cards"])
+            if response is not None and len(stored) == len(batch["images"]):
+                summaries.append(anki_export.summarize_component_batch(batch, response, stored))
+
+        progress = len(summaries) / len(batches) if batches else 1.0
+        st.progress(progress, text=f"Sent {len(summaries)} of {len(batches)} batches to Anki")
+
+        if len(summaries) == len(batches):
+            # Counted once all batches answered, the summaries are rebuilt on every rerun
+            for summary in summaries:
+                anki_export.record_push(summary)
+            self.remember_pushed(push["deck"], push["notes"], summaries)
+            del st.session_state["anki_push"]
+            st.session_state["anki_push_summary"] = summaries
+            st.session_state["anki_push_skipped"] = push["skipped"]
+            st.rerun()
+
+    def duplicate_index(self, deck):
+        """The session's DuplicateIndex of the deck, None until it was seeded from Anki."""
+        return st.session_state.get("duplicate_indexes", {}).get(deck)
+
+    def seed_duplicate_index(self, deck, fronts):
+        index = DuplicateIndex()
+        with metrics.timer("duplicate_seed"):
+            for note_id, front in fronts:
+                index.add(front, note_id)
+        st.session_state.setdefault("duplicate_indexes", {})[deck] = index
+        return index
+
+    def filter_duplicates(self, notes, deck):
+        """Notes to send and the number of duplicates, per the "Cards already in the deck" setting."""
+        mode = st.session_state.get("anki_duplicates", "Skip")
+        if mode == "Off":
+            return notes, 0
+        with metrics.timer("duplicate_check"):
+            notes, duplicates = filter_notes(notes, self.duplicate_index(deck), skip=mode == "Skip")
+        metrics.count("duplicate_cards", duplicates, action=mode.lower())
+        return notes, duplicates
+
+    def remember_pushed(self, deck, notes, summaries):
+        # Batches that went through completely are in the deck now
+        index = self.duplicate_index(deck)
+        if index is None:
+            return
+        start = 0
+        for summary in summaries:
+            if summary["error"] is None and not summary["failed"]:
+                for note in notes[start:start + summary["notes"]]:
+                    index.add(note["fields"]["Text"])
+            start += summary["notes"]
+
+    def show_anki_push_summary(self):
+        summaries = st.session_state["anki_push_summary"]
+        counts = anki_export.total(summaries)
+        st.success(f"Added {counts['added']} of {counts['notes']} notes to Anki "
+                   f"({counts['duplicates']} duplicates skipped, {counts['failed']} failed, "
+                   f"{counts['media']} images stored)")
+        skipped = st.session_state.get("anki_push_skipped", 0)
+        if skipped:
+            action = "tagged " + DUPLICATE_TAG if st.session_state.get("anki_duplicates") == "Tag" else "not sent"
+            st.info(f"{skipped} cards were already in the deck or repeated each other, {action}")
+        for n, summary in enumerate(summaries):
+            if summary["error"]:
+                st.warning(f"Batch {n + 1}: {summary['error']}")
+        if st.button("Dismiss", key="anki_push_dismiss"):
+            del st.session_state["anki_push_summary"]
+            st.rerun()
 
     def add_flashcard_to_anki(self, page, index):
-        deck = st.session_state[f"{st.session_state['deck_key']}"]
-        front = st.session_state[f"fc_front_{page, index}"]
-        back = st.session_state[f"fc_back_{page, index}"]
-        tags = st.session_state[f"fc_tags_{page, index}"]
-
-        front = markdown.markdown(front, extensions=['nl2br'])
-        back = markdown.markdown(back, extensions=['nl2br'])
+        media = {}
+        image_filename = None
+        if st.session_state.get("anki_images", True):
+            image_filename = self.export_image_filename(page)
+            media[image_filename] = self.export_image(page)
 
-        note = {
-            "deckName": deck,
-            "modelName": "AnkingOverhaul",
-            "front": front,
-            "back": back,
-            "tags": [tags]
-        }
-
-        API("addNotes", deck=deck, flashcards=[note])
+        card = get_document().pages[page].cards[index]
+        self.queue_anki_push([self.card_note(card, image_filename)], media)
 
     def add_all_flashcards_to_anki(self, page=None):
         if page is not None:
-            self.add_all_flashcards_to_anki_page(page)
+            pages = [page]
         else:
-            for i in range(st.session_state['start_page'] - 1,
-                           min(st.session_state['start_page'] + st.session_state['num_pages'] - 1,
-                               st.session_state['page_count'])):
-                if i == st.session_state['page_count']:
-                    break
-                self.add_all_flashcards_to_anki_page(i)
-
-    def add_all_flashcards_to_anki_page(self, page):
-        if 'flashcards_' + str(page) in st.session_state:
-            flashcards = json.loads(json.dumps(st.session_state['flashcards_' + str(page)]))
-
-            if f"{page}_is_title" in st.session_state:
-                return
-
-            if flashcards:
-                if st.session_state['API_KEY'] == "":
-                    if len(flashcards) > 2:
-                        flashcards = flashcards[:2]
-                length = len(flashcards)
-                st.session_state["flashcards_" + str(page) + "_count"] = length
-
-                notes = []
-                for j in range(length):
-                    if f"fc_active_{page, j}" in st.session_state and st.session_state[f"fc_active_{page, j}"]:
-                        front = st.session_state[f"fc_front_{page, j}"]
-                        back = st.session_state[f"fc_back_{page, j}"]
-                        tags = st.session_state[f"fc_tags_{page, j}"]
-
-                        front = markdown.markdown(front, extensions=['nl2br'])
-                        back = markdown.markdown(back, extensions=['nl2br'])
-
-                        note = {
-                            "deckName": st.session_state[f"{st.session_state['deck_key']}"],
-                            "modelName": "AnkingOverhaul",
-                            "front": front,
-                            "back": back,
-                            "tags": [tags]
-                        }
-
-                        notes.append(note)
-
-                if notes:
-                    API("addNotes", deck=st.session_state[f"{st.session_state['deck_key']}"], flashcards=notes)
+            pages = self.extract_pdf_data(st.session_state["temp_file_path"]).page_range(
+                st.session_state['start_page'], st.session_state['num_pages'])
+
+        notes = []
+        media = {self.export_image_filename(i): image for i, image in self.export_images(pages)}
+        for i in pages:
+            notes.extend(self.page_notes(i, media))
+
+        self.queue_anki_push(notes, media)
+
+    def build_apkg(self):
+        """Writes the active cards of the page range to an .apkg, one page image in memory at a time."""
+        pdf_name = os.path.splitext(st.session_state["last_uploaded_file"])[0]
+        deck = st.session_state.get(st.session_state.get("deck_key", ""), "") or pdf_name
+        # A directory per build, so sessions exporting the same file name do not collide
+        if "apkg_path" in st.session_state:
+            shutil.rmtree(os.path.dirname(st.session_state["apkg_path"]), ignore_errors=True)
+        path = os.path.join(tempfile.mkdtemp(prefix="pdf-anki-"), pdf_name + ".apkg")
+
+        pages = self.extract_pdf_data(st.session_state["temp_file_path"]).page_range(
+            st.session_state['start_page'], st.session_state['num_pages'])
+        with ApkgWriter(path, deck) as writer:
+            for i, image in self.export_images(pages):
+                writer.add_media(self.export_image_filename(i), image)
+            for i in pages:
+                for note in self.page_notes(i):
+                    writer.add_anki_note(note)
+
+        st.session_state["apkg_path"] = path
+        st.success(f"Built {os.path.basename(path)} with {writer.notes} notes for deck {deck}")
+
+    def choose_language(self):
+        # A language picked by hand is kept for the next uploads
+        st.session_state["lang_chosen"] = True
+        self.clear_flashcards()
 
     def clear_flashcards(self):
-        for key in list(st.session_state.keys()):
-            if key.startswith('flashcards_'):
-                del st.session_state[key]
-            if key.startswith('fc_'):
-                del st.session_state[key]
-
-    def clear_data(self):
-        for key in list(st.session_state.keys()):
-            if key.startswith('text_'):
-                del st.session_state[key]
-            if key.startswith('image_'):
-                del st.session_state[key]
-            if key.startswith('flashcards_'):
-                del st.session_state[key]
-            if key.startswith('fc_'):
-                del st.session_state[key]
+        get_document().clear_cards()
 
     def has_active_flashcards(self):
-        for key in list(st.session_state.keys()):
-            if key.startswith('fc_active_'):
-                if st.session_state[key]:
-                    return True
-        return False
+        return get_document().has_active_cards()
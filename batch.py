@@ -0,0 +1,340 @@
+# batch.py
+# -*- coding: utf-8 -*-
+"""
+Headless batch mode: turns a folder of PDFs into flashcards without Streamlit.
+
+Usage:
+    python batch.py lectures/ --out export/ [--lang English|auto] [--workers 4] [--pack-tokens 2000]
+                            [--split-tokens 1500]
+    python batch.py lectures/ --out export/ --anki --deck "Cardiology"
+
+Every finished page is appended to <out>/<pdf>.checkpoint.jsonl, so an interrupted
+run picks up where it stopped. Cards are written to <out>/<pdf>.txt (Anki's text
+import format) or <out>/<pdf>.apkg (a complete deck, no Anki needed) and/or pushed
+to AnkiConnect. --metrics-out writes the timings and counters of the run for dashboards.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+import markdown
+
+import anki_export
+import mistral_config
+from actions import Actions
+from anki_connect import AnkiConnectClient, AnkiConnectError
+from apkg_writer import ApkgWriter
+from duplicate_index import DuplicateIndex, filter_notes
+from extraction_cache import ExtractionCache
+from language_detect import detect_language
+from metrics import metrics
+from page_triage import summarize, triage_pages
+from pdf_store import PdfPageStore
+from rate_limiter import RateLimiter
+
+
+def find_pdfs(directory):
+    pdfs = []
+    for root, _, files in os.walk(directory):
+        pdfs.extend(os.path.join(root, name) for name in files if name.lower().endswith(".pdf"))
+    return sorted(pdfs)
+
+
+class Checkpoint:
+    """Append-only log of finished pages for one PDF."""
+
+    def __init__(self, path):
+        self.path = path
+        self.pages = {}
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        # A line cut off by an interrupted run
+                        continue
+                    self.pages[entry["page"]] = entry
+
+    def record(self, page, cards, title=False, skipped=None):
+        entry = {"page": page, "cards": cards, "title": title}
+        if skipped:
+            entry["skipped"] = skipped
+        self.pages[page] = entry
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+
+def pdf_tag(pdf_path):
+    return os.path.splitext(os.path.basename(pdf_path))[0].replace(" ", "_")
+
+
+def export_images(pages, checkpoint, args):
+    """Page images of every page with cards, rendered in parallel and yielded in page order."""
+    image_pages = [page for page in sorted(checkpoint.pages) if checkpoint.pages[page]["cards"]]
+    max_bytes = args.image_max_kb * 1024 if args.image_max_kb else None
+    return pages.iter_export_images(image_pages, workers=args.render_workers, dpi=args.image_dpi,
+                                    fmt=args.image_format, quality=args.image_quality, max_bytes=max_bytes)
+
+
+def page_card_notes(pdf_path, checkpoint, page, deck, with_images, extension="jpg"):
+    image_filename = anki_export.page_image_filename(pdf_path, page, extension) if with_images else None
+    notes = []
+    for card in checkpoint.pages[page]["cards"]:
+        front = markdown.markdown(card["front"], extensions=['nl2br'])
+        back = markdown.markdown(card["back"], extensions=['nl2br'])
+        tags = [pdf_tag(pdf_path), f"page_{page + 1}"]
+        notes.append(anki_export.make_note(deck, front, back, tags, image_filename))
+    return notes
+
+
+def card_notes(pdf_path, checkpoint, deck, with_images, extension="jpg"):
+    notes = []
+    for page in sorted(checkpoint.pages):
+        notes.extend(page_card_notes(pdf_path, checkpoint, page, deck, with_images, extension))
+    return notes
+
+
+def write_text_export(path, notes):
+    """Tab-separated notes that Anki's File > Import understands, fields in AnKingOverhaul order."""
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("#separator:tab\n#html:true\n#notetype:AnKingOverhaul\n#tags column:3\n")
+        for note in notes:
+            fields = [note["fields"]["Text"], note["fields"]["Extra"], " ".join(note["tags"])]
+            f.write("\t".join(field.replace("\t", " ").replace("\n", " ") for field in fields) + "\n")
+
+
+def write_apkg_export(path, pdf_path, checkpoint, pages, deck, args):
+    """Writes the deck page by page, so only one page image is in memory at a time."""
+    with_images = not args.no_images
+    images = export_images(pages, checkpoint, args) if with_images else None
+    with ApkgWriter(path, deck) as writer:
+        for page in sorted(checkpoint.pages):
+            notes = page_card_notes(pdf_path, checkpoint, page, deck, with_images, args.image_format)
+            if notes and with_images:
+                _, image = next(images)
+                writer.add_media(anki_export.page_image_filename(pdf_path, page, args.image_format), image)
+            for note in notes:
+                writer.add_anki_note(note)
+    return writer
+
+
+def convert_pdf(pdf_path, actions, client, args, extraction_cache=None):
+    name = os.path.splitext(os.path.basename(pdf_path))[0]
+    doc_hash = None
+    if extraction_cache is not None:
+        with open(pdf_path, "rb") as f:
+            doc_hash = extraction_cache.file_hash(f.read())
+        # The PDF itself stays where it is, only what is extracted from it is cached
+        extraction_cache.add_document(doc_hash)
+    with metrics.timer("pdf_open"):
+        pages = PdfPageStore(pdf_path, cache=extraction_cache, doc_hash=doc_hash,
+                             strip_boilerplate=not args.keep_boilerplate)
+    checkpoint = Checkpoint(os.path.join(args.out, name + ".checkpoint.jsonl"))
+
+    texts = {i: pages.text(i) for i in range(pages.page_count) if i not in checkpoint.pages}
+    print(f"{name}: {pages.page_count} pages, {pages.page_count - len(texts)} already done")
+    text_stats = pages.text_stats()
+    if text_stats["saved_tokens"]:
+        print(f"  boilerplate: {text_stats['boilerplate_lines']} recurring lines, ~{text_stats['saved_tokens']} "
+              f"input tokens saved ({text_stats['saved_tokens'] / text_stats['raw_tokens']:.0%})")
+
+    stats = {"pages": 0, "cards": 0, "failed": 0, "skipped": 0}
+    if not args.no_triage:
+        verdicts = triage_pages(texts)
+        for page, verdict in verdicts.items():
+            checkpoint.record(page, [], title=verdict.reason == "title", skipped=verdict.reason)
+            metrics.count("calls_avoided", reason=verdict.reason)
+            del texts[page]
+        if verdicts:
+            counts = summarize(verdicts)
+            print(f"  triage: {len(verdicts)} calls avoided (" +
+                  ", ".join(f"{count} {reason}" for reason, count in counts.items() if count) + ")")
+        stats["skipped"] = len(verdicts)
+
+    lang = args.lang
+    if lang == "auto" and texts:
+        lang, confidence = detect_language("\n".join(texts[page] for page in sorted(texts))[:2000])
+        if lang is None or confidence < 0.8:
+            print(f"  language unclear ({lang}, {confidence:.2f}), using English")
+            lang = "English"
+        else:
+            print(f"  language: {lang}")
+
+    results = actions.generate_pages(texts, lang, client, max_workers=args.workers,
+                                     pack_tokens=args.pack_tokens, split_tokens=args.split_tokens or None)
+    for page, response, error in results:
+        if error is not None:
+            print(f"  page {page + 1}: {error}", file=sys.stderr)
+            stats["failed"] += 1
+            continue
+        if actions.is_title_response(response):
+            checkpoint.record(page, [], title=True)
+        else:
+            cards = actions.parse_response(response).cards
+            checkpoint.record(page, cards)
+            stats["cards"] += len(cards)
+            metrics.observe("cards_per_page", len(cards))
+        stats["pages"] += 1
+
+    deck = args.deck or name
+    if args.out_format == "apkg":
+        writer = write_apkg_export(os.path.join(args.out, name + ".apkg"), pdf_path, checkpoint, pages, deck, args)
+        print(f"  {writer.path}: {writer.notes} notes, {writer.cards} cards")
+
+    if args.out_format == "txt" or args.anki:
+        export_notes(pdf_path, name, checkpoint, pages, deck, args)
+
+    image_stats = pages.image_stats()
+    if image_stats["pages"]:
+        print(f"  page images: {image_stats['export_bytes'] / 1024:.0f} KB for {image_stats['pages']} pages")
+    pages.close()
+    return stats
+
+
+# DuplicateIndex per (AnkiConnect URL, deck), seeded once per run
+duplicate_indexes = {}
+
+
+def duplicate_index(anki, deck):
+    key = (anki.url, deck)
+    if key not in duplicate_indexes:
+        index = DuplicateIndex()
+        try:
+            with metrics.timer("duplicate_seed"):
+                for note_id, front in anki.note_fronts(deck):
+                    index.add(front, note_id)
+        except AnkiConnectError as e:
+            print(f"  could not read {deck} for duplicates: {e}")
+        duplicate_indexes[key] = index
+    return duplicate_indexes[key]
+
+
+def export_notes(pdf_path, name, checkpoint, pages, deck, args):
+    with_images = not args.no_images
+    notes = card_notes(pdf_path, checkpoint, deck, with_images, args.image_format)
+    media = {}
+    if with_images:
+        for page, image in export_images(pages, checkpoint, args):
+            media[anki_export.page_image_filename(pdf_path, page, args.image_format)] = image
+
+    if args.out_format == "txt":
+        write_text_export(os.path.join(args.out, name + ".txt"), notes)
+        # Page images go next to the export, to be copied into Anki's collection.media folder
+        if media:
+            os.makedirs(os.path.join(args.out, "media"), exist_ok=True)
+            for filename, image in media.items():
+                with open(os.path.join(args.out, "media", filename), "wb") as f:
+                    f.write(image)
+
+    if args.anki:
+        anki = AnkiConnectClient(args.anki_url)
+        index = None
+        if not args.keep_duplicates:
+            index = duplicate_index(anki, deck)
+            with metrics.timer("duplicate_check"):
+                notes, skipped = filter_notes(notes, index)
+            metrics.count("duplicate_cards", skipped, action="skip")
+            if skipped:
+                print(f"  {skipped} cards already in {deck}, not sent")
+        if not notes:
+            return
+        batches = anki_export.build_batches(notes, media, args.chunk_size)
+        summaries = anki_export.push(batches, send=anki.send)
+        totals = anki_export.total(summaries)
+        print(f"  Anki: {totals['added']} added, {totals['duplicates']} duplicates, {totals['failed']} failed")
+        # Later PDFs of the run that go into the same deck are checked against these too
+        if index is not None:
+            for note in notes:
+                index.add(note["fields"]["Text"])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert a folder of PDFs to Anki flashcards")
+    parser.add_argument("directory", help="folder that is searched for PDFs")
+    parser.add_argument("--out", default="export", help="folder for checkpoints and exports")
+    parser.add_argument("--out-format", choices=["txt", "apkg", "none"], default="txt")
+    parser.add_argument("--lang", default="English", help="language of the flashcards, auto to detect it per PDF")
+    parser.add_argument("--api-key", default=os.environ.get("MISTRAL_API_KEY"))
+    parser.add_argument("--workers", type=int, default=4, help="requests in flight")
+    parser.add_argument("--rps", type=float, default=1.0, help="requests per second budget")
+    parser.add_argument("--deadline", type=float, default=90.0, help="seconds per model request before it is retried")
+    parser.add_argument("--fallback-model", default="mistral-small-latest",
+                        help="model asked after a timeout, none to keep retrying the same one")
+    parser.add_argument("--no-hedge", action="store_true",
+                        help="never send a second request for a slow one (hedging costs extra tokens)")
+    parser.add_argument("--pack-tokens", type=int, default=None, help="pack consecutive pages up to this many tokens")
+    parser.add_argument("--split-tokens", type=int, default=1500,
+                        help="send pages with more tokens of text than this in parts, 0 to send them whole")
+    parser.add_argument("--anki", action="store_true", help="push the cards to AnkiConnect")
+    parser.add_argument("--anki-url", default=anki_export.ANKI_CONNECT_URL)
+    parser.add_argument("--deck", default=None, help="Anki deck (defaults to the PDF name)")
+    parser.add_argument("--keep-duplicates", action="store_true",
+                        help="push cards even when a similar card is already in the deck")
+    parser.add_argument("--chunk-size", type=int, default=50, help="notes per AnkiConnect batch")
+    parser.add_argument("--no-images", action="store_true", help="do not attach page images")
+    parser.add_argument("--image-dpi", type=int, default=120, help="resolution of the attached page images")
+    parser.add_argument("--image-format", choices=["jpg", "webp"], default="jpg")
+    parser.add_argument("--image-quality", type=int, default=80)
+    parser.add_argument("--image-max-kb", type=int, default=300, help="size budget per page image, 0 for none")
+    parser.add_argument("--render-workers", type=int, default=None,
+                        help="processes that render page images (default: one per CPU)")
+    parser.add_argument("--keep-boilerplate", action="store_true",
+                        help="send recurring headers, footers and slide numbers to the model too")
+    parser.add_argument("--no-triage", action="store_true",
+                        help="send title, blank and repeated slides to the model too")
+    parser.add_argument("--no-extraction-cache", action="store_true",
+                        help="do not keep extracted text and images on disk between runs")
+    parser.add_argument("--metrics-out", default=None,
+                        help="write timings and counters to this file (.prom for Prometheus text, else JSON lines)")
+    args = parser.parse_args()
+
+    if not args.api_key:
+        parser.error("set MISTRAL_API_KEY or pass --api-key")
+
+    os.makedirs(args.out, exist_ok=True)
+    mistral_config.rate_limiter = RateLimiter(requests_per_second=args.rps, burst=args.workers,
+                                              tokens_per_minute=mistral_config.rate_limiter.tokens_per_minute)
+    fallback_models = {} if args.fallback_model == "none" else {"mistral-large-latest": args.fallback_model}
+    mistral_config.request_policy = mistral_config.RequestPolicy(deadline=args.deadline, hedge=not args.no_hedge,
+                                                                 fallback_models=fallback_models)
+    actions = Actions(None)
+    client = mistral_config.get_mistral_client(args.api_key, pool_size=args.workers)
+    extraction_cache = None if args.no_extraction_cache else ExtractionCache()
+
+    start = time.perf_counter()
+    totals = {"pages": 0, "cards": 0, "failed": 0, "skipped": 0}
+    for pdf_path in find_pdfs(args.directory):
+        stats = convert_pdf(pdf_path, actions, client, args, extraction_cache)
+        for key in totals:
+            totals[key] += stats[key]
+    elapsed = time.perf_counter() - start
+
+    usage = mistral_config.token_usage
+    cache = actions.cache.stats()
+    print(f"\n{totals['pages']} pages, {totals['cards']} cards, {totals['failed']} failed pages, "
+          f"{totals['skipped']} pages skipped by triage in {elapsed:.1f}s")
+    print(f"{totals['pages'] / elapsed:.2f} pages/s, {totals['cards'] / elapsed:.2f} cards/s")
+    print(f"Tokens: {usage['prompt_tokens']} prompt, {usage['completion_tokens']} completion, "
+          f"{usage['total_tokens']} total; cache {cache['hits']} hits, {cache['misses']} misses")
+    counts = {}
+    for (name, _), value in metrics.counters().items():
+        counts[name] = counts.get(name, 0) + value
+    if counts.get("model_timeouts") or counts.get("hedged_requests"):
+        print(f"Request policy: {counts.get('model_timeouts', 0)} timeouts, "
+              f"{counts.get('hedged_requests', 0)} hedged requests, {counts.get('model_fallbacks', 0)} fallbacks")
+    if metrics.counter("split_pages"):
+        print(f"{metrics.counter('split_pages')} long pages sent in {metrics.counter('split_parts')} parts, "
+              f"{metrics.counter('truncated_responses')} truncated answers")
+    for stage, values in sorted(metrics.stages().items()):
+        print(f"  {stage:<20} {values['count']:>6} calls, {values['sum']:8.1f}s total, "
+              f"{values['p95'] * 1000:8.1f} ms p95")
+    if args.metrics_out:
+        metrics.write(args.metrics_out)
+        print(f"Metrics written to {args.metrics_out}")
+
+
+if __name__ == "__main__":
+    main()
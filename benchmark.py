@@ -0,0 +1,1429 @@
+# benchmark.py
+# -*- coding: utf-8 -*-
+"""
+Local benchmarks for the PDF to Anki pipeline. Nothing here talks to Mistral or Anki.
+
+Usage:
+    python benchmark.py extraction [--pages 500] [--window 10]
+    python benchmark.py generation [--pages 40] [--latency 0.5] [--workers 1 2 4 8] [--rps 5]
+    python benchmark.py packing [--pages 40] [--budget 2000]
+    python benchmark.py parsing [--corpus DIR] [--repeat 20]
+    python benchmark.py streaming [--cards 12] [--latency 20]
+    python benchmark.py anki [--pages 40] [--cards-per-page 8] [--chunk-size 50]
+    python benchmark.py rendering [--pages 10 50 100] [--cards-per-page 4]
+    python benchmark.py rasterization [--pages 120] [--workers 1 2 4 8] [--dpi 150]
+    python benchmark.py extraction-cache [--pages 200]
+    python benchmark.py triage [--slides 300]
+    python benchmark.py language [--threshold 0.8]
+    python benchmark.py client-pool [--requests 200] [--http]
+    python benchmark.py boilerplate [--pages 120]
+    python benchmark.py duplicates [--notes 20000] [--checks 2000]
+    python benchmark.py splitting [--pages 30] [--budget 1500] [--max-output 1024]
+    python benchmark.py policy [--requests 300] [--slow-share 0.05] [--error-share 0.05] [--deadline 1.0]
+    python benchmark.py jobs [--pages 600] [--workers 8] [--latency 0.02] [--pack-tokens 0]
+"""
+import argparse
+import json
+import os
+import random
+import re
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+
+import fitz  # PyMuPDF
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def make_synthetic_pdf(path, pages=500):
+    doc = fitz.open()
+    for i in range(pages):
+        page = doc.new_page()
+        page.insert_text((72, 72), f"Lecture 1 - Slide {i + 1}", fontsize=24)
+        body = "\n".join(f"Bullet point {j} on slide {i + 1}: aldosterone, renin, K+ secretion" for j in range(12))
+        page.insert_text((72, 120), body, fontsize=11)
+        page.draw_rect(fitz.Rect(72, 400, 520, 700), color=(0, 0, 1), fill=(0.8, 0.9, 1))
+    doc.save(path)
+    doc.close()
+
+
+def peak_rss_mb():
+    if resource is None:
+        import psutil
+        info = psutil.Process().memory_info()
+        return getattr(info, "peak_wset", info.rss) / 1024 / 1024
+    # ru_maxrss is in KB on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def eager_extract(file_path):
+    # The extraction pass AppView.extract_pdf_data used to run on every upload
+    doc = fitz.open(file_path)
+    page_count = len(doc)
+
+    extracted_data = {}
+    for i in range(page_count):
+        page = doc.load_page(i)
+        text = page.get_text()
+        pixmap = page.get_pixmap(dpi=150)
+        image_bytes = pixmap.tobytes(output='jpg', jpg_quality=100)
+        extracted_data[i] = {
+            "text": text,
+            "image": image_bytes
+        }
+
+    return extracted_data, page_count
+
+
+def run_extraction_child(mode, file_path, window):
+    from pdf_store import PdfPageStore
+
+    start = time.perf_counter()
+    if mode == "eager":
+        extracted_data, page_count = eager_extract(file_path)
+        first_preview = extracted_data[0]["image"]
+        first_preview_s = time.perf_counter() - start
+        for i in range(min(window, page_count)):
+            extracted_data[i]["image"]
+    else:
+        pages = PdfPageStore(file_path)
+        first_preview = pages.image(0)
+        first_preview_s = time.perf_counter() - start
+        for i in pages.page_range(1, window):
+            pages.text(i)
+            pages.image(i)
+    window_s = time.perf_counter() - start
+
+    print(json.dumps({
+        "mode": mode,
+        "first_preview_s": round(first_preview_s, 4),
+        "window_s": round(window_s, 4),
+        "peak_rss_mb": round(peak_rss_mb(), 1),
+        "first_preview_bytes": len(first_preview),
+    }))
+
+
+def bench_extraction(args):
+    with tempfile.TemporaryDirectory() as tmp:
+        file_path = os.path.join(tmp, "synthetic.pdf")
+        make_synthetic_pdf(file_path, args.pages)
+        print(f"Synthetic PDF: {args.pages} pages, window of {args.window} pages")
+
+        # Each mode runs in a fresh interpreter so peak RSS is not shared
+        for mode in ("eager", "lazy"):
+            output = subprocess.run(
+                [sys.executable, os.path.abspath(__file__), "_extraction-child", mode, file_path, str(args.window)],
+                capture_output=True, text=True, check=True).stdout
+            result = json.loads(output.strip().splitlines()[-1])
+            print(f"{mode:>6}: first preview {result['first_preview_s']:.3f}s, "
+                  f"window {result['window_s']:.3f}s, peak RSS {result['peak_rss_mb']:.1f} MB")
+
+
+STUB_RESPONSE = json.dumps({"flashcards": [
+    {"front": "{{c1::Primary}} hyperaldosteronism is characterized by high aldosterone and {{c2::low}} renin",
+     "back": "- This results in resistant hypertension"},
+    {"front": "Hyperaldosteronism {{c2::increases}} K⁺ secretion", "back": "- Increased Na+-K+ ATPase activity"},
+]})
+
+
+class StubChatClient:
+    """
+    Stands in for MistralClient: sleeps for a fixed latency and returns a canned response.
+    Tracks the highest number of requests that were in flight at the same time.
+    """
+
+    def __init__(self, latency=0.5, response=STUB_RESPONSE):
+        self.latency = latency
+        self.response = response
+        self.calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def chat(self, model, messages, temperature=None, **kwargs):
+        with self._lock:
+            self.calls += 1
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(self.latency)
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+        message = SimpleNamespace(role="assistant", content=self.response)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+class PackingStubClient(StubChatClient):
+    """
+    Answers like the model would for single and packed prompts, two cards per page.
+    Latency grows with the prompt so that shipping the prompt once per page is visible.
+    """
+
+    def __init__(self, latency=0.5, seconds_per_token=0.0002):
+        super().__init__(latency=latency)
+        self.seconds_per_token = seconds_per_token
+        self.tokens_sent = 0
+
+    def chat(self, model, messages, temperature=None, **kwargs):
+        from prompts import estimate_tokens
+
+        content = messages[-1].content
+        tokens = sum(estimate_tokens(message.content) for message in messages)
+        with self._lock:
+            self.calls += 1
+            self.tokens_sent += tokens
+        time.sleep(self.latency + tokens * self.seconds_per_token)
+
+        pages = [int(n) for n in re.findall(r"^--- Page (\d+) ---$", content, re.MULTILINE)] or [None]
+        cards = []
+        for page in pages:
+            for j in range(2):
+                card = {"front": f"Card {j + 1} about {{{{c1::renin}}}}", "back": "- aldosterone"}
+                if page is not None:
+                    card["page"] = page
+                cards.append(card)
+        message = SimpleNamespace(role="assistant", content=json.dumps({"flashcards": cards}))
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+def bench_packing(args):
+    import mistral_config
+    from actions import Actions
+    from rate_limiter import RateLimiter
+    from response_cache import ResponseCache
+
+    mistral_config.rate_limiter = RateLimiter()
+    actions = Actions(None, cache=ResponseCache(":memory:"))
+    # Sparse slides: a heading and a few bullets each
+    texts = {i: f"Slide {i + 1}\nRenin rises in secondary hyperaldosteronism\nK+ secretion increases"
+             for i in range(args.pages)}
+    print(f"{args.pages} sparse pages, {args.workers} workers")
+
+    for label, pack_tokens in (("unpacked", None), ("packed", args.budget)):
+        actions.cache.clear()
+        client = PackingStubClient(latency=args.latency)
+        start = time.perf_counter()
+        cards = 0
+        for page, response, error in actions.generate_pages(texts, "English", client, max_workers=args.workers,
+                                                            pack_tokens=pack_tokens):
+            if error is not None:
+                raise error
+            cards += len(actions.cleanup_response(response) or [])
+        elapsed = time.perf_counter() - start
+        print(f"{label:>9}: {client.calls} requests, {client.tokens_sent} tokens sent, {cards} cards, "
+              f"{client.tokens_sent / cards:.0f} tokens/card, {elapsed / cards * 1000:.1f} ms/card")
+
+
+def legacy_cleanup_response(text):
+    # The regex chain Actions.cleanup_response used before the single-pass parser
+    def escape_inner_brackets(match_obj):
+        return match_obj.group(0).replace('[', '\\[').replace(']', '\\]')
+
+    def replace_inner_double_quotes(match_obj):
+        inner_text = match_obj.group(0)
+        for match in re.findall(r'(:\s*)("[^"]*")', inner_text):
+            inner_text = inner_text.replace(match[1], match[1].replace('"', "'"))
+        return inner_text
+
+    try:
+        prefix = 'flashcard_function('
+        if text.startswith(prefix):
+            text = text[len(prefix):-1]
+            json_strs = text.strip().split('\n})\n')
+            json_strs = [text + '}' if not text.endswith('}') else text for text in json_strs]
+            json_strs = ['{' + text if not text.startswith('{') else text for text in json_strs]
+            text = json_strs[0]
+
+        text = re.sub(r'(?<=\[)[^\[\]]*(?=\])', escape_inner_brackets, text)
+        text = text.replace('“', "'").replace('”', "'").replace('„', "'")
+        text = re.sub(r'("(?:[^"\\]|\\.)*")', replace_inner_double_quotes, text)
+        return json.loads(text, strict=False)["flashcards"]
+    except Exception:
+        return None
+
+
+def synthetic_responses():
+    """Response shapes seen from the model: clean, prefixed, fenced, curly quotes, inner quotes, truncated, table."""
+    cards = [{"front": f"{{{{c1::Primary}}}} hyperaldosteronism case {j}: high aldosterone and {{{{c2::low}}}} renin",
+              "back": "- Resistant hypertension [see table 2]; renin is downregulated"} for j in range(8)]
+    clean = json.dumps({"flashcards": cards}, ensure_ascii=False, indent=2)
+    long = json.dumps({"flashcards": cards * 60}, ensure_ascii=False)
+    table = "| Statements | Explanation |\n|---|---|\n" + "".join(f"| {c['front']} | {c['back']} |\n" for c in cards)
+    return {
+        "clean": clean,
+        "function_prefix": "flashcard_function(" + clean + ")",
+        "code_fence": "```json\n" + clean + "\n```",
+        "curly_quotes": clean.replace('"', "“", 1).replace('"front"', "“front”"),
+        "inner_quotes": clean.replace("Resistant hypertension", 'So-called "resistant", often "refractory" hypertension'),
+        "truncated": clean[:len(clean) * 2 // 3],
+        "table": table,
+        "long": long,
+    }
+
+
+def bench_parsing(args):
+    from response_parser import parse_flashcards
+
+    corpus = synthetic_responses()
+    if args.corpus:
+        for name in sorted(os.listdir(args.corpus)):
+            with open(os.path.join(args.corpus, name), encoding="utf-8") as f:
+                corpus[name] = f.read()
+    total_bytes = sum(len(text.encode("utf-8")) for text in corpus.values())
+    print(f"{len(corpus)} responses, {total_bytes / 1024:.0f} KB, {args.repeat} rounds")
+
+    parsers = {
+        "legacy": lambda text: legacy_cleanup_response(text) or [],
+        "single-pass": lambda text: parse_flashcards(text).cards,
+    }
+    for label, parse in parsers.items():
+        recovered = {name: len(parse(text)) for name, text in corpus.items()}
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            for text in corpus.values():
+                parse(text)
+        elapsed = time.perf_counter() - start
+        ok = sum(1 for count in recovered.values() if count)
+        print(f"{label:>12}: {total_bytes * args.repeat / elapsed / 1024 / 1024:.2f} MB/s, "
+              f"recovered {ok}/{len(corpus)} responses, {sum(recovered.values())} cards")
+        for name, count in recovered.items():
+            print(f"{'':>14}{name}: {count} cards")
+
+
+class StreamingStubClient(StubChatClient):
+    """Emits the canned response in small pieces spread evenly over the latency, like a streamed completion."""
+
+    def __init__(self, latency=20.0, response=STUB_RESPONSE, chunk_size=16):
+        super().__init__(latency=latency, response=response)
+        self.chunk_size = chunk_size
+
+    def chat_stream(self, model, messages, temperature=None, **kwargs):
+        pieces = [self.response[i:i + self.chunk_size] for i in range(0, len(self.response), self.chunk_size)]
+        for piece in pieces:
+            time.sleep(self.latency / len(pieces))
+            delta = SimpleNamespace(role="assistant", content=piece)
+            yield SimpleNamespace(choices=[SimpleNamespace(delta=delta)], usage=None)
+
+
+def bench_streaming(args):
+    import mistral_config
+    from actions import Actions
+    from rate_limiter import RateLimiter
+    from response_cache import ResponseCache
+
+    mistral_config.rate_limiter = RateLimiter()
+    actions = Actions(None, cache=ResponseCache(":memory:"))
+    response = json.dumps({"flashcards": [
+        {"front": f"Statement {j} about {{{{c1::renin}}}} and {{{{c2::aldosterone}}}}",
+         "back": "- Explanation with enough words to take a while to generate " * 3} for j in range(args.cards)]})
+    client = StreamingStubClient(latency=args.latency, response=response)
+    text = "Secondary hyperaldosteronism"
+    print(f"{args.cards} cards, {args.latency}s completion")
+
+    start = time.perf_counter()
+    actions.request_flashcards(client, text, "English", use_cache=False)
+    blocking = time.perf_counter() - start
+    print(f"   blocking: first card {blocking:.2f}s, all cards {blocking:.2f}s")
+
+    arrivals = []
+    start = time.perf_counter()
+    actions.stream_flashcards(client, text, "English", on_card=lambda card: arrivals.append(time.perf_counter() - start),
+                              use_cache=False)
+    total = time.perf_counter() - start
+    print(f"  streaming: first card {arrivals[0]:.2f}s, all cards {total:.2f}s, {len(arrivals)} cards")
+
+
+class FakeAnkiConnect:
+    """
+    In-process AnkiConnect stand-in: keeps notes and media in memory, rejects duplicate
+    fronts like allowDuplicate=False does and counts round trips and uploaded bytes.
+    """
+
+    def __init__(self, latency=0.0):
+        self.latency = latency
+        self.notes = {}
+        self.media = {}
+        self.requests = 0
+        self.bytes_received = 0
+        self._lock = threading.RLock()
+
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            # Keep-alive like AnkiConnect's HTTP/1.1 server
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers["Content-Length"]))
+                with fake._lock:
+                    fake.requests += 1
+                    fake.bytes_received += len(body)
+                if fake.latency:
+                    time.sleep(fake.latency)
+                payload = json.loads(body)
+                try:
+                    response = {"result": fake.handle(payload), "error": None}
+                except Exception as e:
+                    response = {"result": None, "error": str(e)}
+                data = json.dumps(response).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def _add(self, note):
+        front = note["fields"]["Text"]
+        if front in self.notes:
+            return None
+        self.notes[front] = note
+        for picture in note.get("picture") or []:
+            self.media[picture["filename"]] = picture["data"]
+        return len(self.notes)
+
+    def handle(self, payload):
+        action = payload["action"]
+        params = payload.get("params", {})
+        with self._lock:
+            if action == "multi":
+                return [{"result": self.handle(sub), "error": None} for sub in params["actions"]]
+            if action == "storeMediaFile":
+                self.media[params["filename"]] = params["data"]
+                return params["filename"]
+            if action == "canAddNotesWithErrorDetail":
+                return [{"canAdd": False, "error": "cannot create note because it is a duplicate"}
+                        if note["fields"]["Text"] in self.notes else {"canAdd": True}
+                        for note in params["notes"]]
+            if action == "addNotes":
+                return [self._add(note) for note in params["notes"]]
+            if action == "addNote":
+                return self._add(params["note"])
+            if action == "deckNames":
+                return ["Default"]
+            if action == "modelNames":
+                return ["AnKingOverhaul"]
+            if action == "requestPermission":
+                return {"permission": "granted"}
+            if action == "version":
+                return 6
+        raise ValueError(f"unsupported action {action}")
+
+
+def bench_anki(args):
+    import base64
+    import anki_export
+
+    image = os.urandom(args.image_kb * 1024)
+    pages = {page: [(f"Page {page + 1} card {j}: {{{{c1::renin}}}}", "- aldosterone") for j in range(args.cards_per_page)]
+             for page in range(args.pages)}
+    cards = args.pages * args.cards_per_page
+    print(f"{cards} cards on {args.pages} pages, {args.image_kb} KB page images, {args.latency * 1000:.0f} ms per request")
+
+    # Before: one addNotes per page, the page image inlined as a picture on every card
+    fake = FakeAnkiConnect(latency=args.latency)
+    start = time.perf_counter()
+    for page, page_cards in pages.items():
+        notes = []
+        for front, back in page_cards:
+            note = anki_export.make_note("Default", front, back, ["lecture"])
+            note["picture"] = [{"data": base64.b64encode(image).decode("utf-8"),
+                                "filename": f"pdf-anki-{page}-{front}.jpg", "fields": []}]
+            notes.append(note)
+        anki_export.post(anki_export.request("addNotes", notes=notes), url=fake.url)
+    elapsed = time.perf_counter() - start
+    print(f"  per page: {fake.requests} requests, {fake.bytes_received / 1024 / 1024:.1f} MB sent, "
+          f"{len(fake.media)} media files, {elapsed:.2f}s")
+    fake.close()
+
+    # After: chunked multi batches, every page image stored once
+    fake = FakeAnkiConnect(latency=args.latency)
+    notes = []
+    media = {}
+    for page, page_cards in pages.items():
+        filename = anki_export.page_image_filename("lecture.pdf", page)
+        media[filename] = image
+        notes.extend(anki_export.make_note("Default", front, back, ["lecture"], filename) for front, back in page_cards)
+    batches = anki_export.build_batches(notes, media, args.chunk_size)
+
+    start = time.perf_counter()
+    summaries = anki_export.push(batches, send=lambda payload: anki_export.post(payload, url=fake.url))
+    elapsed = time.perf_counter() - start
+    counts = anki_export.total(summaries)
+    print(f"   batched: {fake.requests} requests, {fake.bytes_received / 1024 / 1024:.1f} MB sent, "
+          f"{len(fake.media)} media files, {elapsed:.2f}s, {counts['added']} added")
+
+    # Pushing the same deck again only reports duplicates
+    summaries = anki_export.push(batches, send=lambda payload: anki_export.post(payload, url=fake.url))
+    counts = anki_export.total(summaries)
+    print(f"   re-push: {counts['added']} added, {counts['duplicates']} duplicates, {counts['failed']} failed")
+    fake.close()
+
+    # Same batches through the pooled server-side client, plus a burst of small requests
+    from anki_connect import AnkiConnectClient
+
+    fake = FakeAnkiConnect(latency=args.latency)
+    client = AnkiConnectClient(fake.url)
+    start = time.perf_counter()
+    summaries = anki_export.push(batches, send=client.send)
+    for _ in range(args.pages):
+        client.get_decks()
+    elapsed = time.perf_counter() - start
+    counts = anki_export.total(summaries)
+    print(f"    pooled: {fake.requests} requests over {client.connections_opened} connections, {elapsed:.2f}s, "
+          f"{counts['added']} added")
+    client.close()
+    fake.close()
+
+
+RENDER_SCRIPT = """
+import json
+import sys
+sys.path.insert(0, {root!r})
+import streamlit as st
+from actions import Actions
+from app_view import AppView
+from session_store import new_document
+
+PAGES = {pages}
+st.session_state.setdefault("temp_file_path", {pdf!r})
+st.session_state.setdefault("API_KEY", "stub")
+if "document" not in st.session_state:
+    document = new_document("synthetic.pdf")
+    for i in range(PAGES):
+        cards = [{{"front": f"Page {{i + 1}} card {{j}}: {{{{{{{{c1::renin}}}}}}}}", "back": "- aldosterone"}}
+                 for j in range({cards})]
+        st.session_state[f"flashcards_{{i}}"] = cards
+        document.set_cards(i, cards)
+
+view = AppView(Actions(None))
+pages = view.extract_pdf_data(st.session_state["temp_file_path"])
+if {legacy}:
+    # Rendering before pagination and fragments: preview plus every page with its cards
+    st.markdown("**Preview:**")
+    for i in range(PAGES):
+        st.image(pages.image(i), caption=f"Page {{i + 1}}")
+    for i in range(PAGES):
+        col1, col2 = st.columns([0.7, 0.3])
+        with col1:
+            st.image(pages.image(i), caption=f"Page {{i + 1}}")
+        with col2:
+            flashcards = json.loads(json.dumps(st.session_state[f"flashcards_{{i}}"]))
+            for j in range(len(flashcards)):
+                st.session_state.setdefault(f"fc_active_{{i, j}}", True)
+                st.checkbox("Active", key=f"fc_active_{{i, j}}")
+                st.text_area("Front", key=f"fc_front_{{i, j}}", value=flashcards[j]["front"], height=100)
+                st.text_area("Back", key=f"fc_back_{{i, j}}", value=flashcards[j]["back"], height=100)
+                st.text_input("Tags", key=f"fc_tags_{{i, j}}", value="")
+                st.button("Add to Anki", key=f"add_{{i, j}}")
+else:
+    view.render_flashcards(range(PAGES))
+"""
+
+
+def bench_rendering(args):
+    from streamlit.testing.v1 import AppTest
+
+    root = os.path.dirname(os.path.abspath(__file__))
+    os.environ.setdefault("PDF_ANKI_CACHE_DIR", tempfile.mkdtemp())
+    with tempfile.TemporaryDirectory() as tmp:
+        pdf = os.path.join(tmp, "synthetic.pdf")
+        make_synthetic_pdf(pdf, pages=max(args.pages))
+        print(f"{args.cards_per_page} cards per page; times are script runs in Streamlit's AppTest harness")
+        print("(a fragment rerun in the browser only repeats one page, AppTest always reruns the script)")
+
+        for pages in args.pages:
+            for legacy in (True, False):
+                script = RENDER_SCRIPT.format(root=root, pdf=pdf, pages=pages, cards=args.cards_per_page,
+                                              legacy=legacy)
+                at = AppTest.from_string(script, default_timeout=600)
+                start = time.perf_counter()
+                at.run()
+                first = time.perf_counter() - start
+                if at.exception:
+                    raise RuntimeError(at.exception[0].message)
+
+                start = time.perf_counter()
+                at.checkbox(key="fc_active_(0, 0)" if legacy else "fc_active_0_0_1").uncheck().run()
+                toggle = time.perf_counter() - start
+
+                name = "all pages" if legacy else "paginated"
+                print(f"{pages:>4} pages, {name:>9}: first render {first * 1000:7.0f} ms, "
+                      f"checkbox toggle {toggle * 1000:7.0f} ms, {len(at.text_area)} text areas")
+
+
+def bench_rasterization(args):
+    from pdf_store import render_pages
+
+    with tempfile.TemporaryDirectory() as tmp:
+        pdf = os.path.join(tmp, "synthetic.pdf")
+        make_synthetic_pdf(pdf, pages=args.pages)
+        print(f"{args.pages} pages at {args.dpi} DPI, {os.cpu_count()} CPUs")
+
+        baseline = None
+        for workers in args.workers:
+            start = time.perf_counter()
+            first_page_s = None
+            total_bytes = 0
+            expected = 0
+            for page, image in render_pages(pdf, range(args.pages), workers=workers, chunk_size=args.chunk_size,
+                                            dpi=args.dpi, quality=args.quality):
+                if first_page_s is None:
+                    first_page_s = time.perf_counter() - start
+                if page != expected:
+                    raise RuntimeError(f"page {page} arrived out of order, expected {expected}")
+                expected += 1
+                total_bytes += len(image)
+            elapsed = time.perf_counter() - start
+            baseline = baseline or elapsed
+            print(f"{workers:>3} workers: {elapsed:.2f}s, {args.pages / elapsed:.1f} pages/s, "
+                  f"speedup {baseline / elapsed:.2f}x, first page {first_page_s:.2f}s, "
+                  f"{total_bytes / 1024 / 1024:.1f} MB")
+
+
+def bench_extraction_cache(args):
+    from extraction_cache import ExtractionCache
+    from pdf_store import PdfPageStore
+
+    with tempfile.TemporaryDirectory() as tmp:
+        pdf = os.path.join(tmp, "synthetic.pdf")
+        make_synthetic_pdf(pdf, pages=args.pages)
+        with open(pdf, "rb") as f:
+            data = f.read()
+        cache = ExtractionCache(os.path.join(tmp, "cache"))
+        print(f"{args.pages} pages: text, thumbnail and export image of every page")
+
+        for run in ("first open", "re-open"):
+            start = time.perf_counter()
+            doc_hash = cache.file_hash(data)
+            path = cache.store_pdf(data, doc_hash)
+            # A new store each time, like a new session or a restarted server
+            pages = PdfPageStore(path, cache=cache, doc_hash=doc_hash)
+            for i in range(pages.page_count):
+                pages.text(i)
+                pages.thumbnail(i)
+            for _ in pages.iter_export_images(range(pages.page_count), workers=1):
+                pass
+            elapsed = time.perf_counter() - start
+            pages.close()
+            stats = cache.stats()
+            print(f"{run:>10}: {elapsed * 1000:.0f} ms, cache {stats['hits']} hits, {stats['misses']} misses, "
+                  f"{stats['bytes'] / 1024 / 1024:.1f} MB")
+
+
+def synthetic_lecture(slides):
+    """Page texts of a lecture with a title slide, repeated agenda slides, incremental builds and blanks."""
+    texts = {0: "Renal Physiology\nLecture 3"}
+    agenda = "Agenda\n- Filtration and the glomerulus\n- Tubular reabsorption of sodium\n- Renin and aldosterone"
+    page = 1
+    topic = 0
+    while page < slides:
+        if topic % 10 == 0:
+            texts[page] = agenda
+            page += 1
+        bullets = [f"Topic {topic} point {j}: the collecting duct reabsorbs sodium under aldosterone control, "
+                   f"variant {topic * 7 + j}" for j in range(5)]
+        # Three builds of the same slide, one more bullet each
+        for shown in (3, 4, 5):
+            if page < slides:
+                texts[page] = "\n".join(bullets[:shown])
+                page += 1
+        if topic % 15 == 14 and page < slides:
+            texts[page] = ""
+            page += 1
+        topic += 1
+    return texts
+
+
+# Short slides: titles, and content slides made of capitalized names that must not be taken for titles
+TITLE_TEST_SET = [
+    (True, "Renal Physiology\nLecture 3"), (True, "Acid-Base Disorders"), (True, "Thank You"),
+    (True, "Pharmacology of the Heart, Part 2"), (True, "Endocrine Hypertension\nCase Discussion"),
+    (False, "Warfarin, Heparin, Apixaban"), (False, "Metoprolol; Bisoprolol; Carvedilol"),
+    (False, "• Cushing\n• Addison\n• Conn"), (False, "Cushing\nAddison\nConn\nGraves"),
+    (False, "1. Kussmaul Breathing\n2. Cheyne-Stokes"), (False, "- Virchow Triad\n- Wells Score"),
+]
+
+
+def bench_triage(args):
+    from page_triage import TITLE, page_kind, summarize, triage_pages
+
+    texts = synthetic_lecture(args.slides)
+    start = time.perf_counter()
+    verdicts = triage_pages(texts)
+    elapsed = time.perf_counter() - start
+    counts = summarize(verdicts)
+    print(f"{len(texts)} slides: {len(verdicts)} model calls avoided, {len(texts) - len(verdicts)} sent, "
+          f"in {elapsed * 1000:.0f} ms")
+    print("  " + ", ".join(f"{count} {reason}" for reason, count in counts.items()))
+
+    titles = [text for is_title, text in TITLE_TEST_SET if is_title]
+    lists = [text for is_title, text in TITLE_TEST_SET if not is_title]
+    print(f"  short slides: {sum(page_kind(text) == TITLE for text in titles)} of {len(titles)} titles found, "
+          f"{sum(page_kind(text) == TITLE for text in lists)} of {len(lists)} name lists taken for titles")
+
+
+# Held-out sentences and slide bullets, none of them taken from the detector's reference texts
+LANGUAGE_TEST_SET = [
+    ("English", "The heart pumps blood through the arteries to every organ of the body."),
+    ("English", "Beta blockers lower the heart rate and reduce the oxygen demand of the myocardium"),
+    ("English", "Learning objectives\n- Describe the cardiac cycle\n- Explain the Frank-Starling law\n- Interpret an ECG"),
+    ("English", "Photosynthesis converts light energy into chemical energy stored in glucose."),
+    ("French", "Le cœur pompe le sang dans les artères vers tous les organes du corps."),
+    ("French", "Les bêtabloquants diminuent la fréquence cardiaque et réduisent les besoins en oxygène du myocarde"),
+    ("French", "Objectifs du cours\n- Décrire le cycle cardiaque\n- Expliquer la loi de Frank-Starling\n- Interpréter un ECG"),
+    ("French", "La photosynthèse transforme l'énergie lumineuse en énergie chimique stockée dans le glucose."),
+    ("German", "Das Herz pumpt das Blut durch die Arterien zu allen Organen des Körpers."),
+    ("German", "Betablocker senken die Herzfrequenz und verringern den Sauerstoffbedarf des Herzmuskels"),
+    ("German", "Lernziele\n- Den Herzzyklus beschreiben\n- Das Frank-Starling-Gesetz erklären\n- Ein EKG auswerten"),
+    ("German", "Bei der Photosynthese wird Lichtenergie in chemische Energie umgewandelt, die in Glukose gespeichert ist."),
+    ("Spanish", "El corazón bombea la sangre por las arterias hacia todos los órganos del cuerpo."),
+    ("Spanish", "Los betabloqueantes disminuyen la frecuencia cardíaca y reducen la demanda de oxígeno del miocardio"),
+    ("Spanish", "Objetivos de la clase\n- Describir el ciclo cardíaco\n- Explicar la ley de Frank-Starling\n- Interpretar un ECG"),
+    ("Spanish", "La fotosíntesis convierte la energía luminosa en energía química almacenada en la glucosa."),
+    ("Portuguese", "O coração bombeia o sangue pelas artérias para todos os órgãos do corpo."),
+    ("Portuguese", "Os betabloqueadores diminuem a frequência cardíaca e reduzem a necessidade de oxigênio do miocárdio"),
+    ("Portuguese", "Objetivos da aula\n- Descrever o ciclo cardíaco\n- Explicar a lei de Frank-Starling\n- Interpretar um ECG"),
+    ("Portuguese", "A fotossíntese converte a energia luminosa em energia química armazenada na glicose."),
+    ("Polish", "Serce pompuje krew przez tętnice do wszystkich narządów ciała."),
+    ("Polish", "Beta-blokery zmniejszają częstość akcji serca i obniżają zapotrzebowanie mięśnia sercowego na tlen"),
+    ("Polish", "Cele wykładu\n- Opisać cykl pracy serca\n- Wyjaśnić prawo Franka-Starlinga\n- Zinterpretować EKG"),
+    ("Polish", "Fotosynteza przekształca energię światła w energię chemiczną zmagazynowaną w glukozie."),
+    ("Romanian", "Inima pompează sângele prin artere către toate organele corpului."),
+    ("Romanian", "Betablocantele scad frecvența cardiacă și reduc necesarul de oxigen al miocardului"),
+    ("Romanian", "Obiectivele cursului\n- Descrierea ciclului cardiac\n- Explicarea legii Frank-Starling\n- Interpretarea unui ECG"),
+    ("Romanian", "Fotosinteza transformă energia luminoasă în energie chimică stocată în glucoză."),
+    ("Russian", "Сердце перекачивает кровь по артериям ко всем органам тела."),
+    ("Russian", "Бета-блокаторы снижают частоту сердечных сокращений и уменьшают потребность миокарда в кислороде"),
+    ("Russian", "Цели занятия\n- Описать сердечный цикл\n- Объяснить закон Франка-Старлинга\n- Интерпретировать ЭКГ"),
+    ("Russian", "Фотосинтез превращает энергию света в химическую энергию, запасённую в глюкозе."),
+    ("Arabic", "يضخ القلب الدم عبر الشرايين إلى جميع أعضاء الجسم."),
+    ("Arabic", "تخفض حاصرات بيتا معدل ضربات القلب وتقلل حاجة عضلة القلب إلى الأكسجين"),
+    ("Arabic", "أهداف المحاضرة\n- وصف الدورة القلبية\n- شرح قانون فرانك ستارلينج\n- تفسير تخطيط القلب"),
+    ("Arabic", "يحول التمثيل الضوئي طاقة الضوء إلى طاقة كيميائية مخزنة في الجلوكوز."),
+    ("Urdu", "دل خون کو شریانوں کے ذریعے جسم کے تمام اعضاء تک پمپ کرتا ہے۔"),
+    ("Urdu", "بیٹا بلاکرز دل کی دھڑکن کو کم کرتے ہیں اور دل کے پٹھوں کی آکسیجن کی ضرورت گھٹاتے ہیں"),
+    ("Urdu", "لیکچر کے مقاصد\n- دل کے چکر کی وضاحت کریں\n- فرینک اسٹارلنگ قانون کو سمجھائیں\n- ای سی جی کی تشریح کریں"),
+    ("Urdu", "ضیائی تالیف روشنی کی توانائی کو کیمیائی توانائی میں بدلتی ہے جو گلوکوز میں ذخیرہ ہوتی ہے۔"),
+    ("Hindi", "हृदय धमनियों के माध्यम से शरीर के सभी अंगों तक रक्त पंप करता है।"),
+    ("Hindi", "बीटा ब्लॉकर हृदय गति को कम करते हैं और हृदय की मांसपेशियों की ऑक्सीजन की आवश्यकता घटाते हैं"),
+    ("Hindi", "व्याख्यान के उद्देश्य\n- हृदय चक्र का वर्णन करें\n- फ्रैंक-स्टार्लिंग नियम को समझाएँ\n- ईसीजी की व्याख्या करें"),
+    ("Hindi", "प्रकाश संश्लेषण प्रकाश ऊर्जा को रासायनिक ऊर्जा में बदलता है जो ग्लूकोज में संग्रहित होती है।"),
+    ("Bengali", "হৃৎপিণ্ড ধমনীর মাধ্যমে শরীরের সব অঙ্গে রক্ত পাম্প করে।"),
+    ("Bengali", "বিটা ব্লকার হৃৎস্পন্দনের হার কমায় এবং হৃৎপেশির অক্সিজেনের চাহিদা হ্রাস করে"),
+    ("Bengali", "বক্তৃতার উদ্দেশ্য\n- হৃদচক্র বর্ণনা করা\n- ফ্র্যাঙ্ক-স্টারলিং সূত্র ব্যাখ্যা করা\n- ইসিজি বিশ্লেষণ করা"),
+    ("Bengali", "সালোকসংশ্লেষণ আলোর শক্তিকে রাসায়নিক শক্তিতে রূপান্তর করে যা গ্লুকোজে জমা থাকে।"),
+    ("Mandarin Chinese", "心脏通过动脉把血液输送到全身各个器官。"),
+    ("Mandarin Chinese", "β受体阻滞剂可以降低心率，减少心肌的耗氧量"),
+    ("Mandarin Chinese", "本课目标\n- 描述心动周期\n- 解释弗兰克-斯塔林定律\n- 解读心电图"),
+    ("Mandarin Chinese", "光合作用把光能转化为储存在葡萄糖中的化学能。"),
+]
+
+
+def bench_language(args):
+    from language_detect import detect_language
+
+    # Single sentences and bullets, plus whole "pages": every text of a language joined
+    cases = list(LANGUAGE_TEST_SET)
+    for language in dict(LANGUAGE_TEST_SET):
+        cases.append((language, "\n".join(text for lang, text in LANGUAGE_TEST_SET if lang == language)))
+
+    timings = []
+    correct = confident = confident_correct = 0
+    for _ in range(args.repeat):
+        timings.extend(measure(lambda text=text: detect_language(text)) for _, text in cases)
+    for language, text in cases:
+        guess, confidence = detect_language(text)
+        correct += guess == language
+        if confidence >= args.threshold:
+            confident += 1
+            confident_correct += guess == language
+        elif args.verbose:
+            print(f"  fallback: {language} guessed as {guess} ({confidence:.2f}): {text[:40]!r}")
+
+    timings.sort()
+    print(f"{len(cases)} texts in {len(dict(LANGUAGE_TEST_SET))} languages")
+    print(f"  accuracy:       {correct / len(cases):.1%}")
+    print(f"  answered local: {confident} ({confident / len(cases):.0%}), "
+          f"{confident_correct / max(1, confident):.1%} of them correct")
+    print(f"  API fallbacks:  {len(cases) - confident} at threshold {args.threshold}")
+    print(f"  latency:        {timings[len(timings) // 2] * 1000:.2f} ms median, "
+          f"{timings[int(len(timings) * 0.95)] * 1000:.2f} ms p95")
+
+
+def measure(func):
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+class StubMistralServer:
+    """
+    Local stand-in for the Mistral chat completions endpoint, over HTTPS with a
+    self-signed certificate when openssl is available. Counts the connections it
+    accepts, so reused connections show up as fewer handshakes.
+
+    Injects faults on request: slow_share of the requests take slow_latency (except
+    for fast_models) and error_share of them fail with error_status.
+    """
+
+    def __init__(self, latency=0.0, https=True, slow_share=0.0, slow_latency=0.0, error_share=0.0,
+                 error_status=503, fast_models=(), seed=1):
+        self.latency = latency
+        self.slow_share = slow_share
+        self.slow_latency = slow_latency
+        self.error_share = error_share
+        self.error_status = error_status
+        self.fast_models = set(fast_models)
+        self.random = random.Random(seed)
+        self.connections = 0
+        self.requests = 0
+        self._lock = threading.Lock()
+        self.cert_dir = None
+
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def setup(self):
+                super().setup()
+                with stub._lock:
+                    stub.connections += 1
+
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                with stub._lock:
+                    stub.requests += 1
+                    roll = stub.random.random()
+                if roll < stub.error_share:
+                    self.send_error_json()
+                    return
+                slow = roll < stub.error_share + stub.slow_share and body.get("model") not in stub.fast_models
+                latency = stub.slow_latency if slow else stub.latency
+                if latency:
+                    time.sleep(latency)
+                if body.get("stream"):
+                    self.send_stream()
+                    return
+                data = json.dumps({
+                    "id": "stub", "object": "chat.completion", "created": 0, "model": "stub",
+                    "choices": [{"index": 0, "message": {"role": "assistant", "content": "English"},
+                                 "finish_reason": "stop"}],
+                    "usage": {"prompt_tokens": 10, "completion_tokens": 1, "total_tokens": 11},
+                }).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def send_stream(self):
+                # The whole answer in two chunks once the latency is over, a stall comes before the first
+                events = [{"id": "stub", "object": "chat.completion.chunk", "created": 0, "model": "stub",
+                           "choices": [{"index": 0, "delta": {"role": "assistant", "content": content},
+                                        "finish_reason": None}]} for content in ("Eng", "lish")]
+                data = "".join(f"data: {json.dumps(event)}\n\n" for event in events) + "data: [DONE]\n\n"
+                data = data.encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/event-stream")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def send_error_json(self):
+                data = json.dumps({"message": "injected error"}).encode("utf-8")
+                self.send_response(stub.error_status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        scheme = "http"
+        if https:
+            cert = self._self_signed_cert()
+            if cert is not None:
+                import ssl
+                context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+                context.load_cert_chain(*cert)
+                self.server.socket = context.wrap_socket(self.server.socket, server_side=True)
+                # httpx trusts SSL_CERT_FILE when it builds its SSL context
+                os.environ["SSL_CERT_FILE"] = cert[0]
+                scheme = "https"
+        self.url = f"{scheme}://127.0.0.1:{self.server.server_address[1]}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def _self_signed_cert(self):
+        self.cert_dir = tempfile.mkdtemp(prefix="stub_mistral_")
+        cert, key = os.path.join(self.cert_dir, "cert.pem"), os.path.join(self.cert_dir, "key.pem")
+        try:
+            subprocess.run(["openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "1",
+                            "-subj", "/CN=127.0.0.1", "-addext", "subjectAltName=IP:127.0.0.1",
+                            "-keyout", key, "-out", cert], check=True, capture_output=True)
+        except (OSError, subprocess.CalledProcessError):
+            print("openssl not available, the stub server uses plain HTTP")
+            return None
+        return cert, key
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def bench_client_pool(args):
+    import mistral_config
+    from concurrent.futures import ThreadPoolExecutor
+    from rate_limiter import RateLimiter
+
+    mistral_config.rate_limiter = RateLimiter(requests_per_second=None)
+    server = StubMistralServer(latency=args.latency, https=not args.http)
+    messages = [mistral_config.create_chat_message("user", "Return in one word the language of this text: Niere")]
+    print(f"{args.requests} requests against {server.url}, stub latency {args.latency * 1000:.0f} ms")
+
+    def request(get_client):
+        start = time.perf_counter()
+        mistral_config.chat(get_client(), model="stub", messages=messages)
+        return time.perf_counter() - start
+
+    def run(label, get_client, workers):
+        connections = server.connections
+        start = time.perf_counter()
+        if workers == 1:
+            timings = [request(get_client) for _ in range(args.requests)]
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                timings = list(pool.map(lambda _: request(get_client), range(args.requests)))
+        elapsed = time.perf_counter() - start
+        timings.sort()
+        print(f"  {label:<28} {timings[len(timings) // 2] * 1000:7.1f} ms median, "
+              f"{timings[int(len(timings) * 0.95)] * 1000:7.1f} ms p95, {args.requests / elapsed:6.1f} req/s, "
+              f"{server.connections - connections:>4} connections")
+
+    try:
+        run("new client per request", lambda: mistral_config.create_mistral_client("key", endpoint=server.url), 1)
+        run("pooled client", lambda: mistral_config.get_mistral_client("key", endpoint=server.url), 1)
+        for workers in args.workers:
+            run(f"new client, {workers} threads",
+                lambda: mistral_config.create_mistral_client("key", endpoint=server.url), workers)
+            run(f"pooled client, {workers} threads",
+                lambda: mistral_config.get_mistral_client("key", pool_size=workers, endpoint=server.url), workers)
+    finally:
+        mistral_config.close_clients()
+        server.close()
+
+
+def bench_policy(args):
+    import mistral_config
+    from concurrent.futures import ThreadPoolExecutor
+    from metrics import metrics
+    from rate_limiter import RateLimiter
+
+    mistral_config.rate_limiter = RateLimiter(requests_per_second=None)
+    server = StubMistralServer(latency=args.latency, slow_share=args.slow_share, slow_latency=args.slow_latency,
+                               error_share=args.error_share, fast_models=["stub-small"])
+    messages = [mistral_config.create_chat_message("user", "Return in one word the language of this text: Niere")]
+    # Abandoned requests keep their connection until they finish, so the pool needs room for them
+    client = mistral_config.get_mistral_client("key", pool_size=4 * args.workers, endpoint=server.url)
+    print(f"{args.requests} requests, {args.latency * 1000:.0f} ms normally, {args.slow_share:.0%} stuck for "
+          f"{args.slow_latency:.0f}s, {args.error_share:.0%} failing with 503")
+
+    def legacy_chat():
+        # The loop request_flashcards had: no deadline, immediate retries
+        for retry in range(3):
+            try:
+                return mistral_config.chat(client, model="stub-large", messages=messages)
+            except Exception:
+                if retry == 2:
+                    raise
+
+    policy = mistral_config.RequestPolicy(deadline=args.deadline, total_deadline=4 * args.deadline,
+                                          base_delay=args.latency, hedge_min_samples=20,
+                                          min_hedge_delay=2 * args.latency,
+                                          fallback_models={"stub-large": "stub-small"})
+
+    def legacy_stream():
+        # The loop stream_flashcards had: the deadline was only checked when a chunk arrived
+        for retry in range(3):
+            try:
+                start = time.monotonic()
+                for _ in mistral_config.stream_chat(client, model="stub-large", messages=messages):
+                    if time.monotonic() - start > args.deadline:
+                        raise mistral_config.RequestTimeout("stub-large did not finish in time")
+                return
+            except Exception:
+                if retry == 2:
+                    raise
+
+    def policy_stream():
+        model = "stub-large"
+        for attempt in range(1, 4):
+            try:
+                for _ in policy.stream(client, model=model, messages=messages):
+                    pass
+                return
+            except Exception as e:
+                if attempt == 3 or not mistral_config.is_retryable_error(e):
+                    raise
+                model = policy.next_model(model, e)
+                metrics.count("model_retries")
+                time.sleep(policy.backoff_delay(attempt))
+
+    def run(label, request):
+        metrics.reset()
+
+        def timed(_):
+            start = time.perf_counter()
+            try:
+                request()
+                return time.perf_counter() - start, None
+            except Exception as e:
+                return time.perf_counter() - start, e
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.workers) as pool:
+            results = list(pool.map(timed, range(args.requests)))
+        elapsed = time.perf_counter() - start
+        timings = sorted(timing for timing, _ in results)
+        failures = sum(error is not None for _, error in results)
+        counts = {}
+        for (name, _), value in metrics.counters().items():
+            counts[name] = counts.get(name, 0) + value
+        print(f"  {label}: {elapsed:.1f}s total, {failures} failed")
+        print(f"    latency: {timings[len(timings) // 2] * 1000:.0f} ms median, "
+              f"{timings[int(len(timings) * 0.95)] * 1000:.0f} ms p95, "
+              f"{timings[int(len(timings) * 0.99)] * 1000:.0f} ms p99, {timings[-1] * 1000:.0f} ms max")
+        print(f"    {counts.get('model_errors', 0)} errors, {counts.get('model_retries', 0)} retries, "
+              f"{counts.get('model_timeouts', 0)} timeouts, {counts.get('model_fallbacks', 0)} fallbacks, "
+              f"{counts.get('hedged_requests', 0)} hedged ({metrics.counter('hedged_requests', result='won')} won)")
+
+    try:
+        run("retry loop without deadline", legacy_chat)
+        run("request policy", lambda: policy.chat(client, model="stub-large", messages=messages))
+        run("streamed, deadline checked per chunk", legacy_stream)
+        run("streamed through the request policy", policy_stream)
+    finally:
+        server.close()
+
+
+def bench_jobs(args):
+    from job_queue import DONE, JobQueue, JobWorkers
+
+    def wait_for(queue, pages, timeout=120):
+        deadline = time.perf_counter() + timeout
+        while time.perf_counter() < deadline:
+            if queue.progress("lecture", "English", "").get(DONE, 0) >= pages:
+                return True
+            time.sleep(0.01)
+        return False
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "jobs.sqlite3")
+        runs = {}
+        requests = []
+        lock = threading.Lock()
+        crashed = threading.Event()
+
+        def generate(client, texts, lang, split_tokens):
+            with lock:
+                requests.append(len(texts))
+                for text in texts.values():
+                    runs[text] = runs.get(text, 0) + 1
+            time.sleep(args.latency)
+            if client == "old" and crashed.is_set():
+                # The old process is gone: its jobs in flight never report back
+                threading.Event().wait()
+            return {page: json.dumps({"flashcards": [{"front": f"{{{{c1::{text}}}}}", "back": "-"}]})
+                    for page, text in texts.items()}
+
+        texts = {page: f"page {page}" for page in range(args.pages)}
+        queue = JobQueue(path)
+        start = time.perf_counter()
+        JobWorkers(queue, generate, workers=args.workers).submit("lecture", "English", "", texts, client="old",
+                                                                 pack_tokens=args.pack_tokens or None,
+                                                                 max_workers=args.workers)
+        queued_s = time.perf_counter() - start
+        wait_for(queue, args.pages // 2)
+
+        # A restart halfway: the old workers stop claiming and never report back, the new
+        # process finds the jobs that were running and queues them again
+        queue.claim = lambda batches: threading.Event().wait()
+        crashed.set()
+        time.sleep(2 * args.latency)
+        restarted = JobQueue(path)
+        restarted_at = restarted.progress("lecture", "English", "")
+        JobWorkers(restarted, generate, workers=args.workers).attach("lecture", "English", "", "new",
+                                                                   max_workers=args.workers)
+        finished = wait_for(restarted, args.pages)
+        elapsed = time.perf_counter() - start
+
+        results = restarted.results("lecture", "English", "")
+        print(f"{args.pages} pages, {args.workers} workers, {args.latency * 1000:.0f} ms per page")
+        print(f"  queued in {queued_s * 1000:.0f} ms, all done: {finished}, in {elapsed:.1f}s "
+              f"({args.pages * args.latency / args.workers:.1f}s of model time at {args.workers} in parallel)")
+        print(f"  restart after {restarted_at.get(DONE, 0)} pages: {restarted_at.get('queued', 0)} queued again, "
+              f"{sum(count > 1 for count in runs.values())} pages generated twice")
+        print(f"  results: {len(results)} pages, {len({row[0] for row in results})} distinct, "
+              f"in {len(requests)} requests")
+
+
+TOPICS = ["glomerular filtration", "proximal tubule", "loop of Henle", "distal tubule", "collecting duct",
+          "renin and angiotensin", "potassium balance", "acid-base handling", "water balance", "diuretics"]
+
+
+def make_lecture_pdf(path, pages=120):
+    """Slides with a course header, a footer with copyright and slide number, and hyphenated body text."""
+    doc = fitz.open()
+    for i in range(pages):
+        page = doc.new_page()
+        page.insert_text((72, 40), "NEPH 201 Renal Physiology - Prof. A. Example - Winter term 2024", fontsize=9)
+        topic = TOPICS[i % len(TOPICS)]
+        page.insert_text((72, 100), f"{topic.capitalize()}, part {i // len(TOPICS) + 1}", fontsize=20)
+        body = "\n".join(f"Point {j} on {topic}: aldosterone raises reabsorp-\ntion of sodium "
+                         f"in the collecting duct    (variant {i * 13 + j})" for j in range(6))
+        page.insert_text((72, 150), body, fontsize=11)
+        page.insert_text((72, 800), "(c) 2024 Example University - for enrolled students only - "
+                                    "do not distribute", fontsize=8)
+        page.insert_text((520, 800), f"{i + 1} / {pages}", fontsize=8)
+    doc.save(path)
+    doc.close()
+
+
+def bench_boilerplate(args):
+    from pdf_store import PdfPageStore
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "lecture.pdf")
+        make_lecture_pdf(path, args.pages)
+
+        start = time.perf_counter()
+        raw = PdfPageStore(path, strip_boilerplate=False)
+        raw_texts = [raw.text(i) for i in range(raw.page_count)]
+        raw_s = time.perf_counter() - start
+        start = time.perf_counter()
+        clean = PdfPageStore(path)
+        clean_texts = [clean.text(i) for i in range(clean.page_count)]
+        clean_s = time.perf_counter() - start
+
+        stats = clean.text_stats()
+        kept = all(f"Point {j} on {TOPICS[i % len(TOPICS)]}: aldosterone raises reabsorption" in clean_texts[i]
+                   for i in range(args.pages) for j in range(6))
+        leaked = sum("Example University" in text or "Prof. A. Example" in text for text in clean_texts)
+        print(f"{args.pages} slides, {stats['boilerplate_lines']} recurring lines found")
+        print(f"  input tokens: {stats['raw_tokens']} raw, {stats['tokens']} sent, "
+              f"{stats['saved_tokens']} saved ({stats['saved_tokens'] / stats['raw_tokens']:.0%})")
+        print(f"  extraction: {raw_s * 1000:.0f} ms raw, {clean_s * 1000:.0f} ms with the boilerplate pass")
+        print(f"  content kept: {kept}, pages still showing boilerplate: {leaked}")
+        print("  sample page before:\n" + "\n".join("    " + line for line in raw_texts[1].splitlines()[:4]))
+        print("  after:\n" + "\n".join("    " + line for line in clean_texts[1].splitlines()[:4]))
+        raw.close()
+        clean.close()
+
+
+def synthetic_deck(notes):
+    """Cloze fronts that differ in their subject, their fact and their cloze answer."""
+    organs = ["kidney", "liver", "heart", "lung", "spleen", "pancreas", "thyroid", "adrenal gland"]
+    hormones = ["aldosterone", "renin", "cortisol", "insulin", "glucagon", "thyroxine", "ADH", "ANP"]
+    levels = ["sodium", "potassium", "glucose", "water"]
+    settings = ["after a meal", "during sleep", "under stress", "in hypovolemia", "at rest", "during exercise",
+                "in pregnancy", "in the elderly"]
+    verbs = ["raises", "lowers", "stabilizes", "shifts", "buffers", "doubles", "halves", "restores"]
+    fronts = []
+    for i in range(notes):
+        combo = [i % 8, i // 8 % 8, i // 64 % 4, i // 256 % 8, i // 2048 % 8]
+        fronts.append(f"In the {organs[combo[0]]} {settings[combo[3]]}, {{{{c1::{hormones[combo[1]]}}}}} "
+                      f"{verbs[combo[4]]} the <b>{levels[combo[2]]}</b> level (case {i}).")
+    return fronts
+
+
+def rephrase(front):
+    return "<div>" + front.replace(" the ", " its ", 1).replace(".", "!") + "</div>"
+
+
+def bench_duplicates(args):
+    from duplicate_index import DuplicateIndex, EXACT
+
+    fronts = synthetic_deck(args.notes)
+    start = time.perf_counter()
+    index = DuplicateIndex()
+    for note_id, front in enumerate(fronts):
+        index.add(front, note_id)
+    seed_s = time.perf_counter() - start
+
+    step = max(1, args.notes // args.checks)
+    sample = fronts[::step][:args.checks]
+    exact = [index.check(front) for front in sample]
+    near = [index.check(rephrase(front)) for front in sample]
+    # Same sentence with another answer, and cards of a deck the index has never seen
+    other_answer = [index.check(front.replace("{{c1::", "{{c1::pro")) for front in sample]
+    new = [index.check(f"Which cells of the {front.split()[2]} secrete {{{{c1::{n}}}}}? See figure {n}.")
+           for n, front in enumerate(sample)]
+    timings = sorted(measure(lambda front=front: index.check(rephrase(front))) for front in sample)
+
+    print(f"{len(index)} notes indexed in {seed_s * 1000:.0f} ms ({seed_s / len(index) * 1e6:.0f} us/note)")
+    print(f"  exact copies caught:     {sum(m is not None and m.kind == EXACT for m in exact)}/{len(sample)}")
+    print(f"  rephrased copies caught: {sum(m is not None for m in near)}/{len(sample)}")
+    print(f"  other cloze answer flagged: {sum(m is not None for m in other_answer)}/{len(sample)}")
+    print(f"  new cards flagged:          {sum(m is not None for m in new)}/{len(new)}")
+    print(f"  check: {timings[len(timings) // 2] * 1000:.3f} ms median, "
+          f"{timings[int(len(timings) * 0.95)] * 1000:.3f} ms p95")
+
+
+class SplittingStubClient(StubChatClient):
+    """
+    Answers with one card per cards_every tokens of page text, at seconds_per_token per
+    completion token, and cuts the answer off after max_output tokens the way a model
+    with an output limit does, so long pages come back as truncated JSON.
+    """
+
+    def __init__(self, latency=0.2, seconds_per_token=0.001, max_output=1024, cards_every=60):
+        super().__init__(latency=latency)
+        self.seconds_per_token = seconds_per_token
+        self.max_output = max_output
+        self.cards_every = cards_every
+        self.tokens_sent = 0
+
+    def chat(self, model, messages, temperature=None, **kwargs):
+        from prompts import estimate_tokens
+
+        with self._lock:
+            self.calls += 1
+            self.tokens_sent += sum(estimate_tokens(message.content) for message in messages)
+        text = messages[-1].content.split("Text:\n", 1)[1]
+        facts = re.findall(r"fact (\d+)", text)
+        cards = [{"front": f"The collecting duct handles {{{{c1::fact {fact}}}}} under aldosterone control",
+                  "back": "- Principal cells, ENaC and ROMK"} for fact in facts[::max(1, self.cards_every // 15)]]
+        content = json.dumps({"flashcards": cards}, indent=1)
+        tokens = estimate_tokens(content)
+        if tokens > self.max_output:
+            content = content[:self.max_output * 4]
+            tokens = self.max_output
+        time.sleep(self.latency + tokens * self.seconds_per_token)
+        message = SimpleNamespace(role="assistant", content=content)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+def dense_pages(pages):
+    """Slides of a few bullets mixed with textbook pages of 2000 to 5000 tokens, every sentence a numbered fact."""
+    texts = {}
+    fact = 0
+    for page in range(pages):
+        sentences = 6 if page % 3 else 130 + page % 5 * 50
+        paragraphs = []
+        for start in range(0, sentences, 6):
+            paragraphs.append(" ".join(f"Sodium reabsorption in the collecting duct depends on fact {fact + n}, "
+                                       f"which aldosterone regulates." for n in range(start, min(sentences, start + 6))))
+        fact += sentences
+        texts[page] = "\n\n".join(paragraphs)
+    return texts
+
+
+def bench_splitting(args):
+    import mistral_config
+    from actions import Actions
+    from metrics import metrics
+    from prompts import estimate_tokens
+    from rate_limiter import RateLimiter
+    from response_cache import ResponseCache
+
+    mistral_config.rate_limiter = RateLimiter()
+    texts = dense_pages(args.pages)
+    facts = {page: len(re.findall(r"fact \d+", text)) for page, text in texts.items()}
+    sizes = sorted(estimate_tokens(text) for text in texts.values())
+    print(f"{args.pages} pages, {sizes[0]} to {sizes[-1]} tokens of text, model output cut at {args.max_output} tokens")
+
+    for label, budget in (("whole pages", None), (f"split at {args.budget}", args.budget)):
+        metrics.reset()
+        actions = Actions(None, cache=ResponseCache(":memory:"))
+        client = SplittingStubClient(seconds_per_token=args.seconds_per_token, max_output=args.max_output)
+        timings = []
+        cards = 0
+        expected = 0
+        for page, text in texts.items():
+            start = time.perf_counter()
+            response = actions.request_page(client, text, "English", split_tokens=budget, max_workers=args.workers)
+            timings.append(time.perf_counter() - start)
+            cards += len(actions.parse_response(response).cards)
+            expected += len(range(0, facts[page], max(1, client.cards_every // 15)))
+        timings.sort()
+        print(f"  {label}: {client.calls} requests, {client.tokens_sent} input tokens, "
+              f"{metrics.counter('truncated_responses')} truncated answers, {cards} of {expected} cards")
+        print(f"    per page: {timings[len(timings) // 2]:.2f}s median, {timings[int(len(timings) * 0.95)]:.2f}s p95, "
+              f"{timings[-1]:.2f}s max")
+
+
+def bench_generation(args):
+    import mistral_config
+    from actions import Actions
+    from rate_limiter import RateLimiter
+    from response_cache import ResponseCache
+
+    actions = Actions(None, cache=ResponseCache(":memory:"))
+    texts = {i: f"Slide {i + 1}: renin, aldosterone and potassium" for i in range(args.pages)}
+    print(f"{args.pages} pages, stub latency {args.latency}s")
+
+    for workers in args.workers:
+        # Without --rps the limiter is unbounded and only the pool is measured
+        mistral_config.rate_limiter = RateLimiter(requests_per_second=args.rps, burst=max(1, workers))
+        actions.cache.clear()
+        client = StubChatClient(latency=args.latency)
+        start = time.perf_counter()
+        first_page_s = None
+        for page, response, error in actions.generate_pages(texts, "English", client, max_workers=workers):
+            if error is not None:
+                raise error
+            if first_page_s is None:
+                first_page_s = time.perf_counter() - start
+        elapsed = time.perf_counter() - start
+        print(f"{workers:>3} workers: {elapsed:.2f}s total, {args.pages / elapsed:.1f} pages/s, "
+              f"first page {first_page_s:.2f}s, max in flight {client.max_in_flight}")
+        stats = mistral_config.rate_limiter.stats()
+        print(f"             limiter: avg wait {stats['avg_wait_s']:.2f}s, max wait {stats['max_wait_s']:.2f}s, "
+              f"max queue depth {stats['max_queue_depth']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="PDF to Anki benchmarks")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    extraction = sub.add_parser("extraction", help="eager vs. lazy PDF extraction")
+    extraction.add_argument("--pages", type=int, default=500)
+    extraction.add_argument("--window", type=int, default=10)
+    extraction.set_defaults(func=bench_extraction)
+
+    generation = sub.add_parser("generation", help="page-batch generation against a stub chat client")
+    generation.add_argument("--pages", type=int, default=40)
+    generation.add_argument("--latency", type=float, default=0.5)
+    generation.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    generation.add_argument("--rps", type=float, default=None, help="requests per second budget")
+    generation.set_defaults(func=bench_generation)
+
+    packing = sub.add_parser("packing", help="tokens and time per card, packed vs. unpacked requests")
+    packing.add_argument("--pages", type=int, default=40)
+    packing.add_argument("--budget", type=int, default=2000, help="tokens of page text per packed request")
+    packing.add_argument("--latency", type=float, default=0.3)
+    packing.add_argument("--workers", type=int, default=4)
+    packing.set_defaults(func=bench_packing)
+
+    parsing = sub.add_parser("parsing", help="legacy regex cleanup vs. single-pass parser")
+    parsing.add_argument("--corpus", help="directory of saved raw model responses")
+    parsing.add_argument("--repeat", type=int, default=20)
+    parsing.set_defaults(func=bench_parsing)
+
+    streaming = sub.add_parser("streaming", help="time to first card, blocking vs. streamed completion")
+    streaming.add_argument("--cards", type=int, default=12)
+    streaming.add_argument("--latency", type=float, default=20.0)
+    streaming.set_defaults(func=bench_streaming)
+
+    anki = sub.add_parser("anki", help="per-page vs. batched pushes against a fake AnkiConnect server")
+    anki.add_argument("--pages", type=int, default=40)
+    anki.add_argument("--cards-per-page", type=int, default=8)
+    anki.add_argument("--chunk-size", type=int, default=50)
+    anki.add_argument("--image-kb", type=int, default=150)
+    anki.add_argument("--latency", type=float, default=0.02, help="simulated AnkiConnect time per request")
+    anki.set_defaults(func=bench_anki)
+
+    rendering = sub.add_parser("rendering", help="page list rerun time, all pages vs. paginated")
+    rendering.add_argument("--pages", type=int, nargs="+", default=[10, 50, 100])
+    rendering.add_argument("--cards-per-page", type=int, default=4)
+    rendering.set_defaults(func=bench_rendering)
+
+    rasterization = sub.add_parser("rasterization", help="page rendering across worker processes")
+    rasterization.add_argument("--pages", type=int, default=120)
+    rasterization.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    rasterization.add_argument("--dpi", type=int, default=150)
+    rasterization.add_argument("--quality", type=int, default=100)
+    rasterization.add_argument("--chunk-size", type=int, default=4)
+    rasterization.set_defaults(func=bench_rasterization)
+
+    extraction_cache = sub.add_parser("extraction-cache", help="first open vs. re-open of a cached document")
+    extraction_cache.add_argument("--pages", type=int, default=200)
+    extraction_cache.set_defaults(func=bench_extraction_cache)
+
+    triage = sub.add_parser("triage", help="model calls avoided by local page triage")
+    triage.add_argument("--slides", type=int, default=300)
+    triage.set_defaults(func=bench_triage)
+
+    language = sub.add_parser("language", help="accuracy and latency of the offline language detection")
+    language.add_argument("--threshold", type=float, default=0.8)
+    language.add_argument("--repeat", type=int, default=20)
+    language.add_argument("--verbose", action="store_true", help="list the texts that would go to the API")
+    language.set_defaults(func=bench_language)
+
+    pool = sub.add_parser("client-pool", help="new Mistral client per request vs. pooled keep-alive client")
+    pool.add_argument("--requests", type=int, default=200)
+    pool.add_argument("--latency", type=float, default=0.0, help="simulated server time per request")
+    pool.add_argument("--workers", type=int, nargs="+", default=[4])
+    pool.add_argument("--http", action="store_true", help="plain HTTP instead of HTTPS")
+    pool.set_defaults(func=bench_client_pool)
+
+    boilerplate = sub.add_parser("boilerplate", help="input tokens saved by removing recurring headers and footers")
+    boilerplate.add_argument("--pages", type=int, default=120)
+    boilerplate.set_defaults(func=bench_boilerplate)
+
+    duplicates = sub.add_parser("duplicates", help="seeding and per-card checks of the duplicate index")
+    duplicates.add_argument("--notes", type=int, default=20000)
+    duplicates.add_argument("--checks", type=int, default=2000)
+    duplicates.set_defaults(func=bench_duplicates)
+
+    splitting = sub.add_parser("splitting", help="truncated answers and latency per page, whole vs. split pages")
+    splitting.add_argument("--pages", type=int, default=30)
+    splitting.add_argument("--budget", type=int, default=1500, help="tokens of page text per part")
+    splitting.add_argument("--max-output", type=int, default=1024, help="completion tokens before the answer is cut")
+    splitting.add_argument("--seconds-per-token", type=float, default=0.001)
+    splitting.add_argument("--workers", type=int, default=4, help="parts of one page in flight")
+    splitting.set_defaults(func=bench_splitting)
+
+    policy = sub.add_parser("policy", help="tail latency and failures, plain retries vs. the request policy")
+    policy.add_argument("--requests", type=int, default=300)
+    policy.add_argument("--workers", type=int, default=8)
+    policy.add_argument("--latency", type=float, default=0.05, help="seconds for a normal answer")
+    policy.add_argument("--slow-share", type=float, default=0.05, help="share of requests that get stuck")
+    policy.add_argument("--slow-latency", type=float, default=5.0, help="seconds a stuck request takes")
+    policy.add_argument("--error-share", type=float, default=0.05, help="share of requests answered with 503")
+    policy.add_argument("--deadline", type=float, default=1.0, help="seconds per attempt")
+    policy.set_defaults(func=bench_policy)
+
+    jobs = sub.add_parser("jobs", help="a long document through the job queue, with a restart halfway")
+    jobs.add_argument("--pages", type=int, default=600)
+    jobs.add_argument("--workers", type=int, default=8)
+    jobs.add_argument("--latency", type=float, default=0.02, help="seconds per request of the stub model")
+    jobs.add_argument("--pack-tokens", type=int, default=0, help="pack consecutive pages into requests")
+    jobs.set_defaults(func=bench_jobs)
+
+    child = sub.add_parser("_extraction-child")
+    child.add_argument("mode", choices=["eager", "lazy"])
+    child.add_argument("file_path")
+    child.add_argument("window", type=int)
+    child.set_defaults(func=lambda a: run_extraction_child(a.mode, a.file_path, a.window))
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+# boilerplate.py
+# -*- coding: utf-8 -*-
+import json
+import re
+
+TOP = "top"
+BOTTOM = "bottom"
+BODY = "body"
+
+_DIGITS = re.compile(r"\d+")
+_SPACES = re.compile(r"[ \t\u00a0\u2000-\u200b\u3000]+")
+_HYPHENATED = re.compile(r"(\w)[-\u00ad]\n(?=\w)")
+_NOT_TEXT = re.compile(r"[\W#_]+")
+
+
+def line_key(band, line):
+    """
+    Header and footer lines match with any number in them, "Slide 3 of 40" and "Slide 4
+    of 40" alike; body lines only match exactly, numbers are often all that differs there.
+    """
+    line = line.lower()
+    if band != BODY:
+        line = _DIGITS.sub("#", line)
+    return _SPACES.sub(" ", line).strip()
+
+
+def normalize_text(text):
+    """Collapses runs of spaces, drops empty lines and joins words hyphenated across a line break."""
+    text = _HYPHENATED.sub(lambda m: m.group(1) if text[m.end()].islower() else m.group(0), text)
+    lines = (_SPACES.sub(" ", line).strip() for line in text.splitlines())
+    return "\n".join(line for line in lines if line)
+
+
+def text_blocks(page):
+    """(band, text) of the text blocks of a fitz page, in the order get_text() returns them."""
+    height = page.rect.height or 1
+    blocks = []
+    for x0, y0, x1, y1, text, block_no, block_type in page.get_text("blocks"):
+        if block_type != 0:
+            continue
+        center = (y0 + y1) / 2 / height
+        blocks.append((TOP if center < BoilerplateProfile.MARGIN else
+                       BOTTOM if center > 1 - BoilerplateProfile.MARGIN else BODY, text))
+    return blocks
+
+
+class BoilerplateProfile:
+    """
+    Lines that recur across the pages of a document: headers, footers, course titles,
+    slide numbers and copyright notices. Learned from the fitz text blocks of a sample
+    of pages; a line counts as boilerplate when the same line (numbers ignored) shows
+    up in the same band of the page, header, footer or body, on enough pages. Lines in
+    the header and footer bands need fewer pages than lines in the body.
+    """
+    MARGIN = 0.08
+
+    def __init__(self, lines=(), pages=0):
+        self.lines = set(lines)
+        self.pages = pages
+
+    @classmethod
+    def learn(cls, doc, sample=60, min_pages=5, margin_share=0.4, body_share=0.6):
+        page_count = len(doc)
+        if page_count < min_pages:
+            return cls()
+        step = max(1, page_count / sample)
+        sampled = sorted({int(k * step) for k in range(min(sample, page_count))})
+
+        seen = {}
+        for page in sampled:
+            keys = {(band, line_key(band, line)) for band, text in text_blocks(doc.load_page(page))
+                    for line in text.splitlines()}
+            for key in keys:
+                if key[1]:
+                    seen[key] = seen.get(key, 0) + 1
+
+        # Never fewer than min_pages, so a slide title repeated over a few incremental builds stays
+        margin_pages = max(min_pages, margin_share * len(sampled))
+        body_pages = max(min_pages, body_share * len(sampled))
+        lines = {key for key, count in seen.items() if count >= (body_pages if key[0] == BODY else margin_pages)}
+        return cls(lines, len(sampled))
+
+    def is_boilerplate(self, band, line):
+        key = line_key(band, line)
+        if (band, key) in self.lines:
+            return True
+        # A bare page number in the header or footer
+        return band != BODY and not _NOT_TEXT.sub("", key)
+
+    def strip(self, blocks):
+        """Page text from text_blocks without the boilerplate lines, normalized."""
+        kept = []
+        for band, text in blocks:
+            kept.extend(line for line in text.splitlines() if not self.is_boilerplate(band, line))
+        return normalize_text("\n".join(kept))
+
+    def to_json(self):
+        return json.dumps({"pages": self.pages, "lines": sorted(self.lines)})
+
+    @classmethod
+    def from_json(cls, data):
+        data = json.loads(data)
+        return cls((tuple(line) for line in data["lines"]), data["pages"])
@@ -0,0 +1,123 @@
+# duplicate_index.py
+# -*- coding: utf-8 -*-
+import hashlib
+import html
+import re
+
+from page_triage import MinHash, jaccard, shingles
+
+EXACT = "exact"
+NEAR = "near"
+DUPLICATE_TAG = "possible_duplicate"
+
+_CLOZE = re.compile(r"\{\{c\d+::(.*?)(?:::[^}]*)?\}\}", re.S)
+_TAG = re.compile(r"<[^>]+>")
+_NOT_WORD = re.compile(r"[\W_]+")
+
+
+def normalize_card(front):
+    """(text, answers) of a card front: HTML and cloze markup removed, lowercase, punctuation dropped."""
+    answers = []
+
+    def answer(match):
+        answers.append(_NOT_WORD.sub(" ", match.group(1).lower()).strip())
+        return match.group(1)
+
+    text = _CLOZE.sub(answer, html.unescape(_TAG.sub(" ", front)))
+    return _NOT_WORD.sub(" ", text.lower()).strip(), tuple(sorted(answers))
+
+
+class DuplicateMatch:
+    __slots__ = ("kind", "similarity", "ref")
+
+    def __init__(self, kind, similarity, ref):
+        self.kind = kind
+        self.similarity = similarity
+        # What the index was given for the matching card: its front or a note id
+        self.ref = ref
+
+
+class DuplicateIndex:
+    """
+    Normalized fronts and cloze answers of the cards in a deck, to catch regenerated or
+    re-uploaded cards before they are sent to Anki. Exact matches are found by hash;
+    rephrased cards with the same cloze answers by MinHash over their words, with LSH
+    bands so a check only compares against a handful of candidates, not the whole deck.
+    """
+
+    def __init__(self, threshold=0.8):
+        self.threshold = threshold
+        self._minhash = MinHash(permutations=32, bands=8)
+        self._exact = {}
+        self._entries = []
+        self._buckets = {}
+
+    def __len__(self):
+        return len(self._entries)
+
+    @staticmethod
+    def _hash(text, answers):
+        return hashlib.blake2b("\0".join((text,) + answers).encode("utf-8"), digest_size=12).digest()
+
+    def _bands(self, shingle_set):
+        signature = self._minhash.signature(shingle_set)
+        rows = self._minhash.rows
+        return [(band, tuple(signature[band * rows:(band + 1) * rows])) for band in range(self._minhash.bands)]
+
+    def add(self, front, ref=None):
+        text, answers = normalize_card(front)
+        key = self._hash(text, answers)
+        if key in self._exact or not text:
+            return
+        shingle_set = shingles(text, size=1)
+        entry = len(self._entries)
+        self._entries.append((shingle_set, answers, front if ref is None else ref))
+        self._exact[key] = entry
+        for band in self._bands(shingle_set):
+            self._buckets.setdefault(band, []).append(entry)
+
+    def check(self, front):
+        """A DuplicateMatch for the closest card already in the index, or None."""
+        text, answers = normalize_card(front)
+        if not text:
+            return None
+        entry = self._exact.get(self._hash(text, answers))
+        if entry is not None:
+            return DuplicateMatch(EXACT, 1.0, self._entries[entry][2])
+
+        shingle_set = shingles(text, size=1)
+        candidates = set()
+        for band in self._bands(shingle_set):
+            candidates.update(self._buckets.get(band, ()))
+        best = None
+        for entry in candidates:
+            other, other_answers, ref = self._entries[entry]
+            # The same sentence with another gap asks for another fact
+            if other_answers != answers:
+                continue
+            similarity = jaccard(shingle_set, other)
+            if similarity >= self.threshold and (best is None or similarity > best.similarity):
+                best = DuplicateMatch(NEAR, similarity, ref)
+        return best
+
+
+def filter_notes(notes, index, skip=True):
+    """
+    Checks AnkiConnect notes against the index and against each other. Duplicates are
+    left out with skip, otherwise sent tagged DUPLICATE_TAG. Returns (notes to send,
+    number of duplicates).
+    """
+    pending = DuplicateIndex(index.threshold)
+    kept = []
+    duplicates = 0
+    for note in notes:
+        front = note["fields"]["Text"]
+        if index.check(front) is None and pending.check(front) is None:
+            pending.add(front)
+            kept.append(note)
+            continue
+        duplicates += 1
+        if not skip:
+            note["tags"] = list(note["tags"]) + [DUPLICATE_TAG]
+            kept.append(note)
+    return kept, duplicates
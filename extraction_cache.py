@@ -0,0 +1,143 @@
+# extraction_cache.py
+# -*- coding: utf-8 -*-
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+
+from response_cache import DEFAULT_CACHE_DIR
+
+
+class ExtractionCache:
+    """
+    Uploaded PDFs and what was extracted from them (page text, rendered images), on
+    disk and keyed by a hash of the PDF's content, so the same slides uploaded again,
+    under any name or by any session, open without extracting anything twice.
+
+    PDFs are written once under pdfs/<hash>.pdf and never rewritten, so two uploads
+    that share a file name never overwrite each other. Once everything stored exceeds max_bytes, whole
+    documents are evicted least-recently-used.
+    """
+
+    def __init__(self, directory=None, max_bytes=1024 * 1024 * 1024):
+        self.directory = directory or os.path.join(DEFAULT_CACHE_DIR, "extraction")
+        self.pdf_directory = os.path.join(self.directory, "pdfs")
+        os.makedirs(self.pdf_directory, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(os.path.join(self.directory, "pages.sqlite3"), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS documents (
+                hash TEXT PRIMARY KEY,
+                size INTEGER NOT NULL,
+                last_used REAL NOT NULL
+            )
+        """)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS entries (
+                hash TEXT NOT NULL,
+                kind TEXT NOT NULL,
+                page INTEGER NOT NULL,
+                data BLOB NOT NULL,
+                PRIMARY KEY (hash, kind, page)
+            )
+        """)
+        self._conn.commit()
+        self._size = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM documents").fetchone()[0]
+
+    @staticmethod
+    def file_hash(data):
+        return hashlib.sha256(data).hexdigest()
+
+    def pdf_path(self, doc_hash):
+        return os.path.join(self.pdf_directory, doc_hash + ".pdf")
+
+    @staticmethod
+    def hash_from_path(path):
+        return os.path.splitext(os.path.basename(path))[0]
+
+    def store_pdf(self, data, doc_hash=None):
+        """Saves an uploaded PDF under its content hash and returns the path."""
+        doc_hash = doc_hash or self.file_hash(data)
+        path = self.pdf_path(doc_hash)
+        if not os.path.exists(path):
+            # Written under a temporary name first, a reader never sees half a file
+            temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(temp_path, "wb") as f:
+                f.write(data)
+            os.replace(temp_path, path)
+        self.add_document(doc_hash, len(data))
+        return path
+
+    def add_document(self, doc_hash, size=0):
+        """Registers a document (or marks it used) so entries can be stored for it."""
+        with self._lock:
+            row = self._conn.execute("SELECT size FROM documents WHERE hash = ?", (doc_hash,)).fetchone()
+            if row is None:
+                self._conn.execute("INSERT INTO documents (hash, size, last_used) VALUES (?, ?, ?)",
+                                   (doc_hash, size, time.time()))
+                self._size += size
+                self._evict(keep=doc_hash)
+            else:
+                self._conn.execute("UPDATE documents SET last_used = ? WHERE hash = ?", (time.time(), doc_hash))
+            self._conn.commit()
+
+    def get(self, doc_hash, kind, page):
+        with self._lock:
+            row = self._conn.execute("SELECT data FROM entries WHERE hash = ? AND kind = ? AND page = ?",
+                                     (doc_hash, kind, page)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return row[0]
+
+    def stored_pages(self, doc_hash, kind):
+        with self._lock:
+            rows = self._conn.execute("SELECT page FROM entries WHERE hash = ? AND kind = ?", (doc_hash, kind))
+            return {row[0] for row in rows}
+
+    def put(self, doc_hash, kind, page, data):
+        with self._lock:
+            document = self._conn.execute("SELECT 1 FROM documents WHERE hash = ?", (doc_hash,)).fetchone()
+            if document is None:
+                # The document was evicted while it was still open somewhere
+                return
+            old = self._conn.execute("SELECT LENGTH(data) FROM entries WHERE hash = ? AND kind = ? AND page = ?",
+                                     (doc_hash, kind, page)).fetchone()
+            self._conn.execute("INSERT OR REPLACE INTO entries (hash, kind, page, data) VALUES (?, ?, ?, ?)",
+                               (doc_hash, kind, page, data))
+            added = len(data) - (old[0] if old else 0)
+            self._conn.execute("UPDATE documents SET size = size + ?, last_used = ? WHERE hash = ?",
+                               (added, time.time(), doc_hash))
+            self._size += added
+            if self._size > self.max_bytes:
+                self._evict(keep=doc_hash)
+            self._conn.commit()
+
+    def _evict(self, keep):
+        # Drop the least recently used documents until the cache is back under 90% of its budget
+        target = self.max_bytes * 0.9
+        rows = self._conn.execute("SELECT hash, size FROM documents ORDER BY last_used").fetchall()
+        for doc_hash, size in rows:
+            if self._size <= target:
+                break
+            if doc_hash == keep:
+                continue
+            self._conn.execute("DELETE FROM entries WHERE hash = ?", (doc_hash,))
+            self._conn.execute("DELETE FROM documents WHERE hash = ?", (doc_hash,))
+            try:
+                os.remove(self.pdf_path(doc_hash))
+            except FileNotFoundError:
+                pass
+            self._size -= size
+
+    def stats(self):
+        with self._lock:
+            documents = self._conn.execute("SELECT COUNT(*) FROM documents").fetchone()[0]
+            return {"hits": self.hits, "misses": self.misses, "documents": documents, "bytes": self._size}
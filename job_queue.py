@@ -0,0 +1,273 @@
+# job_queue.py
+# -*- coding: utf-8 -*-
+import os
+import sqlite3
+import threading
+import time
+
+from metrics import metrics
+from prompts import pack_pages
+from response_cache import DEFAULT_CACHE_DIR
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+
+class Job:
+    __slots__ = ("doc_hash", "lang", "owner", "page", "text", "split_tokens", "attempts")
+
+    def __init__(self, doc_hash, lang, owner, page, text, split_tokens, attempts):
+        self.doc_hash = doc_hash
+        self.lang = lang
+        self.owner = owner
+        self.page = page
+        self.text = text
+        self.split_tokens = split_tokens
+        self.attempts = attempts
+
+
+class JobQueue:
+    """
+    Per-page generation jobs on disk, with their results, keyed by the hash of the PDF,
+    the card language, the owner and the page. The owner is a hash of the API key the
+    pages are generated with, so sessions with different keys neither share nor pay for
+    each other's jobs. Jobs outlive the script run and the session that
+    queued them: a rerun, a page reload or a new upload of the same PDF finds the pages
+    that are done and the ones still waiting.
+
+    Pages queued with pack_tokens are claimed together with the consecutive pages queued
+    alongside them, as many as fit in that many tokens, to go out in one request.
+
+    Results are kept for max_age seconds after they were last written. A job that has
+    been running for stale_after seconds is taken to be lost and queued again.
+    """
+
+    def __init__(self, path=None, max_age=30 * 24 * 3600, stale_after=600):
+        if path is None:
+            os.makedirs(DEFAULT_CACHE_DIR, exist_ok=True)
+            path = os.path.join(DEFAULT_CACHE_DIR, "jobs.sqlite3")
+        self.path = path
+        self.stale_after = stale_after
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS jobs (
+                doc_hash TEXT NOT NULL,
+                lang TEXT NOT NULL,
+                owner TEXT NOT NULL,
+                page INTEGER NOT NULL,
+                text TEXT NOT NULL,
+                split_tokens INTEGER,
+                pack_tokens INTEGER,
+                status TEXT NOT NULL,
+                response TEXT,
+                error TEXT,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                created REAL NOT NULL,
+                updated REAL NOT NULL,
+                PRIMARY KEY (doc_hash, lang, owner, page)
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, created)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS jobs_updated ON jobs (doc_hash, lang, owner, updated)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS jobs_next ON jobs (doc_hash, lang, owner, status, created, page)")
+        # Jobs that were running when the process stopped are started over
+        self._conn.execute("UPDATE jobs SET status = ? WHERE status = ?", (QUEUED, RUNNING))
+        self._conn.execute("DELETE FROM jobs WHERE updated < ?", (time.time() - max_age,))
+        self._conn.commit()
+
+    def enqueue(self, doc_hash, lang, owner, texts, split_tokens=None, pack_tokens=None):
+        """
+        Queues {page: text} for generation. Pages that are queued, running or done are
+        left alone, failed pages are queued again. Returns the number of pages queued.
+        """
+        now = time.time()
+        queued = 0
+        with self._lock:
+            for page, text in sorted(texts.items()):
+                cursor = self._conn.execute("""
+                    INSERT INTO jobs (doc_hash, lang, owner, page, text, split_tokens, pack_tokens, status, created,
+                                      updated)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT (doc_hash, lang, owner, page) DO UPDATE SET
+                        text = excluded.text, split_tokens = excluded.split_tokens,
+                        pack_tokens = excluded.pack_tokens, status = excluded.status, response = NULL,
+                        error = NULL, created = excluded.created, updated = excluded.updated
+                    WHERE jobs.status = ?
+                """, (doc_hash, lang, owner, page, text, split_tokens, pack_tokens, QUEUED, now, now, FAILED))
+                queued += cursor.rowcount
+            self._conn.commit()
+        metrics.count("jobs_queued", queued)
+        return queued
+
+    def claim(self, batches, max_pages=64):
+        """
+        Marks the next queued job of one of the (doc_hash, lang, owner) batches as running,
+        with the pages packed alongside it, and returns them as a list, empty when nothing
+        is queued. Documents with the fewest running jobs go first, so one long lecture
+        series does not hold up the pages of everyone else.
+        """
+        with self._lock:
+            self._conn.execute("UPDATE jobs SET status = ? WHERE status = ? AND updated < ?",
+                               (QUEUED, RUNNING, time.time() - self.stale_after))
+            running = {(doc_hash, lang, owner): count for doc_hash, lang, owner, count in self._conn.execute(
+                "SELECT doc_hash, lang, owner, COUNT(*) FROM jobs WHERE status = ? GROUP BY doc_hash, lang, owner",
+                (RUNNING,))}
+            for doc_hash, lang, owner in sorted(batches, key=lambda batch: running.get(batch, 0)):
+                row = self._conn.execute("""
+                    SELECT doc_hash, lang, owner, page, text, split_tokens, attempts, pack_tokens, created
+                    FROM jobs WHERE doc_hash = ? AND lang = ? AND owner = ? AND status = ?
+                    ORDER BY created, page LIMIT 1
+                """, (doc_hash, lang, owner, QUEUED)).fetchone()
+                if row is not None:
+                    break
+            else:
+                self._conn.commit()
+                return []
+
+            rows = [row]
+            pack_tokens, created = row[7], row[8]
+            if pack_tokens:
+                for following in self._conn.execute("""
+                    SELECT doc_hash, lang, owner, page, text, split_tokens, attempts FROM jobs
+                    WHERE doc_hash = ? AND lang = ? AND owner = ? AND status = ? AND created = ? AND page > ?
+                    ORDER BY created, page LIMIT ?
+                """, (doc_hash, lang, owner, QUEUED, created, row[3], max_pages - 1)):
+                    if following[3] != rows[-1][3] + 1:
+                        break
+                    rows.append(following)
+                packed = pack_pages({row[3]: row[4] for row in rows}, pack_tokens)[0]
+                rows = rows[:len(packed)]
+
+            now = time.time()
+            self._conn.executemany("UPDATE jobs SET status = ?, attempts = attempts + 1, updated = ? "
+                                   "WHERE doc_hash = ? AND lang = ? AND owner = ? AND page = ?",
+                                   [(RUNNING, now, doc_hash, lang, owner, row[3]) for row in rows])
+            self._conn.commit()
+        return [Job(*row[:6], attempts=row[6] + 1) for row in rows]
+
+    def finish(self, job, response):
+        self._set(job, DONE, response=response)
+
+    def fail(self, job, error):
+        self._set(job, FAILED, error=error)
+
+    def _set(self, job, status, response=None, error=None):
+        with self._lock:
+            self._conn.execute("UPDATE jobs SET status = ?, response = ?, error = ?, updated = ? "
+                               "WHERE doc_hash = ? AND lang = ? AND owner = ? AND page = ?",
+                               (status, response, error, time.time(), job.doc_hash, job.lang, job.owner, job.page))
+            self._conn.commit()
+        metrics.count("jobs", status=status)
+
+    def results(self, doc_hash, lang, owner, since=0.0):
+        """[(page, status, response, error, updated)] of the pages done or failed after since."""
+        with self._lock:
+            return self._conn.execute("""
+                SELECT page, status, response, error, updated FROM jobs
+                WHERE doc_hash = ? AND lang = ? AND owner = ? AND status IN (?, ?) AND updated > ?
+                ORDER BY updated
+            """, (doc_hash, lang, owner, DONE, FAILED, since)).fetchall()
+
+    def status(self, doc_hash, lang, owner, page):
+        with self._lock:
+            row = self._conn.execute("SELECT status FROM jobs WHERE doc_hash = ? AND lang = ? AND owner = ? "
+                                     "AND page = ?", (doc_hash, lang, owner, page)).fetchone()
+        return row[0] if row else None
+
+    def progress(self, doc_hash, lang, owner):
+        """{status: pages} of the document."""
+        with self._lock:
+            rows = self._conn.execute("SELECT status, COUNT(*) FROM jobs WHERE doc_hash = ? AND lang = ? "
+                                      "AND owner = ? GROUP BY status", (doc_hash, lang, owner)).fetchall()
+        return dict(rows)
+
+    def remove(self, doc_hash, lang, owner, pages):
+        """Forgets the jobs and results of pages, e.g. before they are generated anew."""
+        with self._lock:
+            self._conn.executemany("DELETE FROM jobs WHERE doc_hash = ? AND lang = ? AND owner = ? AND page = ? "
+                                   "AND status != ?", [(doc_hash, lang, owner, page, RUNNING) for page in pages])
+            self._conn.commit()
+
+
+class JobWorkers:
+    """
+    Threads shared by every session that work through the JobQueue. generate(client,
+    texts, lang, split_tokens) returns {page: response} for the pages of one claim: a
+    single page, or consecutive pages packed into one request.
+
+    Each batch runs at most the max_workers requests its session asked for at a time.
+    There are workers threads, more when a session asks for more parallel requests.
+
+    API keys never go to disk: a batch is only worked on while a session has attached
+    a client for it, and a batch belongs to one key through its owner. Jobs of a batch
+    queued before a restart wait until a session with the same document and key
+    attaches a client again. A batch with nothing queued or running is detached.
+    """
+
+    def __init__(self, queue, generate, workers=8, idle_wait=1.0):
+        self.queue = queue
+        self.generate = generate
+        self.workers = workers
+        self.idle_wait = idle_wait
+        self._clients = {}
+        self._running = {}
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._threads = []
+
+    def attach(self, doc_hash, lang, owner, client, max_workers=4):
+        with self._lock:
+            self._clients[(doc_hash, lang, owner)] = (client, max_workers)
+            while len(self._threads) < max(self.workers, max_workers):
+                thread = threading.Thread(target=self._run, name=f"job-worker-{len(self._threads)}", daemon=True)
+                thread.start()
+                self._threads.append(thread)
+        self._wake.set()
+
+    def submit(self, doc_hash, lang, owner, texts, client, split_tokens=None, pack_tokens=None, max_workers=4):
+        """Queues the pages and makes sure workers run them; returns the number of pages queued."""
+        queued = self.queue.enqueue(doc_hash, lang, owner, texts, split_tokens, pack_tokens)
+        self.attach(doc_hash, lang, owner, client, max_workers)
+        return queued
+
+    def _run(self):
+        while True:
+            with self._lock:
+                batches = [batch for batch, (_, max_workers) in self._clients.items()
+                           if self._running.get(batch, 0) < max_workers]
+                jobs = self.queue.claim(batches) if batches else []
+                if not jobs:
+                    # Nothing left to do for these batches: drop their clients until a session
+                    # attaches again, so finished documents do not keep a client each
+                    for batch in batches:
+                        if not self._running.get(batch):
+                            del self._clients[batch]
+                            self._running.pop(batch, None)
+                else:
+                    batch = (jobs[0].doc_hash, jobs[0].lang, jobs[0].owner)
+                    client = self._clients[batch][0]
+                    self._running[batch] = self._running.get(batch, 0) + 1
+            if not jobs:
+                self._wake.wait(self.idle_wait)
+                self._wake.clear()
+                continue
+            try:
+                with metrics.timer("job"):
+                    responses = self.generate(client, {job.page: job.text for job in jobs}, jobs[0].lang,
+                                              jobs[0].split_tokens)
+            except Exception as e:
+                for job in jobs:
+                    self.queue.fail(job, f"{type(e).__name__}: {e}")
+            else:
+                for job in jobs:
+                    self.queue.finish(job, responses[job.page])
+            finally:
+                with self._lock:
+                    self._running[batch] -= 1
+                # A slot of the batch is free again
+                self._wake.set()
@@ -0,0 +1,213 @@
+# language_detect.py
+# -*- coding: utf-8 -*-
+import math
+import re
+from collections import Counter
+
+# Reference text per language the app offers, the character n-gram profiles are built from it
+SAMPLES = {
+    "English": """
+        The kidney filters the blood and removes waste products from the body. Each kidney contains about
+        one million nephrons, and every nephron consists of a glomerulus and a tubule. Water and small
+        molecules pass through the filtration barrier, while proteins and cells are retained in the blood.
+        Most of the filtered sodium is reabsorbed in the proximal tubule. The hormone aldosterone increases
+        the reabsorption of sodium in the collecting duct, which raises blood pressure. When the kidneys fail,
+        patients need dialysis or a transplant. In this lecture we discuss the structure and the function of
+        the nephron, the regulation of the glomerular filtration rate and the most important diseases.
+        What are the main causes of chronic kidney disease? Diabetes and high blood pressure are the most
+        common ones, and they should be treated early to prevent further damage.
+    """,
+    "French": """
+        Le rein filtre le sang et élimine les déchets de l'organisme. Chaque rein contient environ un million
+        de néphrons, et chaque néphron est composé d'un glomérule et d'un tubule. L'eau et les petites
+        molécules traversent la barrière de filtration, tandis que les protéines et les cellules restent dans
+        le sang. La plus grande partie du sodium filtré est réabsorbée dans le tubule proximal. L'hormone
+        aldostérone augmente la réabsorption du sodium dans le canal collecteur, ce qui élève la pression
+        artérielle. Lorsque les reins ne fonctionnent plus, les patients ont besoin d'une dialyse ou d'une
+        greffe. Dans ce cours, nous étudions la structure et la fonction du néphron, la régulation du débit
+        de filtration glomérulaire et les principales maladies. Quelles sont les causes les plus fréquentes
+        de l'insuffisance rénale chronique ? Le diabète et l'hypertension sont les plus courantes.
+    """,
+    "German": """
+        Die Niere filtert das Blut und entfernt Abfallprodukte aus dem Körper. Jede Niere enthält etwa eine
+        Million Nephrone, und jedes Nephron besteht aus einem Glomerulus und einem Tubulus. Wasser und kleine
+        Moleküle gelangen durch die Filtrationsbarriere, während Proteine und Zellen im Blut zurückgehalten
+        werden. Der größte Teil des filtrierten Natriums wird im proximalen Tubulus rückresorbiert. Das Hormon
+        Aldosteron steigert die Rückresorption von Natrium im Sammelrohr, wodurch der Blutdruck steigt. Wenn
+        die Nieren versagen, brauchen die Patienten eine Dialyse oder eine Transplantation. In dieser Vorlesung
+        besprechen wir den Aufbau und die Funktion des Nephrons, die Regulation der glomerulären
+        Filtrationsrate und die wichtigsten Erkrankungen. Welche Ursachen hat die chronische Niereninsuffizienz
+        am häufigsten? Diabetes und Bluthochdruck sind am häufigsten und sollten früh behandelt werden.
+    """,
+    "Spanish": """
+        El riñón filtra la sangre y elimina los productos de desecho del cuerpo. Cada riñón contiene
+        aproximadamente un millón de nefronas, y cada nefrona está formada por un glomérulo y un túbulo. El
+        agua y las moléculas pequeñas atraviesan la barrera de filtración, mientras que las proteínas y las
+        células permanecen en la sangre. La mayor parte del sodio filtrado se reabsorbe en el túbulo proximal.
+        La hormona aldosterona aumenta la reabsorción de sodio en el conducto colector, lo que eleva la
+        presión arterial. Cuando los riñones fallan, los pacientes necesitan diálisis o un trasplante. En esta
+        clase estudiamos la estructura y la función de la nefrona, la regulación de la tasa de filtración
+        glomerular y las enfermedades más importantes. ¿Cuáles son las causas más frecuentes de la enfermedad
+        renal crónica? La diabetes y la hipertensión son las más comunes y deben tratarse pronto.
+    """,
+    "Portuguese": """
+        O rim filtra o sangue e elimina os produtos de excreção do corpo. Cada rim contém cerca de um milhão
+        de néfrons, e cada néfron é formado por um glomérulo e um túbulo. A água e as moléculas pequenas
+        atravessam a barreira de filtração, enquanto as proteínas e as células ficam retidas no sangue. A
+        maior parte do sódio filtrado é reabsorvida no túbulo proximal. O hormônio aldosterona aumenta a
+        reabsorção de sódio no ducto coletor, o que eleva a pressão arterial. Quando os rins não funcionam,
+        os pacientes precisam de diálise ou de um transplante. Nesta aula estudamos a estrutura e a função do
+        néfron, a regulação da taxa de filtração glomerular e as doenças mais importantes. Quais são as
+        causas mais frequentes da doença renal crônica? O diabetes e a hipertensão são as mais comuns e
+        devem ser tratados cedo, não depois de anos sem acompanhamento.
+    """,
+    "Polish": """
+        Nerka filtruje krew i usuwa z organizmu produkty przemiany materii. Każda nerka zawiera około miliona
+        nefronów, a każdy nefron składa się z kłębuszka i kanalika. Woda i małe cząsteczki przechodzą przez
+        barierę filtracyjną, natomiast białka i komórki pozostają we krwi. Większość przefiltrowanego sodu
+        jest wchłaniana zwrotnie w kanaliku proksymalnym. Hormon aldosteron zwiększa wchłanianie zwrotne sodu
+        w kanaliku zbiorczym, co podnosi ciśnienie tętnicze. Gdy nerki przestają działać, pacjenci potrzebują
+        dializy lub przeszczepu. Na tym wykładzie omawiamy budowę i czynność nefronu, regulację wskaźnika
+        przesączania kłębuszkowego oraz najważniejsze choroby. Jakie są najczęstsze przyczyny przewlekłej
+        choroby nerek? Cukrzyca i nadciśnienie tętnicze są najczęstsze i należy je wcześnie leczyć.
+    """,
+    "Romanian": """
+        Rinichiul filtrează sângele și elimină produșii de excreție din organism. Fiecare rinichi conține
+        aproximativ un milion de nefroni, iar fiecare nefron este format dintr-un glomerul și un tubul. Apa și
+        moleculele mici trec prin bariera de filtrare, în timp ce proteinele și celulele rămân în sânge. Cea
+        mai mare parte a sodiului filtrat este reabsorbită în tubul proximal. Hormonul aldosteron crește
+        reabsorbția sodiului în canalul colector, ceea ce mărește tensiunea arterială. Când rinichii nu mai
+        funcționează, pacienții au nevoie de dializă sau de un transplant. În acest curs discutăm structura și
+        funcția nefronului, reglarea ratei de filtrare glomerulară și cele mai importante boli. Care sunt
+        cauzele cele mai frecvente ale bolii cronice de rinichi? Diabetul și hipertensiunea sunt cele mai
+        frecvente și trebuie tratate din timp.
+    """,
+    "Russian": """
+        Почка фильтрует кровь и удаляет из организма продукты обмена веществ. Каждая почка содержит около
+        миллиона нефронов, и каждый нефрон состоит из клубочка и канальца. Вода и небольшие молекулы проходят
+        через фильтрационный барьер, тогда как белки и клетки остаются в крови. Большая часть
+        профильтрованного натрия реабсорбируется в проксимальном канальце. Гормон альдостерон усиливает
+        реабсорбцию натрия в собирательной трубке, что повышает артериальное давление. Когда почки перестают
+        работать, пациентам нужен диализ или трансплантация. На этой лекции мы обсуждаем строение и функцию
+        нефрона, регуляцию скорости клубочковой фильтрации и самые важные заболевания. Каковы самые частые
+        причины хронической болезни почек? Сахарный диабет и гипертония встречаются чаще всего.
+    """,
+    "Arabic": """
+        تقوم الكلية بتصفية الدم وإزالة الفضلات من الجسم. تحتوي كل كلية على حوالي مليون نفرون، ويتكون كل نفرون
+        من كبيبة وأنبوب. يمر الماء والجزيئات الصغيرة عبر حاجز الترشيح، بينما تبقى البروتينات والخلايا في الدم.
+        يعاد امتصاص معظم الصوديوم المرشح في الأنبوب القريب. يزيد هرمون الألدوستيرون من إعادة امتصاص الصوديوم
+        في القناة الجامعة، مما يرفع ضغط الدم. عندما تفشل الكليتان يحتاج المرضى إلى غسيل الكلى أو إلى زراعة
+        كلية. في هذه المحاضرة نناقش بنية النفرون ووظيفته وتنظيم معدل الترشيح الكبيبي وأهم الأمراض. ما هي
+        الأسباب الأكثر شيوعا لمرض الكلى المزمن؟ السكري وارتفاع ضغط الدم هما الأكثر شيوعا ويجب علاجهما مبكرا.
+    """,
+    "Urdu": """
+        گردہ خون کو صاف کرتا ہے اور جسم سے فاضل مادے نکالتا ہے۔ ہر گردے میں تقریباً دس لاکھ نیفران ہوتے ہیں،
+        اور ہر نیفران ایک گلومیرولس اور ایک نالی پر مشتمل ہوتا ہے۔ پانی اور چھوٹے مالیکیول چھاننے والی رکاوٹ
+        سے گزر جاتے ہیں، جبکہ پروٹین اور خلیے خون میں رہتے ہیں۔ چھنے ہوئے سوڈیم کا زیادہ تر حصہ قریبی نالی میں
+        دوبارہ جذب ہو جاتا ہے۔ ہارمون ایلڈوسٹیرون جمع کرنے والی نالی میں سوڈیم کے دوبارہ جذب کو بڑھاتا ہے، جس
+        سے بلڈ پریشر بڑھ جاتا ہے۔ جب گردے کام کرنا چھوڑ دیں تو مریضوں کو ڈائیلاسز یا پیوند کاری کی ضرورت ہوتی
+        ہے۔ اس لیکچر میں ہم نیفران کی ساخت اور کام، فلٹریشن کی شرح کے کنٹرول اور اہم بیماریوں پر بات کرتے ہیں۔
+        گردے کی دائمی بیماری کی سب سے عام وجوہات کیا ہیں؟ ذیابیطس اور ہائی بلڈ پریشر سب سے عام ہیں۔
+    """,
+    "Hindi": """
+        गुर्दा रक्त को छानता है और शरीर से अपशिष्ट पदार्थों को बाहर निकालता है। हर गुर्दे में लगभग दस लाख
+        नेफ्रॉन होते हैं, और हर नेफ्रॉन एक ग्लोमेरुलस और एक नलिका से बना होता है। पानी और छोटे अणु छानने वाली
+        बाधा से होकर गुजरते हैं, जबकि प्रोटीन और कोशिकाएँ रक्त में ही रहती हैं। छने हुए सोडियम का अधिकांश भाग
+        समीपस्थ नलिका में फिर से अवशोषित हो जाता है। हार्मोन एल्डोस्टेरोन संग्रह नलिका में सोडियम के पुनः
+        अवशोषण को बढ़ाता है, जिससे रक्तचाप बढ़ता है। जब गुर्दे काम करना बंद कर देते हैं तो रोगियों को डायलिसिस
+        या प्रत्यारोपण की आवश्यकता होती है। इस व्याख्यान में हम नेफ्रॉन की संरचना और कार्य, निस्पंदन दर के
+        नियमन और सबसे महत्वपूर्ण रोगों पर चर्चा करते हैं। क्रोनिक गुर्दा रोग के सबसे आम कारण क्या हैं?
+        मधुमेह और उच्च रक्तचाप सबसे आम हैं।
+    """,
+    "Bengali": """
+        কিডনি রক্ত ছেঁকে শরীর থেকে বর্জ্য পদার্থ বের করে দেয়। প্রতিটি কিডনিতে প্রায় দশ লক্ষ নেফ্রন থাকে, এবং
+        প্রতিটি নেফ্রন একটি গ্লোমেরুলাস ও একটি নালিকা নিয়ে গঠিত। পানি ও ছোট অণুগুলো ছাঁকনি স্তর পার হয়ে যায়,
+        কিন্তু প্রোটিন ও কোষগুলো রক্তেই থেকে যায়। ছাঁকা সোডিয়ামের বেশিরভাগ অংশ নিকটবর্তী নালিকায় পুনরায় শোষিত
+        হয়। অ্যালডোস্টেরন হরমোন সংগ্রাহক নালিকায় সোডিয়ামের পুনঃশোষণ বাড়ায়, ফলে রক্তচাপ বেড়ে যায়। যখন কিডনি
+        কাজ করা বন্ধ করে দেয়, তখন রোগীদের ডায়ালাইসিস বা প্রতিস্থাপনের প্রয়োজন হয়। এই বক্তৃতায় আমরা নেফ্রনের
+        গঠন ও কাজ, ছাঁকন হারের নিয়ন্ত্রণ এবং সবচেয়ে গুরুত্বপূর্ণ রোগগুলো নিয়ে আলোচনা করব। দীর্ঘস্থায়ী কিডনি
+        রোগের সবচেয়ে সাধারণ কারণগুলো কী? ডায়াবেটিস এবং উচ্চ রক্তচাপ সবচেয়ে সাধারণ।
+    """,
+    "Mandarin Chinese": """
+        肾脏过滤血液，并将代谢废物排出体外。每个肾脏大约含有一百万个肾单位，每个肾单位由一个肾小球和一条肾小管组成。
+        水和小分子可以通过滤过屏障，而蛋白质和细胞则留在血液中。大部分被滤过的钠在近端小管中被重吸收。醛固酮这种激素
+        可以增加集合管对钠的重吸收，从而使血压升高。当肾脏功能衰竭时，病人需要进行透析或者肾移植。在这节课中，我们将
+        讨论肾单位的结构和功能、肾小球滤过率的调节以及最重要的疾病。慢性肾脏病最常见的原因是什么？糖尿病和高血压是最
+        常见的原因，应该尽早治疗，以防止进一步的损害。
+    """,
+}
+
+_SPACES = re.compile(r"[\W\d_]+")
+
+
+def ngrams(text, max_n=3):
+    """Counts of the character 1- to max_n-grams of the letters in text, words padded with spaces."""
+    counts = Counter()
+    for word in _SPACES.split(text.lower()):
+        if not word:
+            continue
+        padded = f" {word} "
+        for n in range(1, max_n + 1):
+            for k in range(len(padded) - n + 1):
+                gram = padded[k:k + n]
+                if gram != " ":
+                    counts[gram] += 1
+    return counts
+
+
+class LanguageDetector:
+    """
+    Offline language identification with character n-gram profiles, naive Bayes over
+    the n-grams of the text. detect returns the most likely language and the posterior
+    probability of that guess, so callers can fall back to something slower when the
+    text is too short or mixed to tell.
+    """
+
+    def __init__(self, samples=None, max_n=3, max_chars=2000, min_words=5):
+        self.max_n = max_n
+        self.max_chars = max_chars
+        self.min_words = min_words
+        self.profiles = {}
+        self.totals = {}
+        for language, sample in (samples or SAMPLES).items():
+            counts = ngrams(sample, max_n)
+            self.profiles[language] = counts
+            self.totals[language] = sum(counts.values())
+        self.vocabulary = len(set().union(*self.profiles.values()))
+
+    @property
+    def languages(self):
+        return list(self.profiles)
+
+    def scores(self, text):
+        counts = ngrams(text[:self.max_chars], self.max_n)
+        if not counts:
+            return {}
+        scores = {}
+        for language, profile in self.profiles.items():
+            denominator = self.totals[language] + self.vocabulary
+            scores[language] = sum(count * math.log((profile.get(gram, 0) + 1) / denominator)
+                                   for gram, count in counts.items())
+        return scores
+
+    def detect(self, text, languages=None):
+        """(language, confidence) for text, (None, 0.0) when it has no letters."""
+        scores = self.scores(text)
+        if languages is not None:
+            scores = {language: score for language, score in scores.items() if language in languages}
+        if not scores:
+            return None, 0.0
+        best = max(scores, key=scores.get)
+        # Scores are summed over every n-gram, so they are averaged per word first; the
+        # posterior of the raw sums would be near 1 for any text longer than a line. Below
+        # min_words the average is taken over min_words, a single word is never certain
+        words = max(self.min_words, len(_SPACES.split(text[:self.max_chars].strip())))
+        normalizer = sum(math.exp((score - scores[best]) / words) for score in scores.values())
+        return best, 1.0 / normalizer
+
+
+detector = LanguageDetector()
+
+
+def detect_language(text, languages=None):
+    return detector.detect(text, languages)
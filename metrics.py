@@ -0,0 +1,159 @@
+# metrics.py
+# -*- coding: utf-8 -*-
+import json
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+PREFIX = "pdf_anki_"
+
+
+def _key(name, labels):
+    return name, tuple(sorted(labels.items()))
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels, extra=()):
+    pairs = list(labels) + list(extra)
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+
+class Series:
+    """Count, sum and maximum of the observed values, plus the most recent ones for quantiles."""
+    __slots__ = ("count", "total", "max", "recent")
+
+    def __init__(self, window):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.recent = deque(maxlen=window)
+
+    def add(self, value):
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+        self.recent.append(value)
+
+    def quantile(self, q):
+        if not self.recent:
+            return 0.0
+        values = sorted(self.recent)
+        return values[min(len(values) - 1, int(q * len(values)))]
+
+
+class Metrics:
+    """
+    Counters and timings of the whole pipeline, from opening the PDF to pushing notes
+    to Anki, shared by every session of the process. Stages are timed with timer(),
+    everything that is only counted (tokens, retries, parse failures) goes through
+    count(). Both take labels, e.g. count("anki_notes", result="added").
+
+    Exported as JSON lines or in the Prometheus text format, so dashboards can scrape
+    or ingest the same numbers the in-app panel shows.
+    """
+
+    def __init__(self, window=1024):
+        self.window = window
+        self.started = time.time()
+        self._counters = {}
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def count(self, name, value=1, **labels):
+        key = _key(name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def observe(self, name, value, **labels):
+        key = _key(name, labels)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = Series(self.window)
+            series.add(value)
+
+    @contextmanager
+    def timer(self, stage, **labels):
+        """Observes the seconds spent in the block as stage_seconds{stage=...}, also when it raises."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe("stage_seconds", time.perf_counter() - start, stage=stage, **labels)
+
+    def counter(self, name, **labels):
+        with self._lock:
+            return self._counters.get(_key(name, labels), 0)
+
+    def counters(self):
+        """{(name, labels): value}, labels as a tuple of (label, value) pairs."""
+        with self._lock:
+            return dict(self._counters)
+
+    def series(self):
+        """{(name, labels): {"count", "sum", "max", "p50", "p95"}}"""
+        with self._lock:
+            return {key: {"count": series.count, "sum": series.total, "max": series.max,
+                          "p50": series.quantile(0.5), "p95": series.quantile(0.95)}
+                    for key, series in self._series.items()}
+
+    def stages(self):
+        """Timings per stage, for the panel: {stage: {"count", "sum", "max", "p50", "p95"}}"""
+        stages = {}
+        for (name, labels), values in self.series().items():
+            if name == "stage_seconds":
+                label = ", ".join(value for _, value in labels)
+                stages[label] = values
+        return stages
+
+    def to_jsonl(self):
+        """One JSON object per counter and per series, stamped with the time of the export."""
+        now = time.time()
+        lines = []
+        for (name, labels), value in sorted(self.counters().items()):
+            lines.append(json.dumps({"ts": now, "type": "counter", "name": PREFIX + name,
+                                     "labels": dict(labels), "value": value}))
+        for (name, labels), values in sorted(self.series().items()):
+            lines.append(json.dumps({"ts": now, "type": "summary", "name": PREFIX + name,
+                                     "labels": dict(labels), **values}))
+        return "\n".join(lines) + "\n" if lines else ""
+
+    def to_prometheus(self):
+        """Prometheus text exposition format: counters as counters, series as summaries."""
+        lines = []
+        typed = set()
+        for (name, labels), value in sorted(self.counters().items()):
+            if name not in typed:
+                lines.append(f"# TYPE {PREFIX}{name}_total counter")
+                typed.add(name)
+            lines.append(f"{PREFIX}{name}_total{_format_labels(labels)} {value}")
+        for (name, labels), values in sorted(self.series().items()):
+            if name not in typed:
+                lines.append(f"# TYPE {PREFIX}{name} summary")
+                typed.add(name)
+            for quantile, field in (("0.5", "p50"), ("0.95", "p95")):
+                lines.append(f"{PREFIX}{name}{_format_labels(labels, [('quantile', quantile)])} {values[field]}")
+            lines.append(f"{PREFIX}{name}_sum{_format_labels(labels)} {values['sum']}")
+            lines.append(f"{PREFIX}{name}_count{_format_labels(labels)} {values['count']}")
+        return "\n".join(lines) + "\n" if lines else ""
+
+    def write(self, path):
+        """Writes to path, as Prometheus text for .prom/.txt files, JSON lines otherwise."""
+        data = self.to_prometheus() if path.endswith((".prom", ".txt")) else self.to_jsonl()
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(data)
+
+    def reset(self):
+        with self._lock:
+            self._counters.clear()
+            self._series.clear()
+            self.started = time.time()
+
+
+metrics = Metrics()
@@ -1,12 +1,91 @@
+import atexit
+import queue
+import random
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from httpx import Client, HTTPTransport, Limits
 from mistralai.client import MistralClient
+from mistralai.constants import ENDPOINT
 from mistralai.models.chat_completion import ChatMessage
-from rate_limiter import RateLimiter
+from metrics import metrics
+from rate_limiter import RateLimiter, is_rate_limit_error, retry_after_from_error
 
 # Создаем глобальный экземпляр RateLimiter
-rate_limiter = RateLimiter(min_interval=1.0)
+# Лимиты по умолчанию для mistral-large-latest: 1 запрос в секунду, 500k токенов в минуту
+rate_limiter = RateLimiter(requests_per_second=1.0, tokens_per_minute=500_000)
 
-def create_mistral_client(api_key):
-    return MistralClient(api_key=api_key)
+# Сколько токенов потрачено за время работы процесса
+token_usage = {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
+_usage_lock = threading.Lock()
+
+# Цена в долларах за миллион токенов (mistral-large-latest), для метрики стоимости
+PRICE_PER_MILLION_TOKENS = {"prompt_tokens": 2.0, "completion_tokens": 6.0}
+
+def record_usage(usage):
+    with _usage_lock:
+        for key in token_usage:
+            token_usage[key] += getattr(usage, key, 0) or 0
+    cost = 0.0
+    for key, price in PRICE_PER_MILLION_TOKENS.items():
+        tokens = getattr(usage, key, 0) or 0
+        metrics.count("tokens", tokens, kind=key.replace("_tokens", ""))
+        cost += tokens * price / 1_000_000
+    metrics.count("cost_usd", cost)
+    rate_limiter.record_usage(usage.total_tokens)
+
+def create_mistral_client(api_key, pool_size=None, keepalive_expiry=60.0, endpoint=ENDPOINT):
+    # Без внутренних повторов клиента: ошибки 429 должны доходить до rate_limiter
+    client = MistralClient(api_key=api_key, endpoint=endpoint, max_retries=1)
+    if pool_size is not None:
+        # Пул соединений httpx под число одновременных запросов; соединения живут keepalive_expiry секунд
+        default_client = client._client
+        client._client = Client(
+            follow_redirects=True,
+            timeout=client._timeout,
+            transport=HTTPTransport(retries=client._max_retries,
+                                    limits=Limits(max_connections=pool_size, max_keepalive_connections=pool_size,
+                                                  keepalive_expiry=keepalive_expiry)))
+        default_client.close()
+    return client
+
+# Один клиент на ключ API: общий для страниц, перезапусков скрипта и сессий
+CLIENT_POOL_SIZE = 8
+MAX_CLIENTS = 32
+_clients = OrderedDict()
+_clients_lock = threading.Lock()
+
+def get_mistral_client(api_key, pool_size=None, endpoint=ENDPOINT):
+    """
+    Клиент с keep-alive для ключа api_key; TLS-рукопожатие и соединения переиспользуются
+    между запросами. pool_size — сколько соединений держать для параллельной генерации
+    (по умолчанию CLIENT_POOL_SIZE), клиент с меньшим пулом создаётся заново.
+    """
+    pool_size = pool_size or CLIENT_POOL_SIZE
+    key = (api_key, endpoint)
+    with _clients_lock:
+        entry = _clients.get(key)
+        if entry is not None and entry[1] >= pool_size:
+            _clients.move_to_end(key)
+            return entry[0]
+        client = create_mistral_client(api_key, pool_size=pool_size, endpoint=endpoint)
+        _clients[key] = (client, pool_size)
+        _clients.move_to_end(key)
+        # Вытесненные и заменённые клиенты не закрываем: ими ещё могут пользоваться другие
+        # потоки; соединения закроет MistralClient.__del__, когда клиент станет не нужен
+        while len(_clients) > MAX_CLIENTS:
+            _clients.popitem(last=False)
+        return client
+
+def close_clients():
+    """Закрывает все соединения; следующий get_mistral_client создаст клиента заново."""
+    with _clients_lock:
+        for client, _ in _clients.values():
+            client._client.close()
+        _clients.clear()
+
+atexit.register(close_clients)
 
 def create_chat_message(role, content):
     return ChatMessage(role=role, content=content)
@@ -15,7 +94,272 @@ def make_api_request(func):
     """
     Декоратор для ограничения частоты запросов к API
     """
+    def send(*args, **kwargs):
+        try:
+            with metrics.timer("model_request"):
+                response = func(*args, **kwargs)
+        except Exception as e:
+            metrics.count("model_errors", kind="rate_limit" if is_rate_limit_error(e) else type(e).__name__)
+            if is_rate_limit_error(e):
+                rate_limiter.backoff(retry_after_from_error(e))
+            raise
+
+        usage = getattr(response, "usage", None)
+        if usage is not None:
+            record_usage(usage)
+        else:
+            rate_limiter.record_success()
+        return response
+
     def wrapper(*args, **kwargs):
         rate_limiter.wait()
-        return func(*args, **kwargs)
-    return wrapper 
\ No newline at end of file
+        return send(*args, **kwargs)
+    # Запрос без ожидания rate_limiter: для тех, кто уже дождался очереди сам
+    wrapper.send = send
+    return wrapper
+
+@make_api_request
+def chat(client, **kwargs):
+    """
+    Один запрос к chat API; каждая попытка проходит через rate_limiter
+    """
+    return client.chat(**kwargs)
+
+def stream_chat(client, **kwargs):
+    """
+    Как chat, но отдаёт текст ответа по частям по мере генерации
+    """
+    rate_limiter.wait()
+    yield from _stream_chunks(client, **kwargs)
+
+def _stream_chunks(client, **kwargs):
+    start = time.perf_counter()
+    first = True
+    try:
+        for chunk in client.chat_stream(**kwargs):
+            usage = getattr(chunk, "usage", None)
+            if usage is not None:
+                record_usage(usage)
+            if chunk.choices and chunk.choices[0].delta.content:
+                if first:
+                    metrics.observe("stage_seconds", time.perf_counter() - start, stage="model_first_token")
+                    first = False
+                yield chunk.choices[0].delta.content
+    except Exception as e:
+        metrics.count("model_errors", kind="rate_limit" if is_rate_limit_error(e) else type(e).__name__)
+        if is_rate_limit_error(e):
+            rate_limiter.backoff(retry_after_from_error(e))
+        raise
+    finally:
+        metrics.observe("stage_seconds", time.perf_counter() - start, stage="model_request")
+
+class RequestTimeout(TimeoutError):
+    """Запрос не уложился в срок RequestPolicy"""
+
+def is_retryable_error(e):
+    """Ошибки 4xx (кроме 408 и 429) повторять бессмысленно: неверный ключ, модель или запрос"""
+    status = getattr(e, "http_status", None)
+    return status is None or status in (408, 429) or status >= 500
+
+def _start(func, *args, **kwargs):
+    # Отдельный поток на попытку: зависший запрос нельзя прервать, но его можно бросить,
+    # не занимая пул генерации; httpx закроет его сам по своему таймауту
+    future = Future()
+
+    def run():
+        future.set_running_or_notify_cancel()
+        try:
+            future.set_result(func(*args, **kwargs))
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=run, daemon=True).start()
+    return future
+
+def _pump(chunks, n, abandoned, queue_):
+    # Поток на один поток ответа: части складываются в очередь, чтобы читатель мог
+    # соблюдать срок, даже если части перестали приходить
+    try:
+        for content in chunks:
+            if abandoned.is_set():
+                return
+            queue_.put((n, content, None))
+        queue_.put((n, None, None))
+    except Exception as e:
+        queue_.put((n, None, e))
+    finally:
+        chunks.close()
+
+class RequestPolicy:
+    """
+    Политика запросов к chat API: срок на каждую попытку (deadline) и на все попытки
+    вместе (total_deadline), экспоненциальная пауза со случайным разбросом между
+    попытками, резервный запрос (hedge), когда попытка идёт дольше hedge_quantile
+    наблюдаемых задержек, и переход на fallback_models после таймаута.
+
+    Резервный запрос стоит токенов, поэтому отправляется не раньше, чем накопится
+    hedge_min_samples удачных запросов, и не чаще одного на попытку.
+    """
+
+    def __init__(self, deadline=90.0, total_deadline=240.0, attempts=3, base_delay=1.0, max_delay=20.0,
+                 hedge=True, hedge_quantile=0.9, hedge_min_samples=20, min_hedge_delay=2.0,
+                 fallback_models=None, window=200):
+        self.deadline = deadline
+        self.total_deadline = total_deadline
+        self.attempts = attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.hedge = hedge
+        self.hedge_quantile = hedge_quantile
+        self.hedge_min_samples = hedge_min_samples
+        self.min_hedge_delay = min_hedge_delay
+        self.fallback_models = FALLBACK_MODELS if fallback_models is None else fallback_models
+        self._latencies = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def backoff_delay(self, attempt):
+        """Пауза перед повтором номер attempt (с 1): случайная, до base_delay * 2^(attempt-1)"""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+
+    def hedge_delay(self):
+        """Через сколько секунд отправлять резервный запрос, None — пока не отправлять"""
+        with self._lock:
+            if not self.hedge or len(self._latencies) < self.hedge_min_samples:
+                return None
+            latencies = sorted(self._latencies)
+        return max(self.min_hedge_delay, latencies[min(len(latencies) - 1, int(self.hedge_quantile * len(latencies)))])
+
+    def next_model(self, model, error):
+        """Модель для следующей попытки: после таймаута — резервная из fallback_models"""
+        if isinstance(error, RequestTimeout) and model in self.fallback_models:
+            model = self.fallback_models[model]
+            metrics.count("model_fallbacks", model=model)
+        return model
+
+    def stream(self, client, deadline=None, **kwargs):
+        """
+        Одна попытка stream_chat(): отдаёт текст по частям, как stream_chat, но срок
+        deadline действует на весь ответ, даже если части перестали приходить. Если первая
+        часть задерживается дольше hedge_delay(), открывается резервный поток; дальше
+        читается тот, что ответил первым. Повторы и смена модели — на вызывающем, через
+        backoff_delay() и next_model().
+        """
+        deadline = deadline or self.deadline
+        model = kwargs.get("model")
+        chunks = queue.Queue()
+        streams = []
+        alive = set()
+
+        def open_stream(chunks_):
+            abandoned = threading.Event()
+            streams.append(abandoned)
+            alive.add(len(streams) - 1)
+            threading.Thread(target=_pump, args=(chunks_, len(streams) - 1, abandoned, chunks), daemon=True).start()
+
+        # Срок и задержки считаются с отправки, а не с ожидания в очереди rate_limiter
+        rate_limiter.wait()
+        start = time.monotonic()
+        open_stream(_stream_chunks(client, **kwargs))
+        hedge_at = self.hedge_delay()
+        chosen = None
+        try:
+            while True:
+                elapsed = time.monotonic() - start
+                if elapsed >= deadline:
+                    metrics.count("model_timeouts", model=model)
+                    raise RequestTimeout(f"{model} did not finish within {deadline:.0f}s")
+                timeout = deadline - elapsed
+                can_hedge = chosen is None and len(streams) == 1 and hedge_at is not None
+                if can_hedge:
+                    timeout = min(timeout, max(0.0, hedge_at - elapsed))
+                try:
+                    n, content, error = chunks.get(timeout=timeout)
+                except queue.Empty:
+                    if can_hedge and time.monotonic() - start >= hedge_at:
+                        open_stream(stream_chat(client, **kwargs))
+                    continue
+                if chosen is not None and n != chosen:
+                    continue
+                if error is not None:
+                    alive.discard(n)
+                    if chosen is None and alive:
+                        continue
+                    raise error
+                if content is None:
+                    with self._lock:
+                        self._latencies.append(time.monotonic() - start)
+                    return
+                if chosen is None:
+                    chosen = n
+                    if len(streams) > 1:
+                        metrics.count("hedged_requests", result="won" if n else "lost")
+                    for other, abandoned in enumerate(streams):
+                        if other != n:
+                            abandoned.set()
+                yield content
+        finally:
+            for abandoned in streams:
+                abandoned.set()
+
+    def _attempt(self, client, deadline, kwargs):
+        """Одна попытка с резервным запросом; возвращает первый удачный ответ"""
+        # Срок и задержки считаются с отправки, а не с ожидания в очереди rate_limiter;
+        # резервный запрос ждёт свою очередь в своём потоке
+        rate_limiter.wait()
+        start = time.monotonic()
+        first = _start(chat.send, client, **kwargs)
+        pending = {first}
+        hedge_at = self.hedge_delay()
+        hedged = False
+        error = None
+        while pending:
+            remaining = deadline - (time.monotonic() - start)
+            if remaining <= 0:
+                metrics.count("model_timeouts", model=kwargs.get("model"))
+                raise RequestTimeout(f"{kwargs.get('model')} did not answer within {deadline:.0f}s")
+            timeout = remaining
+            if not hedged and hedge_at is not None:
+                timeout = min(timeout, max(0.0, hedge_at - (time.monotonic() - start)))
+            done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    if hedged:
+                        metrics.count("hedged_requests", result="lost" if future is first else "won")
+                    with self._lock:
+                        self._latencies.append(time.monotonic() - start)
+                    return future.result()
+                error = future.exception()
+            if not pending and error is not None:
+                raise error
+            if not done and not hedged and hedge_at is not None and time.monotonic() - start >= hedge_at:
+                pending.add(_start(chat, client, **kwargs))
+                hedged = True
+        raise error
+
+    def chat(self, client, attempts=None, **kwargs):
+        """
+        chat() по этой политике. Возвращает (ответ, модель, которая ответила); после
+        таймаута следующая попытка идёт к резервной модели из fallback_models.
+        """
+        attempts = attempts or self.attempts
+        start = time.monotonic()
+        model = kwargs.get("model")
+        for attempt in range(1, attempts + 1):
+            remaining = self.total_deadline - (time.monotonic() - start)
+            try:
+                return self._attempt(client, min(self.deadline, remaining), dict(kwargs, model=model)), model
+            except Exception as e:
+                metrics.count("model_attempt_errors", kind=type(e).__name__, model=model)
+                if attempt == attempts or not is_retryable_error(e):
+                    raise
+                model = self.next_model(model, e)
+                delay = self.backoff_delay(attempt)
+                if time.monotonic() - start + delay >= self.total_deadline:
+                    raise
+                metrics.count("model_retries")
+                time.sleep(delay)
+
+# После таймаута большой модели повторяем запрос к более быстрой
+FALLBACK_MODELS = {"mistral-large-latest": "mistral-small-latest"}
+
+request_policy = RequestPolicy()
@@ -0,0 +1,155 @@
+# page_triage.py
+# -*- coding: utf-8 -*-
+import random
+import re
+import zlib
+
+BLANK = "blank"
+TITLE = "title"
+DUPLICATE = "duplicate"
+BUILD = "build"
+
+_WORD = re.compile(r"\w+")
+# Bullets and numbered items, and the separators of a run-in list
+_BULLET = re.compile(r"^\s*(?:[-*•▪◦‣–·]|\d+[.)])\s+")
+_LIST_SEPARATOR = re.compile(r"[,;]")
+# A mersenne prime larger than any 32-bit shingle hash
+_PRIME = (1 << 61) - 1
+
+
+class PageVerdict:
+    __slots__ = ("page", "reason", "same_as")
+
+    def __init__(self, page, reason, same_as=None):
+        self.page = page
+        self.reason = reason
+        # For duplicates and incremental builds: the page whose cards cover this one
+        self.same_as = same_as
+
+    def describe(self):
+        if self.reason == BLANK:
+            return "Skipped: the page has no text."
+        if self.reason == TITLE:
+            return "Skipped: looks like a title slide."
+        if self.reason == DUPLICATE:
+            return f"Skipped: same content as page {self.same_as + 1}."
+        return f"Skipped: an earlier build of page {self.same_as + 1}, which has all of its content."
+
+
+def words(text):
+    return _WORD.findall(text.lower())
+
+
+def shingles(text, size=3):
+    tokens = words(text)
+    if len(tokens) < size:
+        return {zlib.crc32(" ".join(tokens).encode("utf-8"))} if tokens else set()
+    return {zlib.crc32(" ".join(tokens[k:k + size]).encode("utf-8")) for k in range(len(tokens) - size + 1)}
+
+
+def page_kind(text, min_chars=8, title_words=8):
+    """BLANK, TITLE or None for a page on its own."""
+    stripped = text.strip()
+    if len(re.sub(r"\W", "", stripped)) < min_chars:
+        return BLANK
+    lines = [line for line in stripped.splitlines() if line.strip()]
+    if len(words(stripped)) > title_words or len(lines) > 3 or "=" in stripped:
+        return None
+    # Proper nouns are capitalized too: a list of drugs or eponyms is content, not a title
+    if _is_list(lines):
+        return None
+    # Kept strict: a short sentence ("Renin is secreted by JG cells") is content, a title is in Title Case
+    alpha = [word for word in _WORD.findall(stripped) if word[0].isalpha()]
+    capitalized = sum(1 for word in alpha if word[0].isupper())
+    if alpha and capitalized >= 0.6 * len(alpha):
+        return TITLE
+    return None
+
+
+def _is_list(lines):
+    if any(_BULLET.match(line) for line in lines):
+        return True
+    if sum(len(_LIST_SEPARATOR.findall(line)) for line in lines) >= 2:
+        return True
+    # Names stacked one or two to a line
+    return len(lines) >= 3 and all(len(words(line)) <= 2 for line in lines)
+
+
+class MinHash:
+    """MinHash signatures with LSH banding to find near-duplicate pages without comparing every pair."""
+
+    def __init__(self, permutations=64, bands=16, seed=1):
+        rng = random.Random(seed)
+        self.coefficients = [(rng.randrange(1, _PRIME), rng.randrange(0, _PRIME)) for _ in range(permutations)]
+        self.bands = bands
+        self.rows = permutations // bands
+
+    def signature(self, shingle_set):
+        return [min((a * shingle + b) % _PRIME for shingle in shingle_set) for a, b in self.coefficients]
+
+    def candidates(self, signatures):
+        """Pairs (earlier, later) that share at least one band."""
+        pairs = set()
+        for band in range(self.bands):
+            buckets = {}
+            for page, signature in signatures.items():
+                key = tuple(signature[band * self.rows:(band + 1) * self.rows])
+                buckets.setdefault(key, []).append(page)
+            for pages in buckets.values():
+                for k, first in enumerate(pages):
+                    for second in pages[k + 1:]:
+                        pairs.add((min(first, second), max(first, second)))
+        return pairs
+
+
+def jaccard(a, b):
+    return len(a & b) / len(a | b) if a or b else 1.0
+
+
+def triage_pages(texts, duplicate_threshold=0.9, build_threshold=0.9):
+    """
+    Finds pages that do not need a model call: blank pages, title slides, near-duplicates
+    of another page (repeated agenda or outline slides) and incremental builds, where a
+    slide is followed by a version of itself with more bullets. Only the final build is
+    sent. texts maps page -> text; returns {page: PageVerdict} for the pages to skip.
+    """
+    verdicts = {}
+    shingle_sets = {}
+    for page in sorted(texts):
+        kind = page_kind(texts[page])
+        if kind is not None:
+            verdicts[page] = PageVerdict(page, kind)
+        else:
+            shingle_sets[page] = shingles(texts[page])
+
+    # Incremental builds: nearly all of a page is contained in the page right after it
+    pages = sorted(texts)
+    for page, following in zip(pages, pages[1:]):
+        if page not in shingle_sets or following not in shingle_sets:
+            continue
+        current, after = shingle_sets[page], shingle_sets[following]
+        if len(after) > len(current) and len(current & after) >= build_threshold * len(current):
+            verdicts[page] = PageVerdict(page, BUILD, following)
+    # A chain of builds points at its last slide
+    for verdict in sorted(verdicts.values(), key=lambda v: -v.page):
+        if verdict.reason == BUILD and verdict.same_as in verdicts and verdicts[verdict.same_as].reason == BUILD:
+            verdict.same_as = verdicts[verdict.same_as].same_as
+
+    remaining = {page: shingle_set for page, shingle_set in shingle_sets.items() if page not in verdicts}
+    minhash = MinHash()
+    signatures = {page: minhash.signature(shingle_set) for page, shingle_set in remaining.items()}
+    for first, second in sorted(minhash.candidates(signatures)):
+        if first in verdicts or second in verdicts:
+            continue
+        if jaccard(remaining[first], remaining[second]) >= duplicate_threshold:
+            # Keep the first occurrence
+            verdicts[second] = PageVerdict(second, DUPLICATE, first)
+
+    return verdicts
+
+
+def summarize(verdicts):
+    counts = {BLANK: 0, TITLE: 0, DUPLICATE: 0, BUILD: 0}
+    for verdict in verdicts.values():
+        counts[verdict.reason] += 1
+    return counts
@@ -0,0 +1,302 @@
+# pdf_store.py
+# -*- coding: utf-8 -*-
+import io
+import json
+import multiprocessing
+import os
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+import fitz  # PyMuPDF
+from PIL import Image
+from boilerplate import BoilerplateProfile, text_blocks
+from metrics import metrics
+from prompts import estimate_tokens
+
+
+def encode_page(doc, page, dpi, fmt="jpg", quality=100, max_bytes=None):
+    """
+    Renders one page as JPEG or WebP. With max_bytes the quality is lowered in steps,
+    then the resolution, until the image fits.
+    """
+    while True:
+        pixmap = doc.load_page(page).get_pixmap(dpi=dpi)
+        image = Image.frombytes("RGB", (pixmap.width, pixmap.height), pixmap.samples) if fmt == "webp" else None
+        for step_quality in range(quality, 29, -10):
+            if image is not None:
+                buffer = io.BytesIO()
+                image.save(buffer, format="WEBP", quality=step_quality)
+                image_bytes = buffer.getvalue()
+            else:
+                image_bytes = pixmap.tobytes(output='jpg', jpg_quality=step_quality)
+            if max_bytes is None or len(image_bytes) <= max_bytes:
+                return image_bytes
+        if dpi <= 50:
+            return image_bytes
+        dpi = max(50, int(dpi * 0.75))
+
+
+# Documents opened by this worker process, so every chunk does not reopen the file
+_worker_docs = {}
+
+
+def _render_chunk(file_path, pages, settings):
+    doc = _worker_docs.get(file_path)
+    if doc is None:
+        doc = _worker_docs[file_path] = fitz.open(file_path)
+    return [(page, encode_page(doc, page, **settings)) for page in pages]
+
+
+def render_pages(file_path, pages, workers=None, chunk_size=4, **settings):
+    """
+    Renders pages on a pool of processes, each with its own fitz document, and yields
+    (page, image bytes) in page order as soon as each page and all pages before it are
+    done, so the first pages are usable while the rest still render. settings are
+    passed to encode_page. Only a few chunks per worker are in flight at a time.
+    """
+    pages = list(pages)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(pages) <= chunk_size:
+        doc = fitz.open(file_path)
+        try:
+            for page in pages:
+                yield page, encode_page(doc, page, **settings)
+        finally:
+            doc.close()
+        return
+
+    chunks = [pages[k:k + chunk_size] for k in range(0, len(pages), chunk_size)]
+    # spawn: forking a process that runs Streamlit's threads is not safe
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+        pending = deque()
+        next_chunk = 0
+        try:
+            while pending or next_chunk < len(chunks):
+                while next_chunk < len(chunks) and len(pending) < workers * 2:
+                    pending.append(pool.submit(_render_chunk, file_path, chunks[next_chunk], settings))
+                    next_chunk += 1
+                yield from pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+class PdfPageStore:
+    """
+    Lazy view over a PDF: the page count is known as soon as the file is opened,
+    text and images are only extracted for the pages that are actually asked for.
+
+    Images come in three tiers: small thumbnails for preview lists, the page image
+    shown next to the cards, and export images for Anki that are rendered with their
+    own DPI, format and quality and shrunk until they fit a byte budget.
+
+    With an ExtractionCache and the document's content hash, text and images are also
+    kept on disk and a document that was opened before is not extracted again.
+
+    With strip_boilerplate, text() leaves out the headers, footers and other lines that
+    recur across the document (see BoilerplateProfile) and normalizes whitespace and
+    hyphenation, so they are not paid for in every prompt.
+    """
+
+    def __init__(self, file_path, dpi=150, jpg_quality=100, max_cached_images=64, thumb_dpi=40,
+                 thumb_quality=70, max_cached_thumbnails=512, cache=None, doc_hash=None, strip_boilerplate=True):
+        self.file_path = file_path
+        self.cache = cache
+        self.doc_hash = doc_hash
+        self.strip_boilerplate = strip_boilerplate
+        self.dpi = dpi
+        self.jpg_quality = jpg_quality
+        self.max_cached_images = max_cached_images
+        self.thumb_dpi = thumb_dpi
+        self.thumb_quality = thumb_quality
+        self.max_cached_thumbnails = max_cached_thumbnails
+
+        self._doc = fitz.open(file_path)
+        self.page_count = len(self._doc)
+
+        self._texts = {}
+        self._boilerplate = None
+        # page -> (tokens of the raw text, tokens of the text that is sent)
+        self._text_tokens = {}
+        self._images = OrderedDict()
+        self._thumbnails = OrderedDict()
+        self._exports = OrderedDict()
+        self._export_stats = {}
+        # fitz documents must not be used from several threads at once
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return self.page_count
+
+    def text(self, page):
+        if self.strip_boilerplate:
+            return self.clean_text(page)
+        if page not in self._texts:
+            with self._lock:
+                text = self._from_disk("text", page)
+                if text is None:
+                    with metrics.timer("text_extraction"):
+                        text = self._doc.load_page(page).get_text()
+                    self._to_disk("text", page, text.encode("utf-8"))
+                else:
+                    text = text.decode("utf-8")
+                self._texts[page] = text
+        return self._texts[page]
+
+    def clean_text(self, page):
+        if page not in self._texts:
+            with self._lock:
+                data = self._from_disk("text:clean", page)
+                if data is None:
+                    profile = self.boilerplate()
+                    with metrics.timer("text_extraction"):
+                        blocks = text_blocks(self._doc.load_page(page))
+                        text = profile.strip(blocks)
+                    raw_tokens = estimate_tokens("".join(block for _, block in blocks))
+                    self._to_disk("text:clean", page,
+                                  json.dumps({"text": text, "raw_tokens": raw_tokens}).encode("utf-8"))
+                else:
+                    data = json.loads(data)
+                    text, raw_tokens = data["text"], data["raw_tokens"]
+                self._texts[page] = text
+                self._text_tokens[page] = (raw_tokens, estimate_tokens(text))
+        return self._texts[page]
+
+    def boilerplate(self):
+        """The document's BoilerplateProfile, learned once from a sample of its pages (call with the lock held)."""
+        if self._boilerplate is None:
+            data = self._from_disk("boilerplate", -1)
+            if data is None:
+                with metrics.timer("boilerplate_scan"):
+                    self._boilerplate = BoilerplateProfile.learn(self._doc)
+                self._to_disk("boilerplate", -1, self._boilerplate.to_json().encode("utf-8"))
+            else:
+                self._boilerplate = BoilerplateProfile.from_json(data.decode("utf-8"))
+        return self._boilerplate
+
+    def text_stats(self):
+        """Estimated input tokens of the extracted pages before and after removing boilerplate."""
+        raw = sum(tokens[0] for tokens in self._text_tokens.values())
+        sent = sum(tokens[1] for tokens in self._text_tokens.values())
+        return {"pages": len(self._text_tokens), "raw_tokens": raw, "tokens": sent, "saved_tokens": raw - sent,
+                "boilerplate_lines": len(self._boilerplate.lines) if self._boilerplate is not None else 0}
+
+    def _from_disk(self, kind, page):
+        if self.cache is None:
+            return None
+        return self.cache.get(self.doc_hash, kind, page)
+
+    def _to_disk(self, kind, page, data):
+        if self.cache is not None:
+            self.cache.put(self.doc_hash, kind, page, data)
+
+    def _disk_render(self, kind, page, render):
+        data = self._from_disk(kind, page)
+        if data is None:
+            with metrics.timer("page_render", kind=kind.split(":")[0]):
+                data = render()
+            self._to_disk(kind, page, data)
+        return data
+
+    def _cached_render(self, cache, key, max_entries, render):
+        with self._lock:
+            if key in cache:
+                cache.move_to_end(key)
+                return cache[key]
+
+            image_bytes = render()
+            self._remember(cache, key, max_entries, image_bytes)
+            return image_bytes
+
+    @staticmethod
+    def _remember(cache, key, max_entries, image_bytes):
+        cache[key] = image_bytes
+        while len(cache) > max_entries:
+            cache.popitem(last=False)
+
+    def _render_jpg(self, page, dpi, quality):
+        pixmap = self._doc.load_page(page).get_pixmap(dpi=dpi)
+        return pixmap.tobytes(output='jpg', jpg_quality=quality)
+
+    def image(self, page):
+        kind = f"image:{self.dpi}:{self.jpg_quality}"
+        return self._cached_render(self._images, page, self.max_cached_images, lambda: self._disk_render(
+            kind, page, lambda: self._render_jpg(page, self.dpi, self.jpg_quality)))
+
+    def thumbnail(self, page):
+        kind = f"thumbnail:{self.thumb_dpi}:{self.thumb_quality}"
+        return self._cached_render(self._thumbnails, page, self.max_cached_thumbnails, lambda: self._disk_render(
+            kind, page, lambda: self._render_jpg(page, self.thumb_dpi, self.thumb_quality)))
+
+    @staticmethod
+    def _export_kind(dpi, fmt, quality, max_bytes):
+        return f"export:{dpi}:{fmt}:{quality}:{max_bytes}"
+
+    def export_image(self, page, dpi=120, fmt="jpg", quality=80, max_bytes=None):
+        """
+        Page image for Anki, fmt is "jpg" or "webp". With max_bytes the quality is lowered
+        in steps, then the resolution, until the image fits. The encoded bytes are cached,
+        so pushing a page twice or writing it to several exports does not render it again.
+        """
+        key = (page, dpi, fmt, quality, max_bytes)
+        kind = self._export_kind(dpi, fmt, quality, max_bytes)
+        image_bytes = self._cached_render(self._exports, key, self.max_cached_images, lambda: self._disk_render(
+            kind, page, lambda: encode_page(self._doc, page, dpi, fmt, quality, max_bytes)))
+        self._record_export(page, image_bytes)
+        return image_bytes
+
+    def iter_export_images(self, pages, workers=None, dpi=120, fmt="jpg", quality=80, max_bytes=None):
+        """
+        export_image for many pages, rendered by render_pages in parallel processes and
+        yielded in page order as they become ready. Cached pages are not rendered again.
+        """
+        settings = {"dpi": dpi, "fmt": fmt, "quality": quality, "max_bytes": max_bytes}
+        kind = self._export_kind(dpi, fmt, quality, max_bytes)
+        pages = list(pages)
+        with self._lock:
+            missing = [page for page in pages if (page, dpi, fmt, quality, max_bytes) not in self._exports]
+        if self.cache is not None:
+            stored = self.cache.stored_pages(self.doc_hash, kind)
+            missing = [page for page in missing if page not in stored]
+        rendered = render_pages(self.file_path, missing, workers=workers, **settings)
+        missing = set(missing)
+
+        for page in pages:
+            if page not in missing:
+                yield page, self.export_image(page, **settings)
+                continue
+            # Time spent waiting for the pool, the rendering itself overlaps with the caller
+            with metrics.timer("page_render", kind="export"):
+                _, image_bytes = next(rendered)
+            self._to_disk(kind, page, image_bytes)
+            with self._lock:
+                self._remember(self._exports, (page, dpi, fmt, quality, max_bytes), self.max_cached_images,
+                               image_bytes)
+            self._record_export(page, image_bytes)
+            yield page, image_bytes
+
+    def _record_export(self, page, image_bytes):
+        # Compared with the on-screen image, which is what every page cost before export
+        # images existed; only known for pages that were shown, nothing is rendered for it
+        baseline = self._images.get(page)
+        self._export_stats[page] = (len(baseline) if baseline is not None else None, len(image_bytes))
+
+    def image_stats(self):
+        """Bytes of the exported page images, and the bytes saved against the full-size page images."""
+        compared = [entry for entry in self._export_stats.values() if entry[0] is not None]
+        return {"pages": len(self._export_stats),
+                "export_bytes": sum(entry[1] for entry in self._export_stats.values()),
+                "compared_pages": len(compared),
+                "saved_bytes": sum(entry[0] - entry[1] for entry in compared),
+                "thumbnail_bytes": sum(len(thumbnail) for thumbnail in self._thumbnails.values())}
+
+    def page_range(self, start_page, num_pages):
+        """Zero-based page indices for a 1-based start page and a page count."""
+        return range(start_page - 1, min(start_page - 1 + num_pages, self.page_count))
+
+    def close(self):
+        with self._lock:
+            self._images.clear()
+            self._thumbnails.clear()
+            self._exports.clear()
+            self._doc.close()
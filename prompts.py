@@ -0,0 +1,168 @@
+# prompts.py
+# -*- coding: utf-8 -*-
+import math
+import re
+
+BEHAVIOUR = "You are a flashcard making assistant. Follow the user's requirements carefully and to the letter. Always call one of the provided functions."
+
+SINGLE_INTRO = "You are receiving the text from one slide of a lecture."
+SINGLE_TITLE_RULE = "- Use 'null_function' if page is just a title slide.\n- Return json.\n"
+
+PACKED_INTRO = ("You are receiving the text from several consecutive slides of a lecture. "
+                "Each slide starts with a line of the form '--- Page N ---'.")
+PART_INTRO = ("You are receiving one part of the text from a long page of a lecture. "
+              "The other parts are sent separately, so only make flashcards for the text of this part.")
+
+PACKED_TITLE_RULE = """- Treat every slide separately and add a "page" field with its page number N to every flashcard.
+- List the page numbers of slides that are just title slides in "title_pages" and make no flashcards for them.
+- Return json of the form {"flashcards": [{"page": N, "front": "...", "back": "..."}], "title_pages": [N]}.
+"""
+
+# Per-page marker used when several pages share one request
+PAGE_MARKER = "--- Page {} ---"
+
+
+# Chinese, Japanese and Korean characters, about one token each
+_WIDE = re.compile(r"[\u3040-\u30ff\u3400-\u9fff\uac00-\ud7af\uf900-\ufaff]")
+
+# Where page text may be split, in order of preference, and what joins the pieces back together
+_BOUNDARIES = [
+    (re.compile(r"\n\s*\n"), "\n\n"),
+    (re.compile(r"(?<=[.!?;])\s+|(?<=[。！？；])"), " "),
+    (re.compile(r"\n"), "\n"),
+    (re.compile(r"\s+"), " "),
+]
+
+
+def estimate_tokens(text):
+    """Rough token count (about four characters per token, one per CJK character) good enough for budgeting requests."""
+    wide = len(_WIDE.findall(text))
+    return (len(text) - wide + 3) // 4 + wide
+
+
+def flashcard_prompt(lang, packed=False, part=False):
+    prompt = """
+You are receiving the text from one slide of a lecture. Use the following principles when making the flashcards:
+
+Material: "Source material"
+
+Task: Your task is to analyze the Source Material and condense the information into concise and direct statements. Ensure that each statement is clearly written at a level appropriate for medical students while being easily understandable, and adheres to the specified formatting and reference criteria. 
+
+Formatting Criteria: 
+- Construct a table with two columns: "Statements" and "explanations".
+- Each row of the "Statements" column should contain a single statement written in Anki cloze deletion mark-up.
+- Each row of the "explanation" column should provide additional details for the corresponding "Statement". There should be no cloze deletions in this column.
+- If no text is present, leave everything bland.
+
+Reference Criteria for each "Statement":
+- Restrict each statement to 1 or 2 cloze deletions. If needed, you may add 1-2 more cloze deletions but restrict them to either cloze1 or cloze2.
+- Limit the word count of each statement to less than 40 words.
+- Keep the text within the cloze deletions limited to one or two Source key words.
+- Each statement must be able to stand alone.
+- Keep ONLY simple, direct, statements in the "Statements" column. Keep any additional information in the "Explanation" column. Search and research USMLE textbook for detailed explanations supporting the statement.
+- Use the following examples below as a guideline on how to construct a "Statement" and "Explanation" based on provided source material. Be mindful of the cloze positions, and how statements adhere to the source material with minimal deviation.
+
+Example: 
+    Source Material: 
+        Hyperaldosteronism: Increased secretion of aldosterone from adrenal gland. Clinical features include hypertension, ↓ K⁺ (from increased renal Na+-K+ ATPase activity, resulting increased K⁺ secretion and causing hypokalemia) or normal K⁺, metabolic alkalosis. 1° hyperaldosteronism does not directly cause edema due to aldosterone escape mechanism. However, certain 2° causes of hyperaldosteronism (eg, heart failure) impair the aldosterone escape mechanism, leading to worsening of edema.
+        Primary hyperaldosteronism: Seen with adrenal adenoma (Conn syndrome), ectopic aldosterone-secreting tumors (kidney, ovaries), or bilateral adrenal hyperplasia. ↑ aldosterone, ↓ renin. Presents with increased renal blood flow and increased glomerular filtration rate, resulting in sodium and water retention (severe volume overload). Causes resistant hypertension.
+        Secondary hyperaldosteronism: Seen in patients with renovascular hypertension, juxtaglomerular cell tumors (independent activation of RAAS, from excess renin-producing "reninoma"), and edema (eg, cirrhosis, heart failure, nephrotic syndrome). ↑ aldosterone, ↑ renin. Characterized by increased aldosterone production due to an external stimulus, primarily as a response to activation of the renin-angiotensin-aldosterone system (RAAS).
+
+    Table:
+| Statements | Explanation 
+| {{c1::word}} Give an example of what you want here | - Explanation here |
+| This is a {{c1::second}} example to reinforce the formatting. | - Explanation here |
+| {{c1::Primary}} hyperaldosteronism is characterized by high aldosterone and {{c2::low}} renin | - This results in resistant hypertension; renin is downregulated via high blood pressure |
+| Hyperaldosteronism {{c2::increases}} K⁺ secretion and causes {{c2::hypo}}kalemia | - Increased Na+ reabsorption → increased Na+-K+ ATPase activity → increased driving force across luminal membrane from increased intracellular K+ |
+| Primary hyperaldosteronism may present with {{c1::increased}} renal blood flow and {{c1::increased}} glomerular filtration rate | - Due to arterial hypertension and hypersecretion of aldosterone |
+| Primary hyperaldosteronism initially causes severe volume {{c1::overload}} and {{c1::hyper}}tension | - Due to sodium and water retention |
+| Adrenal adenoma and ectopic aldosterone-secreting tumors (kidney, ovaries) may cause {{c1::primary}} hyperaldosteronism | - Can lead to resistant hypertension |
+| {{c1::Secondary}} hyperaldosteronism is seen in patients with juxtaglomerular cell tumor due to independent activation of the RAAS | - Results in severe hypertension that is difficult to control - These secrete renin (hence AKA reninoma), thus you also have Angiotensin II upregulation as well as aldosterone (failure of aldosterone escape) |
+| Secondary hyperaldosteronism is due to activation of {{c1::renin-angiotensin}} system | - Seen in patients with renovascular hypertension (renal artery stenosis), juxtaglomerular cell tumors, and edema (cirrhosis, heart failure, nephrotic syndrome) |
+| Congestive heart failure, cirrhosis, nephrotic syndrome, and excessive peripheral edema may cause {{c1::secondary}} hyperaldosteronism | - 2° hyperaldosteronism is driven by an increase in renin production (i.e. stimulation from edema) |
+| {{c1::Secondary}} hyperaldosteronism is characterized by high aldosterone and {{c2::high}} renin | - Seen in patients with renovascular hypertension and juxtaglomerular cell tumor (due to independent activation of renin-angiotensin-aldosterone system), as well as causes of edema (cirrhosis, heart failure, nephrotic syndrome) |
+End of Example
+
+- Only add each piece of information once.
+- Questions and answers must be in """ + lang + """.
+- Ignore information about the school or professor.
+- If whole slide fits on one flashcard, do that.
+- Use 'null_function' if page is just a title slide.
+- Return json.
+"""
+    if packed:
+        prompt = prompt.replace(SINGLE_INTRO, PACKED_INTRO).replace(SINGLE_TITLE_RULE, PACKED_TITLE_RULE)
+    elif part:
+        prompt = prompt.replace(SINGLE_INTRO, PART_INTRO)
+    return prompt
+
+
+def pack_pages(texts, max_tokens):
+    """
+    Groups consecutive pages so that the page text of each group stays within max_tokens.
+    A page that is larger than the budget on its own gets a group of its own.
+    """
+    groups = []
+    group = []
+    group_tokens = 0
+    for page in sorted(texts):
+        tokens = estimate_tokens(PAGE_MARKER.format(page + 1)) + estimate_tokens(texts[page])
+        consecutive = group and page == group[-1] + 1
+        if group and (not consecutive or group_tokens + tokens > max_tokens):
+            groups.append(group)
+            group = []
+            group_tokens = 0
+        group.append(page)
+        group_tokens += tokens
+    if group:
+        groups.append(group)
+    return groups
+
+
+def packed_text(texts, pages):
+    return "\n\n".join(PAGE_MARKER.format(page + 1) + "\n" + texts[page] for page in pages)
+
+
+def split_text(text, max_tokens):
+    """
+    Splits the text of a page that is larger than max_tokens into parts of about equal
+    size that each stay within it. Splits at paragraph breaks where possible, then at
+    sentence ends, line breaks and, for text without any of those, between words.
+    """
+    tokens = estimate_tokens(text)
+    if tokens <= max_tokens:
+        return [text]
+    # Parts are closed once they reach an even share, so a page just over the budget
+    # is not split into a full part and a scrap
+    target = math.ceil(tokens / math.ceil(tokens / max_tokens))
+    return [part for part in _split(text, target, max_tokens, 0) if part.strip()]
+
+
+def _split(text, target, limit, level):
+    tokens = estimate_tokens(text)
+    if tokens <= limit:
+        return [text]
+    if level == len(_BOUNDARIES):
+        step = max(1, len(text) * target // tokens)
+        return [text[start:start + step] for start in range(0, len(text), step)]
+    boundary, joiner = _BOUNDARIES[level]
+    parts = []
+    current = ""
+    for piece in boundary.split(text):
+        if not piece:
+            continue
+        if estimate_tokens(piece) > limit:
+            if current:
+                parts.append(current)
+                current = ""
+            parts.extend(_split(piece, target, limit, level + 1))
+        elif not current:
+            current = piece
+        elif estimate_tokens(current) < target and estimate_tokens(current + joiner + piece) <= limit:
+            current += joiner + piece
+        else:
+            parts.append(current)
+            current = piece
+    if current:
+        parts.append(current)
+    return parts
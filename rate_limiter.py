@@ -1 +1,168 @@
- 
\ No newline at end of file
+# rate_limiter.py
+# -*- coding: utf-8 -*-
+import asyncio
+import threading
+import time
+from email.utils import parsedate_to_datetime
+
+from metrics import metrics
+
+
+class RateLimiter:
+    """
+    Token bucket shared by every thread (and event loop) that talks to the API.
+
+    Two budgets are enforced: requests per second and tokens per minute. A request
+    slot is reserved up front in wait(); tokens are debited afterwards with
+    record_usage() since the real count is only known once the response arrives,
+    so a large completion makes the following callers wait until the budget has
+    refilled. backoff() pauses everyone after a rate-limit error, using the
+    provider's retry-after hint when there is one.
+    """
+
+    def __init__(self, requests_per_second=None, tokens_per_minute=None, burst=1, min_interval=None,
+                 max_backoff=60.0):
+        if min_interval is not None:
+            requests_per_second = 1.0 / min_interval if min_interval > 0 else None
+
+        self.requests_per_second = requests_per_second
+        self.tokens_per_minute = tokens_per_minute
+        self.burst = burst
+        self.max_backoff = max_backoff
+
+        self._lock = threading.Lock()
+        self._last_refill = time.monotonic()
+        self._request_tokens = float(burst)
+        self._budget_tokens = float(tokens_per_minute or 0)
+        self._blocked_until = 0.0
+        self._consecutive_backoffs = 0
+
+        self._queue_depth = 0
+        self._max_queue_depth = 0
+        self._waits = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+        self._backoffs = 0
+
+    def _refill(self, now):
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        if self.requests_per_second:
+            self._request_tokens = min(self.burst, self._request_tokens + elapsed * self.requests_per_second)
+        if self.tokens_per_minute:
+            self._budget_tokens = min(self.tokens_per_minute,
+                                      self._budget_tokens + elapsed * self.tokens_per_minute / 60.0)
+
+    def _reserve(self):
+        """Takes a request slot and returns how long the caller has to sleep before using it."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+
+            delay = max(0.0, self._blocked_until - now)
+            if self.requests_per_second:
+                # The balance may go negative: later callers queue up behind this one
+                self._request_tokens -= 1
+                if self._request_tokens < 0:
+                    delay = max(delay, -self._request_tokens / self.requests_per_second)
+            if self.tokens_per_minute and self._budget_tokens < 0:
+                delay = max(delay, -self._budget_tokens * 60.0 / self.tokens_per_minute)
+
+            self._queue_depth += 1
+            self._max_queue_depth = max(self._max_queue_depth, self._queue_depth)
+            return delay
+
+    def _release(self, waited):
+        with self._lock:
+            self._queue_depth -= 1
+            self._waits += 1
+            self._total_wait += waited
+            self._max_wait = max(self._max_wait, waited)
+        metrics.observe("stage_seconds", waited, stage="rate_limit_wait")
+
+    def wait(self):
+        start = time.monotonic()
+        delay = self._reserve()
+        try:
+            if delay > 0:
+                time.sleep(delay)
+        finally:
+            waited = time.monotonic() - start
+            self._release(waited)
+        return waited
+
+    async def wait_async(self):
+        start = time.monotonic()
+        delay = self._reserve()
+        try:
+            if delay > 0:
+                await asyncio.sleep(delay)
+        finally:
+            waited = time.monotonic() - start
+            self._release(waited)
+        return waited
+
+    def record_usage(self, tokens):
+        if not self.tokens_per_minute or not tokens:
+            return
+        with self._lock:
+            self._refill(time.monotonic())
+            self._budget_tokens -= tokens
+            self._consecutive_backoffs = 0
+
+    def record_success(self):
+        with self._lock:
+            self._consecutive_backoffs = 0
+
+    def backoff(self, retry_after=None):
+        """Blocks all callers after a rate-limit error; exponential when the provider gives no hint."""
+        metrics.count("rate_limit_backoffs")
+        with self._lock:
+            self._backoffs += 1
+            self._consecutive_backoffs += 1
+            if retry_after is None:
+                base = 1.0 / self.requests_per_second if self.requests_per_second else 1.0
+                retry_after = base * 2 ** (self._consecutive_backoffs - 1)
+            retry_after = min(retry_after, self.max_backoff)
+            self._blocked_until = max(self._blocked_until, time.monotonic() + retry_after)
+            return retry_after
+
+    def stats(self):
+        with self._lock:
+            return {
+                "waits": self._waits,
+                "total_wait_s": self._total_wait,
+                "avg_wait_s": self._total_wait / self._waits if self._waits else 0.0,
+                "max_wait_s": self._max_wait,
+                "queue_depth": self._queue_depth,
+                "max_queue_depth": self._max_queue_depth,
+                "backoffs": self._backoffs,
+            }
+
+
+def is_rate_limit_error(e):
+    return getattr(e, "http_status", None) == 429 or "429" in str(e)
+
+
+def retry_after_from_error(e):
+    """Seconds to wait according to the Retry-After header of a rate-limit error, or None."""
+    headers = {k.lower(): v for k, v in (getattr(e, "headers", None) or {}).items()}
+
+    value = headers.get("retry-after")
+    if value is not None:
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            try:
+                return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+            except (TypeError, ValueError):
+                pass
+
+    value = headers.get("retry-after-ms")
+    if value is not None:
+        try:
+            return max(0.0, float(value) / 1000)
+        except ValueError:
+            pass
+
+    return None
@@ -0,0 +1,328 @@
+# response_parser.py
+# -*- coding: utf-8 -*-
+import re
+
+# Characters that can end a run of plain string content
+_STRING_SPECIAL = re.compile(r'["\\“”„]')
+# Characters that matter between values
+_STRUCTURAL = re.compile(r'[{}\[\]:,"“„\n]')
+_NON_SPACE = re.compile(r'\S')
+
+_OPEN_QUOTES = {'"': '"', '“': '”"', '„': '“”"'}
+_ESCAPES = {'n': '\n', 't': '\t', 'r': '\r', 'b': '\b', 'f': '\f'}
+# A quote inside a string only closes it when followed by one of these
+_AFTER_CLOSE = '}]:'
+# ... or by a comma and then one of these: the next key, value or object
+_AFTER_COMMA = '"“„{[]}'
+# The title slide list of a packed answer
+_TITLE_PAGES = re.compile(r'["“„]title_pages["”]\s*:\s*\[([^\]]*)\]')
+
+
+class ParseError:
+    __slots__ = ("position", "message")
+
+    def __init__(self, position, message):
+        self.position = position
+        self.message = message
+
+    def __repr__(self):
+        return f"ParseError(position={self.position}, message={self.message!r})"
+
+    def __str__(self):
+        return f"{self.message} (at character {self.position})"
+
+
+class ParseResult:
+    __slots__ = ("cards", "errors", "truncated")
+
+    def __init__(self, cards, errors, truncated):
+        self.cards = cards
+        self.errors = errors
+        self.truncated = truncated
+
+
+class FlashcardParser:
+    """
+    Tolerant single-pass parser for the model's flashcard output.
+
+    Text is fed in chunks (a whole response or pieces of a stream) and every object
+    that has a front and a back is yielded as soon as its closing brace arrives.
+    Anything before the first brace (function-call prefixes, code fences) is ignored,
+    curly quotes are accepted as delimiters and a quote inside a string only ends it
+    when a colon or closing bracket follows, or a comma and then the next key or value,
+    so unescaped inner quotes survive, also in 'he said "yes", then left'.
+    close() salvages the card that was cut off by a truncated response and falls back
+    to markdown table rows when no JSON was found at all.
+    """
+
+    def __init__(self):
+        self.cards = []
+        self.errors = []
+        self.truncated = False
+
+        self._pos = 0
+        self._at = 0
+        self._stack = []
+        self._in_string = False
+        self._closers = '"'
+        self._buf = []
+        self._escape = None
+        self._pending = None
+        self._comma = False
+        self._bare = []
+        self._line = []
+        self._table_cards = []
+
+    def feed(self, chunk):
+        """Consumes the next piece of text and returns the cards it completed."""
+        new_cards = []
+        i = 0
+        n = len(chunk)
+        while i < n:
+            if self._in_string:
+                i = self._feed_string(chunk, i, new_cards)
+            else:
+                i = self._feed_structure(chunk, i, new_cards)
+        self._pos += n
+        return new_cards
+
+    def _feed_string(self, chunk, i, new_cards):
+        if self._escape is not None:
+            return self._feed_escape(chunk, i)
+
+        if self._pending is not None:
+            match = _NON_SPACE.search(chunk, i)
+            if match is None:
+                self._pending += chunk[i:]
+                return len(chunk)
+            j = match.start()
+            char = chunk[j]
+            if not self._comma and char == ',':
+                # Only the text after the comma tells whether the string ended
+                self._pending += chunk[i:j + 1]
+                self._comma = True
+                return j + 1
+            if (char in _AFTER_COMMA) if self._comma else (char in _AFTER_CLOSE):
+                # The comma, if any, was consumed; it has nothing left to do after a string
+                self._pending = None
+                self._comma = False
+                self._end_string(new_cards)
+                return j
+            # The quote was part of the text
+            self._buf.append(self._pending + chunk[i:j])
+            self._pending = None
+            self._comma = False
+            return j
+
+        match = _STRING_SPECIAL.search(chunk, i)
+        if match is None:
+            self._buf.append(chunk[i:])
+            return len(chunk)
+        j = match.start()
+        self._buf.append(chunk[i:j])
+        char = chunk[j]
+        if char == '\\':
+            self._escape = ''
+        elif char in self._closers:
+            self._pending = char
+        else:
+            self._buf.append(char)
+        return j + 1
+
+    def _feed_escape(self, chunk, i):
+        char = chunk[i]
+        if self._escape == '':
+            if char == 'u':
+                self._escape = 'u'
+                return i + 1
+            self._buf.append(_ESCAPES.get(char, char))
+            self._escape = None
+            return i + 1
+
+        # Collecting the four hex digits of a \uXXXX escape
+        self._escape += char
+        if len(self._escape) == 5:
+            try:
+                self._buf.append(chr(int(self._escape[1:], 16)))
+            except ValueError:
+                self._error(self._pos + i, f"invalid unicode escape \\{self._escape}")
+                self._buf.append(self._escape)
+            self._escape = None
+        return i + 1
+
+    def _feed_structure(self, chunk, i, new_cards):
+        match = _STRUCTURAL.search(chunk, i)
+        j = match.start() if match else len(chunk)
+        text = chunk[i:j]
+        if self._stack:
+            if text.strip():
+                self._bare.append(text)
+        else:
+            self._line.append(text)
+        if match is None:
+            return j
+
+        char = chunk[j]
+        self._at = self._pos + j
+        if not self._stack and (char != '{' or self._in_table_row()):
+            # Outside JSON only table rows are of interest; their cloze braces are not objects
+            if char == '\n':
+                self._end_line()
+            else:
+                self._line.append(char)
+            return j + 1
+
+        if char == '{':
+            self._end_line()
+            self._stack.append([{}, None])
+        elif char == '[':
+            self._stack.append([[], None])
+        elif char in '}]':
+            self._close_container(char, new_cards)
+        elif char in _OPEN_QUOTES:
+            self._bare = []
+            self._in_string = True
+            self._closers = _OPEN_QUOTES[char]
+        elif char == ':':
+            self._bare = []
+        elif char == ',':
+            self._end_bare()
+        return j + 1
+
+    def _end_string(self, new_cards):
+        value = ''.join(self._buf)
+        self._buf = []
+        self._in_string = False
+        frame = self._stack[-1]
+        if isinstance(frame[0], dict) and frame[1] is None:
+            frame[1] = value
+        else:
+            self._add_value(value)
+
+    def _end_bare(self):
+        value = ''.join(self._bare).strip()
+        self._bare = []
+        if not value:
+            return
+        literals = {'true': True, 'false': False, 'null': None}
+        if value in literals:
+            self._add_value(literals[value])
+            return
+        try:
+            self._add_value(int(value))
+        except ValueError:
+            try:
+                self._add_value(float(value))
+            except ValueError:
+                self._error(self._at, f"unexpected text {value[:40]!r}")
+                self._add_value(value)
+
+    def _add_value(self, value):
+        frame = self._stack[-1]
+        if isinstance(frame[0], dict):
+            if frame[1] is None:
+                self._error(self._at, "value without a key")
+                return
+            frame[0][frame[1]] = value
+            frame[1] = None
+        else:
+            frame[0].append(value)
+
+    def _close_container(self, char, new_cards):
+        self._end_bare()
+        container, _ = self._stack.pop()
+        if isinstance(container, dict) != (char == '}'):
+            self._error(self._at, f"mismatched {char!r}")
+
+        if isinstance(container, dict):
+            card = self._as_card(container)
+            if card is not None:
+                self.cards.append(card)
+                new_cards.append(card)
+                # Cards are handed out as they complete, no need to keep them in the tree
+                container = None
+
+        if self._stack and container is not None:
+            self._add_value(container)
+
+    @staticmethod
+    def _as_card(obj):
+        keys = {key.lower(): key for key in obj if isinstance(key, str)}
+        if 'front' not in keys or 'back' not in keys:
+            return None
+        card = {key: value for key, value in obj.items() if key not in (keys['front'], keys['back'])}
+        card['front'] = str(obj[keys['front']])
+        card['back'] = str(obj[keys['back']])
+        return card
+
+    def _in_table_row(self):
+        return ''.join(self._line).lstrip().startswith('|')
+
+    def _end_line(self):
+        line = ''.join(self._line).strip()
+        self._line = []
+        if not line.startswith('|'):
+            return
+        cells = [cell.strip() for cell in line.strip('|').split('|')]
+        if len(cells) < 2 or not cells[0] or set(cells[0]) <= set('-: '):
+            return
+        if cells[0].lower().startswith('statement'):
+            return
+        self._table_cards.append({'front': cells[0], 'back': cells[1]})
+
+    def _error(self, position, message):
+        self.errors.append(ParseError(position, message))
+
+    def close(self):
+        """Finishes the parse and returns the cards recovered from a truncated or table-only response."""
+        recovered = []
+        if self._in_string and self._pending is not None:
+            self._pending = None
+            self._comma = False
+            self._end_string(recovered)
+
+        if self._stack:
+            self.truncated = True
+            self._error(self._pos, "response ended inside an unfinished object")
+            if self._in_string:
+                value = ''.join(self._buf)
+                self._buf = []
+                self._in_string = False
+                frame = self._stack[-1]
+                if isinstance(frame[0], dict) and frame[1] is not None:
+                    self._add_value(value)
+            self._end_bare()
+            # Only the innermost object can hold a partly written card
+            for container, _ in reversed(self._stack):
+                if isinstance(container, dict):
+                    card = self._as_card(container)
+                    if card is not None and card['back']:
+                        recovered.append(card)
+                    break
+            self._stack = []
+        else:
+            self._end_line()
+
+        if not self.cards and not recovered and self._table_cards:
+            recovered.extend(self._table_cards)
+
+        self.cards.extend(recovered)
+        if not self.cards:
+            self._error(self._pos, "no flashcards found in response")
+        return recovered
+
+    def result(self):
+        return ParseResult(self.cards, self.errors, self.truncated)
+
+
+def parse_flashcards(text):
+    parser = FlashcardParser()
+    parser.feed(text)
+    parser.close()
+    return parser.result()
+
+
+def parse_title_pages(text):
+    """Page numbers listed in "title_pages" by the answer to a packed request."""
+    match = _TITLE_PAGES.search(text or "")
+    return {int(n) for n in re.findall(r"\d+", match.group(1))} if match else set()
@@ -0,0 +1,165 @@
+# session_store.py
+# -*- coding: utf-8 -*-
+import streamlit as st
+from metrics import metrics
+
+
+class Card:
+    __slots__ = ("front", "back", "tags", "active", "extra")
+
+    def __init__(self, front, back, tags="", active=True, extra=None):
+        self.front = front
+        self.back = back
+        self.tags = tags
+        self.active = active
+        # Keys the model returned besides front and back, e.g. "page" for packed requests
+        self.extra = extra
+
+    @classmethod
+    def from_dict(cls, card):
+        extra = {key: value for key, value in card.items() if key not in ("front", "back")}
+        return cls(card["front"], card["back"], extra=extra or None)
+
+
+class Page:
+    __slots__ = ("index", "text", "cards", "is_title", "errors", "skipped", "failed", "version")
+
+    def __init__(self, index):
+        self.index = index
+        self.text = None
+        self.cards = None
+        self.is_title = False
+        self.errors = None
+        # Why the page was triaged locally instead of being sent to the model
+        self.skipped = None
+        # Why the last request for the page failed; such a page is not generated and can be retried
+        self.failed = None
+        # Bumped whenever the cards are replaced, so widgets of the old cards are not reused
+        self.version = 0
+
+    @property
+    def generated(self):
+        return self.cards is not None or self.is_title or self.skipped is not None
+
+    def widget_key(self, kind, index):
+        return f"fc_{kind}_{self.index}_{index}_{self.version}"
+
+
+class Document:
+    """
+    Pages and cards of one uploaded PDF.
+
+    Keeps a set of the active cards up to date on every change, so asking whether
+    anything can be exported does not walk the cards, and replacing the document
+    drops all of its state at once.
+    """
+    __slots__ = ("name", "pages", "calls_avoided", "_active")
+
+    def __init__(self, name=None):
+        self.name = name
+        self.pages = {}
+        # Model calls saved by page triage, per reason
+        self.calls_avoided = {}
+        self._active = set()
+
+    def page(self, index):
+        page = self.pages.get(index)
+        if page is None:
+            page = self.pages[index] = Page(index)
+        return page
+
+    def get(self, index):
+        return self.pages.get(index)
+
+    def set_cards(self, index, cards, errors=None):
+        """Replaces the cards of a page with the parsed card dicts (None when there are none)."""
+        page = self.page(index)
+        self._drop_active(page)
+        page.cards = [Card.from_dict(card) for card in cards] if cards else None
+        page.is_title = False
+        page.skipped = None
+        page.failed = None
+        page.errors = errors or None
+        page.version += 1
+        for j in range(len(page.cards or ())):
+            self._active.add((index, j))
+        metrics.observe("cards_per_page", len(page.cards or ()))
+
+    def mark_title(self, index):
+        page = self.page(index)
+        self._drop_active(page)
+        page.cards = None
+        page.is_title = True
+        page.failed = None
+        page.version += 1
+
+    def fail_page(self, index, error):
+        page = self.page(index)
+        self._drop_active(page)
+        page.cards = None
+        page.is_title = False
+        page.skipped = None
+        page.failed = error
+        page.version += 1
+
+    def skip_page(self, index, reason, description):
+        page = self.page(index)
+        self._drop_active(page)
+        page.cards = None
+        page.skipped = description
+        page.failed = None
+        page.version += 1
+        self.calls_avoided[reason] = self.calls_avoided.get(reason, 0) + 1
+        metrics.count("calls_avoided", reason=reason)
+
+    def reset_page(self, index):
+        page = self.page(index)
+        self._drop_active(page)
+        page.cards = None
+        page.is_title = False
+        page.errors = None
+        page.skipped = None
+        page.failed = None
+        page.version += 1
+
+    def set_active(self, index, card_index, active):
+        self.pages[index].cards[card_index].active = active
+        if active:
+            self._active.add((index, card_index))
+        else:
+            self._active.discard((index, card_index))
+
+    def has_active_cards(self):
+        return bool(self._active)
+
+    def active_cards(self, index, limit=None):
+        page = self.pages.get(index)
+        if page is None or page.is_title or not page.cards:
+            return []
+        cards = page.cards if limit is None else page.cards[:limit]
+        return [(j, card) for j, card in enumerate(cards) if card.active]
+
+    def clear_cards(self):
+        for page in self.pages.values():
+            page.cards = None
+            page.is_title = False
+            page.errors = None
+            page.skipped = None
+            page.failed = None
+            page.version += 1
+        self._active.clear()
+
+    def _drop_active(self, page):
+        for j in range(len(page.cards or ())):
+            self._active.discard((page.index, j))
+
+
+def get_document():
+    if "document" not in st.session_state:
+        st.session_state["document"] = Document()
+    return st.session_state["document"]
+
+
+def new_document(name):
+    st.session_state["document"] = Document(name)
+    return st.session_state["document"]